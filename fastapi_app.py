@@ -1,17 +1,31 @@
-from fastapi import FastAPI, HTTPException
+from typing import Dict, List, Optional
+from fastapi import FastAPI, HTTPException, Query
+from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.responses import StreamingResponse
 import pandas as pd
 import os
+import sys
 import io
+import asyncio
 from src.logging.logger import get_logger
 from src.exceptions.exception import CustomException
 import matplotlib.pyplot as plt
 
 from src.constants.paths import dataset_path
 
-from src.backend_api.fastapi_helper import report_missing_values, get_dataset_info, get_complaint_report
+from src.utils.ingesation_helper import write_summary_snapshot, load_summary_snapshot, snapshot_kpis
+from src.backend_api.fastapi_helper import (report_missing_values, get_dataset_info, get_complaint_report,
+                                            get_daily_complaint_counts, get_complaints_page,
+                                            get_latest_forecast_window, get_group_outliers)
+from src.entities.component_config_entity import ModelPredictionConfig, ModelRegistryConfig
+from src.models.predictor import MicroBatchPredictor
+from src.models.registry import ModelRegistry, ServingModel
+from src.data_access.feature_store import FeatureStore
+from src.monitoring.model_drift import ModelDriftMonitor
+from src.integrations.database_integration import (get_complaints_db, get_connection_pool, run_db,
+                                                   close_connections)
     
 
 logger = get_logger(__name__)
@@ -37,6 +51,34 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+# -----------------------------------------------------------------------------
+# Database session: queries of one request share a pooled connection
+# -----------------------------------------------------------------------------
+@app.middleware("http")
+async def database_session(request, call_next):
+    with get_connection_pool().session():
+        return await call_next(request)
+
+# -----------------------------------------------------------------------------
+# Forecast serving (active registry version, hot-swapped on change)
+# -----------------------------------------------------------------------------
+prediction_config = ModelPredictionConfig()
+serving_model = ServingModel(ModelRegistry(ModelRegistryConfig()))
+forecast_batcher: Optional[MicroBatchPredictor] = None
+feature_store = FeatureStore()
+model_drift_monitor = ModelDriftMonitor()
+
+
+class ForecastRequest(BaseModel):
+    history: Optional[List[List[float]]] = None
+
+
+class ObservationRequest(BaseModel):
+    date: str
+    actual: Dict[str, float]
+    predicted: Dict[str, float]
+
 # -----------------------------------------------------------------------------
 # Startup
 # -----------------------------------------------------------------------------
@@ -49,12 +91,15 @@ async def startup_event():
     if os.path.exists(dataset_path):
         logger.info("Dataset found | path=%s", dataset_path)
         try:
-            df = pd.read_excel(dataset_path)
+            # Warm the relational store, then derive the snapshot from its rows
+            db = await run_db(get_complaints_db, dataset_path)
             logger.info(
                 "Dataset loaded successfully | rows=%s cols=%s",
-                df.shape[0],
-                df.shape[1],
+                db.meta.get("rows"),
+                len(db.columns),
             )
+            df = await run_db(db.read_frame, ["DATE", "CLOSED/OPEN"])
+            await run_db(write_summary_snapshot, dataset_path, df=df)
         except Exception as e:
             logger.exception(
                 "Failed to read dataset during startup"
@@ -63,8 +108,44 @@ async def startup_event():
     else:
         logger.warning("Dataset not found | path=%s", dataset_path)
 
+    await start_forecast_service()
+
     logger.info("=" * 60)
 
+
+async def start_forecast_service():
+    global forecast_batcher
+
+    try:
+        # Load and warm the active version off the event loop; the watcher
+        # swaps in later versions (or the first one) without a restart
+        version = await asyncio.get_running_loop().run_in_executor(None, serving_model.load_active)
+        serving_model.start_watching()
+
+        forecast_batcher = MicroBatchPredictor(
+            serving_model.predict,
+            max_batch_size=prediction_config.max_batch_size,
+            max_wait_ms=prediction_config.max_wait_ms,
+        )
+        await forecast_batcher.start()
+        logger.info(
+            "Forecast service ready | version=%s max_batch_size=%s max_wait_ms=%s",
+            version,
+            prediction_config.max_batch_size,
+            prediction_config.max_wait_ms,
+        )
+    except Exception:
+        forecast_batcher = None
+        logger.exception("Failed to start forecast service")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if forecast_batcher is not None:
+        await forecast_batcher.stop()
+    serving_model.stop()
+    close_connections()
+
 # -----------------------------------------------------------------------------
 # Routes
 # -----------------------------------------------------------------------------
@@ -77,6 +158,13 @@ def read_root():
         "endpoints": {
             "healthcheck": "/healthcheck",
             "report": "/report_missing_values",
+            "daily_counts": "/daily_complaint_counts",
+            "complaints": "/complaints",
+            "summary": "/summary_snapshot",
+            "forecast": "/forecast",
+            "models": "/models",
+            "model_drift": "/monitoring/model_drift",
+            "database_health": "/database/health",
             "docs": "/docs",
         },
     }
@@ -93,6 +181,19 @@ def get_healthcheck():
     }
 
 
+@app.get("/database/health")
+async def get_database_health():
+    """
+    Ping through the shared connection pool, with pool usage counters.
+    """
+    try:
+        return await run_db(get_connection_pool().health)
+
+    except Exception as e:
+        logger.exception("Database health check failed")
+        raise HTTPException(status_code=503, detail=f"Database unavailable: {e}")
+
+
 @app.get("/report_missing_values")
 def get_report_missing_values():
     try:
@@ -144,6 +245,239 @@ def get_complaint_counts_endpoint():
             message="Error while fetching complaint counts",
             error_details=str(e)
         )
+
+
+@app.get("/daily_complaint_counts")
+def get_daily_complaint_counts_endpoint(
+    start: Optional[str] = Query(None, description="Start date (YYYY-MM-DD), inclusive"),
+    end: Optional[str] = Query(None, description="End date (YYYY-MM-DD), inclusive"),
+    max_points: Optional[int] = Query(None, ge=3, description="Downsample with LTTB to this many points"),
+):
+    """
+    Range query over the daily complaints series. Full resolution unless
+    ``max_points`` is set; used by the dashboard when zooming into the trend.
+    """
+    try:
+        return get_daily_complaint_counts(
+            dataset_path=dataset_path,
+            start=start,
+            end=end,
+            max_points=max_points,
+        )
+
+    except FileNotFoundError:
+        logger.warning("Dataset missing | path=%s", dataset_path)
+        raise HTTPException(status_code=404, detail="Dataset file not found")
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except Exception as e:
+        logger.exception("Unhandled error while fetching daily complaint counts")
+        raise CustomException(e, sys)
+
+
+@app.get("/complaints")
+def get_complaints_page_endpoint(
+    offset: int = Query(0, ge=0, description="First row of the window"),
+    limit: int = Query(100, ge=1, le=1000, description="Rows per window"),
+    sort_by: Optional[str] = Query(None, description="Column to sort by"),
+    ascending: bool = Query(True),
+    search: Optional[str] = Query(None, description="Substring matched against complaint/consumer number and name"),
+):
+    """
+    Server-side paging over complaint rows; returns only the requested window.
+    """
+    try:
+        return get_complaints_page(
+            dataset_path=dataset_path,
+            offset=offset,
+            limit=limit,
+            sort_by=sort_by,
+            ascending=ascending,
+            search=search,
+        )
+
+    except FileNotFoundError:
+        logger.warning("Dataset missing | path=%s", dataset_path)
+        raise HTTPException(status_code=404, detail="Dataset file not found")
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except Exception as e:
+        logger.exception("Unhandled error while paging complaints")
+        raise CustomException(e, sys)
+
+
+@app.get("/complaint_outliers")
+def get_complaint_outliers_endpoint(
+    dimension: Optional[str] = Query(None, description="CIRCLE, DIVISION or COMPLAINT TYPE; all when omitted"),
+    start: Optional[str] = Query(None, description="Start date (YYYY-MM-DD), inclusive"),
+    end: Optional[str] = Query(None, description="End date (YYYY-MM-DD), inclusive"),
+    limit: int = Query(200, ge=1, le=5000, description="Flagged group-days to return, most recent first"),
+):
+    """
+    Daily complaint spikes per circle, division and complaint type: group-days
+    above the group's ``Q3 + k * IQR`` fence.
+    """
+    try:
+        return get_group_outliers(
+            dataset_path=dataset_path,
+            dimension=dimension,
+            start=start,
+            end=end,
+            limit=limit,
+        )
+
+    except FileNotFoundError:
+        logger.warning("Dataset missing | path=%s", dataset_path)
+        raise HTTPException(status_code=404, detail="Dataset file not found")
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except Exception as e:
+        logger.exception("Unhandled error while computing complaint outliers")
+        raise CustomException(e, sys)
+
+
+@app.get("/summary_snapshot")
+def get_summary_snapshot_endpoint():
+    """
+    Overview KPIs from the persisted summary snapshot (rebuilt if stale).
+    """
+    try:
+        snapshot = load_summary_snapshot(dataset_path)
+        if snapshot is None:
+            raise HTTPException(status_code=404, detail="Dataset file not found")
+
+        return {
+            "kpis": snapshot_kpis(snapshot),
+            "last_date": snapshot["last_date"],
+            "computed_at": snapshot["computed_at"],
+        }
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        logger.exception("Unhandled error while reading summary snapshot")
+        raise CustomException(e, sys)
+
+
+@app.post("/forecast")
+async def post_forecast(request: ForecastRequest = None):
+    """
+    Next-day complaint counts (TOTAL and per complaint type).
+
+    ``history`` is ``seq_length`` rows of daily counts in the model's series
+    order; when omitted the most recent days of the dataset are used.
+    Concurrent requests are served by one batched model call.
+    """
+    try:
+        if forecast_batcher is None or not forecast_batcher.running or not serving_model.ready:
+            raise HTTPException(status_code=503, detail="Forecast model not available")
+
+        version, predictor = serving_model.version, serving_model.predictor
+
+        if request is not None and request.history is not None:
+            target_date = None
+            window = predictor.validate_window(request.history)
+        else:
+            # File reads; keep them off the event loop serving the batch
+            target_date, window = await asyncio.to_thread(
+                get_latest_forecast_window, dataset_path, predictor, store=feature_store,
+            )
+
+        # Batched only with windows for the same model, so the version and
+        # series labels below are those of the model that served the request
+        forecast = await forecast_batcher.predict(window, predictor.predict)
+
+        return {
+            "model_version": version,
+            "target_date": target_date.strftime("%Y-%m-%d") if target_date is not None else None,
+            "forecast": dict(zip(predictor.columns, map(float, forecast))),
+        }
+
+    except HTTPException:
+        raise
+
+    except FileNotFoundError:
+        logger.warning("Dataset missing | path=%s", dataset_path)
+        raise HTTPException(status_code=404, detail="Dataset file not found")
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except Exception as e:
+        logger.exception("Unhandled error while forecasting")
+        raise CustomException(e, sys)
+
+
+@app.get("/forecast/stats")
+def get_forecast_stats():
+    if forecast_batcher is None:
+        raise HTTPException(status_code=503, detail="Forecast model not available")
+    return forecast_batcher.stats()
+
+
+@app.get("/models")
+def get_models():
+    """Registered versions and what this process is serving."""
+    return {
+        **serving_model.status(),
+        "versions": serving_model.registry.list_versions(),
+    }
+
+
+@app.post("/models/{version}/activate")
+def activate_model(version: str):
+    """
+    Make ``version`` active and hot-swap it in once it is loaded and warmed.
+    Requests keep being served by the current version meanwhile.
+    """
+    try:
+        serving_model.registry.activate(version)
+        serving_model.preload(version)
+        return {"active_version": version, "serving_version": serving_model.version}
+
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=e.args[0])
+
+    except Exception as e:
+        logger.exception("Unhandled error while activating model version")
+        raise CustomException(e, sys)
+
+
+@app.post("/monitoring/observations")
+def post_observation(observation: ObservationRequest):
+    """
+    Record one day's actual vs predicted counts for the served model.
+    Days already recorded are ignored.
+    """
+    try:
+        added = model_drift_monitor.update(
+            observation.date,
+            observation.actual,
+            observation.predicted,
+            model_version=serving_model.version,
+        )
+        return {"added": added, "retrain_required": model_drift_monitor.retrain_required}
+
+    except CustomException as e:
+        if isinstance(e.__cause__, ValueError):
+            raise HTTPException(status_code=400, detail=str(e.__cause__))
+        logger.exception("Unhandled error while recording observation")
+        raise
+
+
+@app.get("/monitoring/model_drift")
+def get_model_drift():
+    """Rolling error statistics and retrain signals of the served model."""
+    return model_drift_monitor.metrics()
+
+
 # -----------------------------------------------------------------------------
 # Local run
 # -----------------------------------------------------------------------------
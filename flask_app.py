@@ -1,6 +1,8 @@
+import os
+
 import pandas as pd
 import numpy as np
-from flask import Flask, jsonify, request
+from flask import Flask, g, jsonify, request
 
 from src.logging.logger import get_logger
 from src.exceptions.exception import CustomException
@@ -17,6 +19,7 @@ logger = get_logger(__name__)
 try:
     from src.constants.paths import dataset_path
     from src.backend_api.flask_helper import get_complaint_report,apply_pivot_examples, all_data_generate_report
+    from src.integrations.database_integration import get_connection_pool
     CUSTOM_IMPORTS = True
     logger.info("Custom Flask modules loaded successfully")
 except ImportError as e:
@@ -32,6 +35,51 @@ except ImportError as e:
 # -----------------------------------------------------------------------------
 app = Flask(__name__)
 
+
+# -----------------------------------------------------------------------------
+# Database session: queries of one request share a pooled connection
+# -----------------------------------------------------------------------------
+@app.before_request
+def open_database_session():
+    if CUSTOM_IMPORTS:
+        g.database_session = get_connection_pool().session()
+        g.database_session.__enter__()
+
+
+@app.teardown_request
+def close_database_session(exc):
+    session = g.pop("database_session", None)
+    if session is not None:
+        session.__exit__(None, None, None)
+
+
+# -----------------------------------------------------------------------------
+# Dataset: every request is served from the one shared store of ``dataset_path``
+# -----------------------------------------------------------------------------
+def requested_dataset_path():
+    """
+    ``?dataset_path=`` if it names the served dataset, else ``None``. Other
+    paths are refused: loading them would replace the rows of every client.
+    """
+    data_path = request.args.get("dataset_path", dataset_path)
+    if os.path.abspath(data_path) != os.path.abspath(dataset_path):
+        logger.warning("Rejected dataset path | path=%s", data_path)
+        return None
+    return dataset_path
+
+
+def unsupported_dataset_path():
+    return (
+        jsonify(
+            {
+                "error": "Only the served dataset is available",
+                "path": request.args.get("dataset_path"),
+            }
+        ),
+        400,
+    )
+
+
 # -----------------------------------------------------------------------------
 # Routes
 # -----------------------------------------------------------------------------
@@ -44,19 +92,38 @@ def home():
             "version": "1.0.0",
             "endpoints": {
                 "complaint_report": "/complaint_report",
+                "database_health": "/database/health",
             },
             "custom_modules_loaded": CUSTOM_IMPORTS,
         }
     )
 
 
+@app.route("/database/health", methods=["GET"])
+def database_health():
+    """
+    Ping through the shared connection pool, with pool usage counters.
+    """
+    if not CUSTOM_IMPORTS:
+        return jsonify({"healthy": False, "error": "Database modules not loaded"}), 503
+
+    try:
+        return jsonify(get_connection_pool().health())
+
+    except Exception as e:
+        logger.exception("Database health check failed")
+        return jsonify({"healthy": False, "error": str(e)}), 503
+
+
 @app.route("/complaint_report", methods=["GET"])
 def complaint_report():
     """
     Endpoint to return complaint pivot report.
     """
     try:
-        data_path = request.args.get("dataset_path", dataset_path)
+        data_path = requested_dataset_path()
+        if data_path is None:
+            return unsupported_dataset_path()
         logger.info("Generating complaint report | path=%s", data_path)
 
         report = get_complaint_report(data_path)
@@ -86,7 +153,9 @@ def apply_pivot_data():
     Endpoint to return complaint pivot report.
     """
     try:
-        data_path = request.args.get("dataset_path", dataset_path)
+        data_path = requested_dataset_path()
+        if data_path is None:
+            return unsupported_dataset_path()
         logger.info("Generating complaint report | path=%s", data_path)
 
         report = apply_pivot_examples(data_path)  # Call a different function
@@ -117,7 +186,9 @@ def all_data_report():
     Endpoint to return complaint pivot report.
     """
     try:
-        data_path = request.args.get("dataset_path", dataset_path)
+        data_path = requested_dataset_path()
+        if data_path is None:
+            return unsupported_dataset_path()
         logger.info("Generating complaint report | path=%s", data_path)
 
         report = all_data_generate_report(data_path)  # Call a different function
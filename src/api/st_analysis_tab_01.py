@@ -1,61 +1,73 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from src.logging.logger import get_logger
 from src.exceptions.exception import CustomException
 from src.api.url_api import fastapi_api_request_url, flask_api_request_url
 from src.visualization.st_plt import plot_complaint_pie_chart, visualize_report
 from src.api.st_analysis_tab_helper import complaint_report_dashboard
 from src.constants.paths import dataset_path
+from src.utils.ingesation_helper import load_summary_snapshot, snapshot_kpis
 
 logger = get_logger(__name__)
 
 
 def display_complaint_information():
+    """
+    Render the complaint overview progressively.
+
+    The KPI row comes from the persisted summary snapshot and is drawn
+    immediately. The backend API calls start in the background at the same
+    time, and each heavier panel fills in as its data arrives.
+    """
     st.subheader("📊 Complaint Information")
     
     try:
-        with st.spinner("🔄 Fetching complaint data from FastAPI..."):
-            # Fetch data from FastAPI
-            response = fastapi_api_request_url("/read_complaint_counts", timeout=30)
-            responce_01 = flask_api_request_url("/all_data_report", timeout=30)
-            
-            col1, col2, col3, col4, col5, col6 = st.columns(6)
+        # ===============================
+        # KPI row from the summary snapshot
+        # ===============================
+        snapshot = load_summary_snapshot(dataset_path)
+        if snapshot is None:
+            st.warning("⚠️ Summary snapshot unavailable: dataset not found.")
+        else:
+            kpis = snapshot_kpis(snapshot)
 
-            df = pd.read_excel(dataset_path)
-            total_rows, total_columns = df.shape
-            status_counts = df['CLOSED/OPEN'].value_counts()
-            closed_complaints = status_counts.get('Closed', 0)
-            open_complaints = status_counts.get('Open', 0)
-            ninety_days_ago = pd.Timestamp.now() - pd.Timedelta(days=90)    
-            df['90_DAY_OPEN_COMPLAINTS'] = ( (df['DATE'] >= ninety_days_ago) & (df['CLOSED/OPEN'] == 'Open') )
-            ninety_day_open_count = df['90_DAY_OPEN_COMPLAINTS'].sum()
-            thrty_days_ago = pd.Timestamp.now() - pd.Timedelta(days=30)
-            df['30_DAY_OPEN_COMPLAINTS'] = ( (df['DATE'] >= thrty_days_ago) & (df['CLOSED/OPEN'] == 'Open') )
-            thrty_days_ago = df['30_DAY_OPEN_COMPLAINTS'].sum()
-            df['DATE'] = pd.to_datetime(df['DATE'])
-            last_date = df['DATE'].max()
-            last_day_rows = df[df['DATE'] == last_date]
-            counts = last_day_rows['DATE'].value_counts()
-            total_count = counts.sum()
+            col1, col2, col3, col4, col5, col6 = st.columns(6)
 
             with col1:
-                st.metric(label="Total Complaints", value=total_rows)
+                st.metric(label="Total Complaints", value=kpis["total_complaints"])
                
             with col2:
-                st.metric(label="Open Complaints", value=open_complaints)
+                st.metric(label="Open Complaints", value=kpis["open_complaints"])
 
             with col3:
-                st.metric(label="Closed Complaints", value=closed_complaints)
+                st.metric(label="Closed Complaints", value=kpis["closed_complaints"])
             with col4:
-                st.metric(label="90 Day Open Complaints", value=ninety_day_open_count)
+                st.metric(label="90 Day Open Complaints", value=kpis["open_90_days"])
 
             with col5:
-                st.metric(label="30 Day Open Complaints", value=thrty_days_ago) 
+                st.metric(label="30 Day Open Complaints", value=kpis["open_30_days"]) 
 
             with col6:
-                st.metric(label="Last Day Complaints", value=counts)           
-            
+                st.metric(label="Last Day Complaints", value=kpis["last_day_complaints"])
+
+            logger.info("KPI row rendered from snapshot | computed_at=%s", snapshot["computed_at"])
+
+        # Worker threads share this session's context so request warnings still render
+        ctx = get_script_run_ctx()
+        with ThreadPoolExecutor(max_workers=2, initializer=add_script_run_ctx, initargs=(None, ctx)) as pool:
+            # Fetch data from FastAPI / Flask in the background
+            complaint_counts_future = pool.submit(fastapi_api_request_url, "/read_complaint_counts", 30)
+            all_data_report_future = pool.submit(flask_api_request_url, "/all_data_report", 30)
+
+            # ===============================
+            # Complaint type report (FastAPI)
+            # ===============================
+            with st.spinner("🔄 Fetching complaint data from FastAPI..."):
+                response = complaint_counts_future.result()
+
             if response is None:
                 st.error("❌ Backend API is not responding")
                 return
@@ -84,7 +96,8 @@ def display_complaint_information():
             st.divider()
             st.write("## 📊 Data Distributions")
             # Pie chart visualization
-            pie_chart = plot_complaint_pie_chart(dataset_path, column_name='COMPLAINT TYPE')
+            with st.spinner("📊 Building distribution chart..."):
+                pie_chart = plot_complaint_pie_chart(dataset_path, column_name='COMPLAINT TYPE')
             st.plotly_chart(pie_chart, use_container_width=True)
 
             st.divider()
@@ -92,10 +105,17 @@ def display_complaint_information():
             st.divider()
 
             # ===============================
-            # All Data Report
+            # All Data Report (Flask)
             # ===============================
             st.write("## 📊 All Data Report")
 
+            with st.spinner("🔄 Fetching report from Flask..."):
+                responce_01 = all_data_report_future.result()
+
+            if responce_01 is None:
+                st.error("❌ Flask API is not responding")
+                return
+
             all_data_report = pd.DataFrame(responce_01.json())
 
             st.dataframe(
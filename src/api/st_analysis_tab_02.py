@@ -3,6 +3,7 @@ import sys
 import time
 import requests
 import pandas as pd
+from urllib.parse import quote
 from typing import Optional
 import streamlit as st
 import plotly.graph_objects as go
@@ -144,4 +145,122 @@ def display_missing_values_report():
                 st.error(f"❌ Error processing data: {e}")
                 with st.expander("Show error details"):
                     st.code(str(e))
-                    logger.info("Complaint Info loaded")
\ No newline at end of file
+                    logger.info("Complaint Info loaded")
+
+
+def display_complaint_table(page_size_options=(50, 100, 250, 500), height: int = 500):
+    """
+    Display complaint rows through the server-side paging API.
+
+    Only the visible window is fetched from ``/complaints`` and sent to the
+    browser, so memory use stays constant however large the dataset is.
+    Colouring is applied with column config instead of a pandas Styler.
+
+    Args:
+        page_size_options (tuple): Selectable rows-per-page values
+        height (int): Table height in pixels
+
+    Returns:
+        None
+    """
+    st.subheader("📋 Complaint Records")
+
+    # ----------------------------------------------------------------
+    # View controls
+    # ----------------------------------------------------------------
+    col1, col2, col3, col4 = st.columns([3, 2, 1, 1])
+
+    with col1:
+        search = st.text_input(
+            "🔍 Search complaint / consumer number or name",
+            key="complaint_table_search"
+        )
+
+    with col2:
+        sort_by = st.selectbox(
+            "Sort by",
+            ["DATE", "COMPLAINT TYPE", "DEPT", "CIRCLE", "DIVISION", "CLOSED/OPEN", "COMPLAINT NUMBER"],
+            key="complaint_table_sort"
+        )
+
+    with col3:
+        ascending = st.radio(
+            "Order", ["Desc", "Asc"], horizontal=True, key="complaint_table_order"
+        ) == "Asc"
+
+    with col4:
+        page_size = st.selectbox("Rows", page_size_options, index=1, key="complaint_table_page_size")
+
+    page = st.session_state.get("complaint_table_page", 1)
+
+    # ----------------------------------------------------------------
+    # Fetch only the visible window
+    # ----------------------------------------------------------------
+    with st.spinner("🔄 Loading rows..."):
+        response = fastapi_api_request_url(
+            "/complaints?"
+            f"offset={(page - 1) * page_size}&limit={page_size}"
+            f"&sort_by={quote(sort_by)}&ascending={str(ascending).lower()}"
+            + (f"&search={quote(search)}" if search else ""),
+            timeout=30
+        )
+
+    if response is None:
+        return
+
+    window = response.json()
+    total = window.get("total", 0)
+    total_pages = max(1, -(-total // page_size))
+
+    if total == 0:
+        st.info("ℹ️ No complaints match the current filters.")
+        return
+
+    if page > total_pages:
+        # Filters shrank the result; jump to the last page and refetch
+        st.session_state["complaint_table_page"] = total_pages
+        st.rerun()
+
+    df = pd.DataFrame(window["rows"], columns=window["columns"])
+
+    st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True,
+        height=height,
+        column_config={
+            "DATE": st.column_config.DatetimeColumn("DATE", format="YYYY-MM-DD"),
+            "AGE (DAYS)": st.column_config.ProgressColumn(
+                "AGE (DAYS)",
+                format="%d",
+                min_value=0,
+                max_value=max(window.get("max_age_days", 0), 1),
+            ),
+            "COMPLAINT NUMBER": st.column_config.TextColumn("COMPLAINT NUMBER"),
+            "CONSUMER NUMBER": st.column_config.TextColumn("CONSUMER NUMBER"),
+            "MOBILE NUMB": st.column_config.TextColumn("MOBILE NUMB"),
+            "TWEET-LINK": st.column_config.LinkColumn("TWEET-LINK"),
+        }
+    )
+
+    # ----------------------------------------------------------------
+    # Pager
+    # ----------------------------------------------------------------
+    col1, col2 = st.columns([1, 3])
+
+    with col1:
+        st.number_input(
+            "Page",
+            min_value=1,
+            max_value=total_pages,
+            key="complaint_table_page"
+        )
+
+    with col2:
+        first_row = window["offset"] + 1
+        st.caption(
+            f"Rows {first_row:,}–{first_row + len(df) - 1:,} of {total:,} "
+            f"(page {page} of {total_pages:,})"
+        )
+
+    logger.info("Complaint table window rendered | page=%s rows=%s total=%s", page, len(df), total)
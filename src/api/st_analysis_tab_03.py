@@ -3,6 +3,7 @@ import sys
 import time
 import requests
 import pandas as pd
+from urllib.parse import quote
 from typing import Optional
 import streamlit as st
 import plotly.graph_objects as go
@@ -142,4 +143,105 @@ def display_summary_statistics(dataset_path):
         st.error(f"❌ Error loading dataset: {e}")
         with st.expander("Show error details"):
             st.code(str(e))
-        logger.info("Dataset loaded")
\ No newline at end of file
+        logger.info("Dataset loaded")
+
+
+
+def display_group_outliers():
+    """
+    Display daily complaint spikes per circle, division and complaint type.
+
+    Fetches flagged group-days (count above the group's Q3 + k * IQR fence)
+    from the API and shows:
+    - Flagged group-days per dimension
+    - Groups with the most spike days
+    - Timeline of spikes (count vs fence)
+    - Detailed table with CSV download
+    """
+    st.subheader("Daily Complaint Spikes by Group")
+
+    dimension = st.selectbox(
+        "Group by",
+        options=["All", "CIRCLE", "DIVISION", "COMPLAINT TYPE"],
+        key="outlier_dimension",
+    )
+
+    endpoint = "/complaint_outliers?limit=1000"
+    if dimension != "All":
+        endpoint += f"&dimension={quote(dimension)}"
+
+    with st.spinner("🔄 Detecting spikes..."):
+        response = fastapi_api_request_url(endpoint, timeout=60)
+
+    if response is None:
+        return
+
+    try:
+        report = response.json()
+        outliers = pd.DataFrame(report.get("outliers", []))
+
+        by_dimension = report.get("flagged_by_dimension", {})
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Flagged Group-Days", f"{report.get('total_flagged', 0):,}")
+        col2.metric("Circle", f"{by_dimension.get('CIRCLE', 0):,}")
+        col3.metric("Division", f"{by_dimension.get('DIVISION', 0):,}")
+        col4.metric("Complaint Type", f"{by_dimension.get('COMPLAINT TYPE', 0):,}")
+        st.caption(
+            f"A day is flagged when its count is above Q3 + {report.get('multiplier')} × IQR of the group's "
+            f"daily counts and at least {report.get('min_count')} complaints."
+        )
+
+        if outliers.empty:
+            st.success("✅ No daily spikes found.")
+            return
+
+        st.divider()
+
+        import plotly.express as px
+        col1, col2 = st.columns([1, 2])
+
+        with col1:
+            st.write("**Groups with the most spike days:**")
+            st.dataframe(pd.DataFrame(report.get("top_groups", [])), hide_index=True, use_container_width=True)
+
+        with col2:
+            outliers["date"] = pd.to_datetime(outliers["date"])
+            fig = px.scatter(
+                outliers,
+                x="date",
+                y="count",
+                color="dimension",
+                size="excess",
+                hover_data=["group", "upper_fence"],
+                title="Spike Days (count above group fence)",
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
+        st.write("**Flagged group-days:**")
+        st.dataframe(
+            outliers.rename(columns={
+                "dimension": "Dimension",
+                "group": "Group",
+                "date": "Date",
+                "count": "Count",
+                "q1": "Q1",
+                "q3": "Q3",
+                "upper_fence": "Upper Fence",
+                "excess": "Excess",
+            }),
+            hide_index=True,
+            use_container_width=True,
+        )
+
+        st.download_button(
+            label="📥 Download Spikes as CSV",
+            data=outliers.to_csv(index=False),
+            file_name=f"complaint_spikes_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv",
+        )
+        logger.info("Group outliers panel rendered | flagged=%s", report.get("total_flagged", 0))
+
+    except Exception as e:
+        st.error(f"❌ Error processing outliers: {e}")
+        with st.expander("Show error details"):
+            st.code(str(e))
@@ -11,8 +11,10 @@ from src.exceptions.exception import CustomException
 from src.constants.paths import dataset_path
 from plotly.subplots import make_subplots
 from src.api.url_api import fastapi_api_request_url, flask_api_request_url
+from src.visualization.figure_cache import figure_cache
 from src.visualization.st_plt import (create_complaints_visualization, process_complaints_data,create_missing_values_chart,
-                                    complaints_status_stacked_bar,complaints_trend_line,unique_value_bar_chart)
+                                    complaints_status_stacked_bar,complaints_trend_line,unique_value_bar_chart,
+                                    create_daily_trend_chart, iter_visualization_figures)
 
 
 
@@ -27,6 +29,9 @@ def display_visualizations(dataset_path):
     """
     Display comprehensive data visualizations including complaints data, missing values,
     time series trends, and unique values analysis.
+
+    The dataset is loaded once, the figures are built concurrently and each
+    chart is drawn into its placeholder as soon as it is ready.
     
     Args:
         dataset_path (str): Path to the dataset file
@@ -45,55 +50,71 @@ def display_visualizations(dataset_path):
     st.subheader("Visualization")
 
     try:
+        # Placeholders in page order; each is filled as its figure completes
+        placeholders = {}
+
+        placeholders["complaints_pies"] = st.empty()
+        st.divider()
+
+        placeholders["complaints_dashboard"] = st.empty()
+
+        # Full-resolution zoom served by the range-query endpoint
+        zoom_range = st.date_input(
+            "🔎 Zoom daily trend (full resolution)",
+            value=[],
+            key="daily_trend_zoom"
+        )
+        if len(zoom_range) == 2:
+            start, end = zoom_range
+            response = fastapi_api_request_url(
+                f"/daily_complaint_counts?start={start}&end={end}", timeout=30
+            )
+            if response is not None:
+                series = response.json()
+                fig_zoom = create_daily_trend_chart(
+                    series["dates"],
+                    series["counts"],
+                    title=f"Daily Complaints Trend ({start} → {end})"
+                )
+                st.plotly_chart(fig_zoom, use_container_width=True)
+                logger.info("Zoomed daily trend loaded | points=%s", series["total_points"])
+
+        st.divider()
+
+        placeholders["missing_values"] = st.empty()
+        st.divider()
+
+        placeholders["trend_line"] = st.empty()
+        placeholders["status_stacked_bar"] = st.empty()
+        st.divider()
+
+        placeholders["unique_values"] = st.empty()
+
+        for placeholder in placeholders.values():
+            placeholder.info("⏳ Building chart...")
+
+        empty_messages = {
+            "missing_values": "ℹ️ No missing values found in the dataset.",
+            "trend_line": "ℹ️ No time series data found in the dataset.",
+            "status_stacked_bar": "ℹ️ No time series data found in the dataset.",
+            "unique_values": "ℹ️ No unique values found in the dataset.",
+        }
+
         with st.spinner("📊 Loading Visualization..."):
-            # Static visualization
-            fig_01 = process_complaints_data(dataset_path)
-            st.plotly_chart(fig_01, use_container_width=True)
-            logger.info("Static visualization loaded")
-
-            st.divider()
-
-            # Interactive Plotly visualization
-            fig_02 = create_complaints_visualization(dataset_path)
-            st.plotly_chart(fig_02, use_container_width=True)
-            logger.info("Interactive visualization loaded")
-
-            st.divider()
-            
-            # Missing values visualization
-            fig_03 = create_missing_values_chart(dataset_path)
-            if fig_03 is not None:
-                st.plotly_chart(fig_03, use_container_width=True)
-                logger.info("Missing values visualization loaded")
-            else:
-                st.info("ℹ️ No missing values found in the dataset.")
-                logger.info("No missing values to visualize")
-
-            st.divider()
-
-            # Time series visualization
-            fig_04 = complaints_trend_line(dataset_path)
-            fig_05 = complaints_status_stacked_bar(dataset_path)
-            if fig_04 is not None and fig_05 is not None:
-                st.plotly_chart(fig_04, use_container_width=True)
-                st.plotly_chart(fig_05, use_container_width=True)
-                logger.info("Time series visualization loaded")
-            else:
-                st.info("ℹ️ No time series data found in the dataset.")
-                logger.info("No time series data to visualize")
-
-            st.divider()
-
-            # Unique values visualization
-            fig_06 = unique_value_bar_chart(dataset_path)
-            if fig_06 is not None:
-                st.plotly_chart(fig_06, use_container_width=True)
-                logger.info("Unique values visualization loaded")
-            else:
-                st.info("ℹ️ No unique values found in the dataset.")
-                logger.info("No unique values to visualize")
-
-            logger.info("Visualization loaded")
+            for name, fig, error in iter_visualization_figures(dataset_path):
+                placeholder = placeholders[name]
+
+                if error is not None:
+                    logger.error("Visualization failed | name=%s error=%s", name, error)
+                    placeholder.error(f"❌ Error building {name} chart: {error}")
+                elif fig is None:
+                    placeholder.info(empty_messages.get(name, "ℹ️ Nothing to display."))
+                    logger.info("No data to visualize | name=%s", name)
+                else:
+                    placeholder.plotly_chart(fig, use_container_width=True)
+                    logger.info("Visualization loaded | name=%s", name)
+
+            logger.info("Visualization loaded | figure_cache=%s", figure_cache.stats())
 
     except CustomException as ce:
         logger.error("CustomException in Visualization", exc_info=True)
@@ -259,9 +259,17 @@ def complaint_overview_dashboard():
         st.dataframe(
             display_df.head(show_records)[
                 ['complaint_id', 'date', 'consumer_id', 'category', 'priority', 'status', 'assigned_to', 'resolution_days']
-            ].style.background_gradient(subset=['resolution_days'], cmap='RdYlGn_r'),
+            ],
             use_container_width=True,
-            height=400
+            height=400,
+            column_config={
+                "resolution_days": st.column_config.ProgressColumn(
+                    "resolution_days",
+                    format="%d",
+                    min_value=0,
+                    max_value=30
+                )
+            }
         )
         
         # Export options
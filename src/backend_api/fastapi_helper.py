@@ -5,6 +5,7 @@ import logging
 from src.logging.logger import get_logger
 from src.exceptions.exception import CustomException
 from src.constants.paths import dataset_path
+from src.integrations.database_integration import get_complaints_db
 
 
 logger = get_logger(__name__)
@@ -25,20 +26,18 @@ def report_missing_values(dataset_path: str) -> Dict[str, Any]:
     Generate a comprehensive report of missing values in the dataset.
     """
     try:
-        logger.info("Reading dataset | path=%s", dataset_path)
-        df = pd.read_excel(dataset_path)
+        db = get_complaints_db(dataset_path)
+        missing_count = db.null_counts()
 
-        logger.info(
-            "Dataset loaded successfully | rows=%s cols=%s",
-            df.shape[0],
-            df.shape[1],
-        )
-
-        total_rows = len(df)
-        total_columns = df.shape[1]
+        total_rows = db.row_count()
+        total_columns = len(missing_count)
         total_cells = total_rows * total_columns
 
-        missing_count = df.isnull().sum()
+        logger.info(
+            "Missing values counted | rows=%s cols=%s",
+            total_rows,
+            total_columns,
+        )
         missing_percent = (missing_count / total_rows) * 100
 
         report_df = pd.DataFrame(
@@ -153,25 +152,26 @@ import pandas as pd
 
 def get_dataset_info(dataset_path: str) -> dict:
     """
-    Get basic dataset information from an Excel file.
+    Get basic dataset information from the relational store.
     """
     if not os.path.exists(dataset_path):
         logger.warning("Dataset file not found | path=%s", dataset_path)
         raise FileNotFoundError(f"Dataset file not found: {dataset_path}")
 
     try:
-        df = pd.read_excel(dataset_path)
-        
+        db = get_complaints_db(dataset_path)
+        rows, column_names = db.row_count(), list(db.columns)
+
         logger.info(
             "Dataset info retrieved | rows=%s cols=%s",
-            df.shape[0],
-            df.shape[1],
+            rows,
+            len(column_names),
         )
 
         return {
-            "rows": int(df.shape[0]),
-            "columns": int(df.shape[1]),
-            "column_names": df.columns.tolist(),
+            "rows": int(rows),
+            "columns": len(column_names),
+            "column_names": column_names,
         }
     
     except Exception as e:
@@ -183,32 +183,264 @@ def get_dataset_info(dataset_path: str) -> dict:
 
 
 
+import json
+import numpy as np
 import pandas as pd
+from functools import lru_cache
+from typing import Optional
+from src.utils.helper import lttb_downsample
+from src.utils.validation_helper import grouped_daily_outliers
+from src.constants.paths import (FEATURE_STORE_DAILY_FEATURES, OUTLIER_GROUP_COLUMNS,
+                                 OUTLIER_IQR_THRESHOLD, OUTLIER_MIN_DAILY_COUNT)
+
+
+def get_daily_complaint_counts(
+    dataset_path: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    max_points: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Return the daily complaints series between ``start`` and ``end``.
+
+    The range is a ``GROUP BY`` day over the ``DATE`` index of the
+    relational store. The series is full resolution unless ``max_points``
+    is given, in which case it is downsampled with LTTB.
+    """
+    if not os.path.exists(dataset_path):
+        logger.warning("Dataset file not found | path=%s", dataset_path)
+        raise FileNotFoundError(f"Dataset file not found: {dataset_path}")
+
+    for name, value in (("start", start), ("end", end)):
+        if value is not None:
+            try:
+                pd.Timestamp(value)
+            except ValueError:
+                raise ValueError(f"Invalid {name} date: {value}") from None
+
+    try:
+        db = get_complaints_db(dataset_path)
+        window = db.daily_counts(start, end)
+        min_date, max_date = db.date_range()
+
+        total_points = len(window)
+        if max_points:
+            window = window.iloc[lttb_downsample(window.index.values, window.values, max_points)]
+
+        logger.info(
+            "Daily counts served | start=%s end=%s points=%s/%s",
+            start, end, len(window), total_points,
+        )
+
+        return {
+            "min_date": min_date.strftime("%Y-%m-%d") if min_date is not None else None,
+            "max_date": max_date.strftime("%Y-%m-%d") if max_date is not None else None,
+            "total_points": int(total_points),
+            "returned_points": int(len(window)),
+            "downsampled": len(window) < total_points,
+            "dates": window.index.strftime("%Y-%m-%d").tolist(),
+            "counts": window.astype(int).tolist(),
+        }
+
+    except Exception as e:
+        logger.error(
+            f"Error retrieving daily complaint counts: {str(e)}", exc_info=True)
+        raise CustomException(e, sys) from e
+
+
+# Largest page the paging endpoint will return
+MAX_PAGE_SIZE = 1000
+
+# Columns matched by the table search box
+SEARCH_COLUMNS = ["COMPLAINT NUMBER", "CONSUMER NUMBER", "COMPLAINANT NAME"]
+
+
+@lru_cache(maxsize=2)
+def _load_complaints_table(dataset_path: str, mtime: float) -> pd.DataFrame:
+    """
+    Complaint rows from the relational store, cached per source
+    modification time for the callers that need the whole frame.
+    """
+    return get_complaints_db(dataset_path).read_frame()
+
+
+def get_complaints_page(
+    dataset_path: str,
+    offset: int = 0,
+    limit: int = 100,
+    sort_by: Optional[str] = None,
+    ascending: bool = True,
+    search: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Return one window of complaint rows for the paged table viewer.
+
+    The window is a ``LIMIT/OFFSET`` query (sorted through the column
+    index where there is one), so only ``limit`` rows are read and
+    serialised. ``AGE (DAYS)`` is derived per row for display.
+    """
+    if not os.path.exists(dataset_path):
+        logger.warning("Dataset file not found | path=%s", dataset_path)
+        raise FileNotFoundError(f"Dataset file not found: {dataset_path}")
+
+    db = get_complaints_db(dataset_path)
+
+    if sort_by is not None and sort_by not in db.columns:
+        raise ValueError(f"Unknown sort column: {sort_by}")
+
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    offset = max(0, int(offset))
+
+    try:
+        total, page = db.page(offset, limit, sort_by=sort_by, ascending=ascending,
+                              search=search or None, search_columns=SEARCH_COLUMNS)
+
+        today = pd.Timestamp.now().normalize()
+        page.insert(1, "AGE (DAYS)", (today - page["DATE"]).dt.days)
+        oldest = db.date_range()[0]
+
+        logger.info(
+            "Complaints page served | offset=%s limit=%s rows=%s total=%s",
+            offset, limit, len(page), total,
+        )
+
+        return {
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "columns": page.columns.tolist(),
+            "max_age_days": int((today - oldest).days) if oldest is not None else 0,
+            "rows": json.loads(page.to_json(orient="records", date_format="iso")),
+        }
+
+    except Exception as e:
+        logger.error(
+            f"Error retrieving complaints page: {str(e)}", exc_info=True)
+        raise CustomException(e, sys) from e
+
+
+@lru_cache(maxsize=2)
+def _latest_forecast_window(dataset_path: str, mtime: float, predictor) -> tuple:
+    df = _load_complaints_table(dataset_path, mtime)
+    return predictor.latest_window(df)
+
+
+def get_latest_forecast_window(dataset_path: str, predictor, store=None,
+                               feature_set: str = FEATURE_STORE_DAILY_FEATURES) -> tuple:
+    """
+    Most recent ``seq_length`` days of counts, as the default forecast
+    input. Read from the feature store when it holds the model's series
+    (only those rows are touched); otherwise built from the dataset and
+    cached per file modification time and model.
+
+    Returns
+    -------
+    tuple
+        (target date, float32 array of shape (seq_length, series))
+    """
+    if store is not None:
+        manifest = store.manifest(feature_set)
+        if manifest and set(predictor.columns) <= set(manifest["columns"]):
+            return predictor.latest_window_from_store(store, feature_set)
+
+    if not os.path.exists(dataset_path):
+        logger.warning("Dataset file not found | path=%s", dataset_path)
+        raise FileNotFoundError(f"Dataset file not found: {dataset_path}")
+
+    return _latest_forecast_window(dataset_path, os.path.getmtime(dataset_path), predictor)
+
+
+@lru_cache(maxsize=4)
+def _group_outliers(dataset_path: str, mtime: float, multiplier: float, min_count: int) -> pd.DataFrame:
+    db = get_complaints_db(dataset_path)
+    df = db.read_frame([c for c in ["DATE", *OUTLIER_GROUP_COLUMNS] if c in db.columns])
+    return grouped_daily_outliers(df, OUTLIER_GROUP_COLUMNS, multiplier=multiplier, min_count=min_count)
+
+
+def get_group_outliers(
+    dataset_path: str,
+    dimension: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    limit: int = 200,
+    multiplier: float = OUTLIER_IQR_THRESHOLD,
+    min_count: int = OUTLIER_MIN_DAILY_COUNT,
+) -> Dict[str, Any]:
+    """
+    Group-days whose complaint count is above the group's IQR fence, per
+    circle, division and complaint type. All groups are scored in one
+    vectorised pass and cached per file modification time; requests only
+    filter the flagged rows.
+    """
+    if not os.path.exists(dataset_path):
+        logger.warning("Dataset file not found | path=%s", dataset_path)
+        raise FileNotFoundError(f"Dataset file not found: {dataset_path}")
+
+    if dimension is not None and dimension not in OUTLIER_GROUP_COLUMNS:
+        raise ValueError(f"Unknown dimension: {dimension}. Expected one of {OUTLIER_GROUP_COLUMNS}")
+
+    try:
+        outliers = _group_outliers(dataset_path, os.path.getmtime(dataset_path), float(multiplier), int(min_count))
+
+        mask = np.ones(len(outliers), dtype=bool)
+        if dimension:
+            mask &= (outliers["dimension"] == dimension).to_numpy()
+        if start:
+            mask &= (outliers["date"] >= pd.Timestamp(start)).to_numpy()
+        if end:
+            mask &= (outliers["date"] <= pd.Timestamp(end)).to_numpy()
+        selected = outliers[mask]
+
+        by_dimension = selected.groupby("dimension").size()
+        top_groups = (
+            selected.groupby(["dimension", "group"]).size()
+            .sort_values(ascending=False).head(10)
+        )
+        page = selected.head(max(1, int(limit))).assign(date=lambda d: d["date"].dt.strftime("%Y-%m-%d"))
+
+        logger.info(
+            "Group outliers served | dimension=%s start=%s end=%s flagged=%s",
+            dimension, start, end, len(selected),
+        )
+
+        return {
+            "dimensions": list(OUTLIER_GROUP_COLUMNS),
+            "multiplier": float(multiplier),
+            "min_count": int(min_count),
+            "total_flagged": int(len(selected)),
+            "flagged_by_dimension": {k: int(v) for k, v in by_dimension.items()},
+            "top_groups": [
+                {"dimension": d, "group": g, "flagged_days": int(n)} for (d, g), n in top_groups.items()
+            ],
+            "outliers": json.loads(page.round(3).to_json(orient="records")),
+        }
+
+    except Exception as e:
+        logger.error(
+            f"Error computing group outliers: {str(e)}", exc_info=True)
+        raise CustomException(e, sys) from e
+
 
 def get_complaint_report(datapath, column_name='COMPLAINT TYPE'):
     """
-    Loads a CSV from datapath and returns value counts for a specific column.
+    Returns value counts for a specific column (a GROUP BY in the relational store).
     """
-    # Load the data from the provided path
-    df = pd.read_excel(datapath)
-    
-    # Return the frequency of unique values in the column
-    return df[column_name].value_counts()
+    return get_complaints_db(datapath).value_counts(column_name)
 
 
 
 def apply_pivot_table(dataset_path: str) -> pd.DataFrame:
-    # Load dataset
-    df = pd.read_excel(dataset_path)
+    db = get_complaints_db(dataset_path)
 
     # Ensure required columns exist
     required = ['COMPLAINT TYPE', 'DEPT', 'CLOSED/OPEN']
-    missing = [c for c in required if c not in df.columns]
+    missing = [c for c in required if c not in db.columns]
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
 
-    # Work on a copy and clean text
-    d = df[required].copy()
+    # Counts per combination are aggregated in SQL; cleaning below only
+    # touches the distinct combinations
+    d = db.group_counts(required)
 
     # Normalize strings: strip, lower, then title-case
     def norm(s) -> str:
@@ -254,11 +486,12 @@ def apply_pivot_table(dataset_path: str) -> pd.DataFrame:
     }
     d['CLOSED/OPEN'] = d['CLOSED/OPEN'].map(lambda x: status_map.get(x, x))
 
-    # Build pivot with counts using size (do not set `values`)
+    # Build pivot by summing the pre-aggregated counts
     pivot = d.pivot_table(
         index='COMPLAINT TYPE',
         columns=['DEPT', 'CLOSED/OPEN'],
-        aggfunc='size',
+        values='count',
+        aggfunc='sum',
         fill_value=0
     )
 
@@ -5,6 +5,7 @@ import sys
 
 from src.logging.logger import get_logger
 from src.exceptions.exception import CustomException
+from src.integrations.database_integration import get_complaints_db
 
 logger = get_logger(__name__)
 
@@ -26,16 +27,18 @@ def get_complaint_report(dataset_path: str) -> dict:
         if not os.path.exists(dataset_path):
             return {"error": f"Dataset file not found at {dataset_path}"}
 
-        # Load dataset
-        df = pd.read_excel(dataset_path)
+        # Non-null CLOSED/OPEN per complaint type and department, counted in SQL
+        counts = get_complaints_db(dataset_path).group_counts(
+            ["COMPLAINT TYPE", "DEPT"], count_column="CLOSED/OPEN"
+        )
 
         # Create pivot table
         pivot_df = pd.pivot_table(
-            df,
+            counts[counts["count"] > 0],
             index="COMPLAINT TYPE",   # rows
             columns="DEPT",           # columns
-            values="CLOSED/OPEN",     # values to aggregate
-            aggfunc="count"           # aggregation function
+            values="count",           # values to aggregate
+            aggfunc="sum"             # aggregation function
         ).fillna(0)
 
         # Convert to JSON-friendly dict
@@ -52,17 +55,17 @@ import pandas as pd
 from typing import List, Dict, Optional
 
 def apply_pivot_examples(dataset_path: str) -> pd.DataFrame:
-    # Load dataset
-    df = pd.read_excel(dataset_path)
+    db = get_complaints_db(dataset_path)
 
     # Ensure required columns exist
     required = ['COMPLAINT TYPE', 'DEPT', 'CLOSED/OPEN']
-    missing = [c for c in required if c not in df.columns]
+    missing = [c for c in required if c not in db.columns]
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
 
-    # Work on a copy and clean text
-    d = df[required].copy()
+    # Counts per combination are aggregated in SQL; cleaning below only
+    # touches the distinct combinations
+    d = db.group_counts(required)
 
     # Normalize strings: strip, lower, then title-case
     def norm(s: Optional[str]) -> str:
@@ -107,11 +110,12 @@ def apply_pivot_examples(dataset_path: str) -> pd.DataFrame:
     }
     d['CLOSED/OPEN'] = d['CLOSED/OPEN'].map(lambda x: status_map.get(x, x))
 
-    # Build pivot with counts using size (do not set `values`)
+    # Build pivot by summing the pre-aggregated counts
     pivot = d.pivot_table(
         index='COMPLAINT TYPE',
         columns=['DEPT', 'CLOSED/OPEN'],
-        aggfunc='size',
+        values='count',
+        aggfunc='sum',
         fill_value=0
     )
 
@@ -156,7 +160,7 @@ def all_data_generate_report(dataset_path) -> None:
     Output format:
     Category | Sub-Category | Count
     """
-    df = pd.read_excel(dataset_path)
+    db = get_complaints_db(dataset_path)
     report_blocks = []
 
     def add_counts(category_name, series):
@@ -165,27 +169,27 @@ def all_data_generate_report(dataset_path) -> None:
         temp["Category"] = category_name
         report_blocks.append(temp)
 
-    # Basic value counts
-    add_counts("SHIFT DUTY", df["SHIFT DUTY"].value_counts())
-    add_counts("QUERY/REQUEST/COMPLAINT", df["QUERY/REQUEST/COMPLAINT"].value_counts())
-    add_counts("DIVISION", df["DIVISION"].value_counts())
-    add_counts("CIRCLE", df["CIRCLE"].value_counts())
-    add_counts("DEPT", df["DEPT"].value_counts())
-    add_counts("CLOSED/OPEN", df["CLOSED/OPEN"].value_counts())
+    # Basic value counts (each a GROUP BY in the relational store)
+    add_counts("SHIFT DUTY", db.value_counts("SHIFT DUTY"))
+    add_counts("QUERY/REQUEST/COMPLAINT", db.value_counts("QUERY/REQUEST/COMPLAINT"))
+    add_counts("DIVISION", db.value_counts("DIVISION"))
+    add_counts("CIRCLE", db.value_counts("CIRCLE"))
+    add_counts("DEPT", db.value_counts("DEPT"))
+    add_counts("CLOSED/OPEN", db.value_counts("CLOSED/OPEN"))
 
     add_counts(
         "TWEET-LINK SUMMARY",
         pd.Series({
-            "Total": df["TWEET-LINK"].count(),
-            "DM": df.loc[df["TWEET-LINK"] == "DM", "TWEET-LINK"].count(),
-            "Non-DM": df.loc[df["TWEET-LINK"] != "DM", "TWEET-LINK"].count()
+            "Total": db.count_where("TWEET-LINK"),
+            "DM": db.count_where("TWEET-LINK", "DM"),
+            "Non-DM": db.count_where("TWEET-LINK", "DM", negate=True)
         })
     )
 
-    # Filtered counts
-    add_counts("SECTION", df["SECTION"].value_counts()[lambda x: x >= 10])
-    add_counts("SUB-DIVISION", df["SUB-DIVISION"].value_counts()[lambda x: x >= 5])
-    add_counts("COMPLAINANT NAME", df["COMPLAINANT NAME"].value_counts()[lambda x: x >= 20])
+    # Filtered counts (HAVING pushed down)
+    add_counts("SECTION", db.value_counts("SECTION", min_count=10))
+    add_counts("SUB-DIVISION", db.value_counts("SUB-DIVISION", min_count=5))
+    add_counts("COMPLAINANT NAME", db.value_counts("COMPLAINANT NAME", min_count=20))
 
     # Totals
     totals = pd.DataFrame({
@@ -196,9 +200,9 @@ def all_data_generate_report(dataset_path) -> None:
         ],
         "Sub-Category": ["Total", "Total", "Total"],
         "Count": [
-            df["COMPLAINT NUMBER"].count(),
-            df["CONSUMER NUMBER"].count(),
-            df["MOBILE NUMB"].count()
+            db.count_where("COMPLAINT NUMBER"),
+            db.count_where("CONSUMER NUMBER"),
+            db.count_where("MOBILE NUMB")
         ]
     })
 
@@ -15,7 +15,9 @@ from src.constants.paths import dataset_path
 from plotly.subplots import make_subplots
 from src.api.url_api import fastapi_api_request_url, flask_api_request_url
 from src.api.st_analysis_tab_01 import display_complaint_information
-from src.api.st_analysis_tab_02 import display_missing_values_report
+from src.api.st_analysis_tab_02 import display_missing_values_report, display_complaint_table
+from src.api.st_analysis_tab_03 import display_group_outliers
+from src.api.st_analysis_tab_05 import display_visualizations
 from src.api.st_helper import complaint_overview_dashboard
 
 logger = get_logger(__name__)
@@ -83,17 +85,14 @@ def analysis_dashboard(
         # ----------------------------------------------
         with tab2:
             #display_missing_values_report()
-            # under development
-            st.warning("🚧 This Project is under development.")
+            display_complaint_table()
 
 
         # ----------------------------------------------
         # TAB 3: SUMMARY
         # ----------------------------------------------
         with tab3:
-            st.subheader("Summary")
-            # under development
-            st.warning("🚧 This Project is under development.")
+            display_group_outliers()
 
 
         # ----------------------------------------------
@@ -108,9 +107,7 @@ def analysis_dashboard(
         # TAB 5: VISUALIZATIONS
         # ----------------------------------------------
         with tab5:
-            st.subheader("Data Visualizations")
-            # under development
-            st.warning("🚧 This Project is under development.")
+            display_visualizations(dataset_path)
 
 
         # ----------------------------------------------
@@ -0,0 +1,295 @@
+import os
+import sys
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.entities.component_config_entity import CloudStorageConfig
+from src.utils.helper import file_sha256
+
+logger = get_logger(__name__)
+
+MISSING_OBJECT_CODES = ("404", "NoSuchKey", "NotFound")
+
+
+def _summary(results: List[dict], seconds: float) -> dict:
+    transferred = sum(r["bytes"] for r in results if r["transferred"])
+    return {
+        "files": len(results),
+        "transferred": sum(r["transferred"] for r in results),
+        "skipped": sum(not r["transferred"] for r in results),
+        "bytes": sum(r["bytes"] for r in results),
+        "transferred_bytes": transferred,
+        "seconds": round(seconds, 3),
+        "mb_per_second": round(transferred / 2 ** 20 / seconds, 2) if seconds > 0 else None,
+    }
+
+
+class S3Storage:
+    """
+    Artifact storage on S3 or an S3-compatible server (MinIO).
+
+    Every uploaded object carries the SHA-256 of its content in its
+    metadata, so a transfer is skipped when the other side already holds
+    the same bytes (one ``HEAD`` request, no data). Large files go through
+    boto3's managed transfer as parallel multipart uploads / ranged
+    downloads. Downloads are read through a local cache keyed by that
+    hash: a warm restart, or a second copy of the same artifact, is served
+    from disk. Cached files are immutable and written via rename, so
+    concurrent readers never see a partial file.
+    """
+
+    def __init__(self, config: CloudStorageConfig = None, client=None):
+        self.config = config or CloudStorageConfig()
+        self._client = client
+        self.transfer = TransferConfig(
+            multipart_threshold=self.config.multipart_threshold,
+            multipart_chunksize=self.config.chunk_size,
+            max_concurrency=self.config.max_concurrency,
+            use_threads=True,
+        )
+
+    @property
+    def client(self):
+        if self._client is None:
+            cfg = self.config
+            self._client = boto3.client(
+                "s3",
+                endpoint_url=cfg.endpoint_url,
+                region_name=cfg.region_name,
+                # Room for the part threads of several concurrent transfers
+                config=Config(max_pool_connections=max(10, cfg.max_concurrency * 2)),
+            )
+        return self._client
+
+    @property
+    def bucket(self) -> str:
+        if not self.config.bucket:
+            raise ValueError("No artifact bucket configured (set ARTIFACT_BUCKET)")
+        return self.config.bucket
+
+    def key(self, name: str) -> str:
+        name = name.replace(os.sep, "/").strip("/")
+        return f"{self.config.prefix.strip('/')}/{name}" if self.config.prefix else name
+
+    def checksum(self, name: str) -> Optional[str]:
+        """SHA-256 recorded on the object, ``None`` if it is missing or has none."""
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=self.key(name))
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in MISSING_OBJECT_CODES:
+                return None
+            raise
+        return head.get("Metadata", {}).get(self.config.checksum_key)
+
+    def list(self, name: str = "") -> List[dict]:
+        """Objects under ``name`` with their size, relative to the prefix."""
+        try:
+            root = self.key("")
+            prefix = f"{self.key(name)}/" if name.strip("/") else root
+            strip = len(root)
+            paginator = self.client.get_paginator("list_objects_v2")
+            return [
+                {"name": obj["Key"][strip:], "bytes": obj["Size"], "last_modified": obj["LastModified"]}
+                for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix)
+                for obj in page.get("Contents", [])
+            ]
+        except Exception as e:
+            raise CustomException(e, sys) from e
+
+    # ----------------------------------------------------------------
+    # Content-addressed cache
+    # ----------------------------------------------------------------
+    def _cache_path(self, sha: str) -> str:
+        return os.path.join(self.config.cache_dir, sha[:2], sha)
+
+    def cached(self, sha: str) -> Optional[str]:
+        """Cached file for ``sha`` (marked as recently used), if present."""
+        path = self._cache_path(sha)
+        if not os.path.exists(path):
+            return None
+        os.utime(path)
+        return path
+
+    def prune_cache(self, keep: Optional[str] = None) -> int:
+        """
+        Drop least recently used cache files (never ``keep``) until under
+        ``cache_max_bytes``; returns the bytes freed.
+        """
+        entries = []
+        for root, _, files in os.walk(self.config.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                if name.endswith(".part") or path == keep:
+                    continue
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        freed = 0
+        for _, size, path in sorted(entries):
+            if total - freed <= self.config.cache_max_bytes:
+                break
+            os.remove(path)
+            freed += size
+        if freed:
+            logger.info("Artifact cache pruned | freed_bytes=%s", freed)
+        return freed
+
+    def _download_to_cache(self, name: str, sha: Optional[str]) -> str:
+        os.makedirs(self.config.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.config.cache_dir, suffix=".part")
+        os.close(fd)
+        try:
+            self.client.download_file(self.bucket, self.key(name), tmp_path, Config=self.transfer)
+            actual = file_sha256(tmp_path)
+            if sha is not None and actual != sha:
+                raise ValueError(f"Checksum mismatch for {name}: expected {sha}, got {actual}")
+
+            path = self._cache_path(actual)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+            return path
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _fetch(self, name: str, sha: Optional[str]) -> Tuple[str, str, bool]:
+        """Cache path, SHA-256 and whether the object had to be downloaded."""
+        path = self.cached(sha) if sha else None
+        if path is not None:
+            return path, sha, False
+        path = self._download_to_cache(name, sha)
+        self.prune_cache(keep=path)
+        return path, os.path.basename(path), True
+
+    def fetch(self, name: str) -> str:
+        """
+        Local path of an object's content, read through the cache. The
+        file is shared: copy it (or use ``download``) before modifying.
+        """
+        try:
+            return self._fetch(name, self.checksum(name))[0]
+        except Exception as e:
+            raise CustomException(e, sys) from e
+
+    # ----------------------------------------------------------------
+    # Transfers
+    # ----------------------------------------------------------------
+    def upload(self, path: str, name: str) -> dict:
+        """Upload ``path`` as ``name`` unless the object already has the same SHA-256."""
+        try:
+            start = time.perf_counter()
+            sha = file_sha256(path)
+            transferred = self.checksum(name) != sha
+            if transferred:
+                self.client.upload_file(
+                    path, self.bucket, self.key(name),
+                    ExtraArgs={"Metadata": {self.config.checksum_key: sha}},
+                    Config=self.transfer,
+                )
+            return {
+                "name": name,
+                "sha256": sha,
+                "bytes": os.path.getsize(path),
+                "transferred": transferred,
+                "seconds": round(time.perf_counter() - start, 3),
+            }
+        except Exception as e:
+            raise CustomException(e, sys) from e
+
+    def download(self, name: str, path: str) -> dict:
+        """
+        Materialise ``name`` at ``path``: skipped when ``path`` already
+        holds the same bytes, served from the cache when possible.
+        """
+        try:
+            start = time.perf_counter()
+            sha = self.checksum(name)
+            if sha and os.path.exists(path) and file_sha256(path) == sha:
+                transferred, cached = False, False
+            else:
+                source, sha, transferred = self._fetch(name, sha)
+                cached = not transferred
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                tmp_path = f"{path}.tmp"
+                shutil.copyfile(source, tmp_path)
+                os.replace(tmp_path, path)
+
+            return {
+                "name": name,
+                "sha256": sha,
+                "bytes": os.path.getsize(path),
+                "transferred": transferred,
+                "cached": cached,
+                "seconds": round(time.perf_counter() - start, 3),
+            }
+        except Exception as e:
+            raise CustomException(e, sys) from e
+
+    def upload_dir(self, local_dir: str, name: str) -> dict:
+        """
+        Upload every file below ``local_dir`` under ``name``, several files
+        at a time. Hidden entries (staging directories, temporary and lock
+        files) are skipped.
+        """
+        try:
+            start = time.perf_counter()
+            files: Dict[str, str] = {}
+            for root, dirnames, filenames in os.walk(local_dir):
+                dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+                for filename in filenames:
+                    if filename.startswith("."):
+                        continue
+                    path = os.path.join(root, filename)
+                    files[path] = f"{name}/{os.path.relpath(path, local_dir)}"
+
+            with ThreadPoolExecutor(max_workers=self.config.max_concurrency) as pool:
+                results = list(pool.map(lambda item: self.upload(*item), files.items()))
+
+            summary = _summary(results, time.perf_counter() - start)
+            logger.info("Artifacts uploaded | name=%s %s", name, summary)
+            return summary
+
+        except Exception as e:
+            raise CustomException(e, sys) from e
+
+    def download_dir(self, name: str, local_dir: str, last: Tuple[str, ...] = ()) -> dict:
+        """
+        Download every object under ``name`` into ``local_dir``, several
+        files at a time. Objects in ``last`` (paths relative to ``name``,
+        e.g. an index pointing at the others) are only downloaded once
+        everything else is in place.
+        """
+        try:
+            start = time.perf_counter()
+            base = f"{name.strip('/')}/"
+
+            def relative(object_name: str) -> str:
+                return object_name[len(base):] if object_name.startswith(base) else object_name
+
+            def download(object_name: str) -> dict:
+                return self.download(object_name, os.path.join(local_dir, *relative(object_name).split("/")))
+
+            names = [obj["name"] for obj in self.list(name)]
+            deferred = [n for n in names if relative(n) in last]
+            with ThreadPoolExecutor(max_workers=self.config.max_concurrency) as pool:
+                results = list(pool.map(download, [n for n in names if n not in deferred]))
+            results += [download(n) for n in deferred]
+
+            summary = _summary(results, time.perf_counter() - start)
+            summary["cached"] = sum(r["cached"] for r in results)
+            logger.info("Artifacts downloaded | name=%s %s", name, summary)
+            return summary
+
+        except Exception as e:
+            raise CustomException(e, sys) from e
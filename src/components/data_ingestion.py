@@ -0,0 +1,315 @@
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.entities.component_config_entity import DataIngestionConfig, parquet_path
+from src.entities.artifact_entity import DataIngestionArtifact
+from src.data_access.duplicate_detector import DuplicateDetector
+from src.utils.helper import file_sha256, save_json, load_json
+from src.utils.ingesation_helper import (
+    iter_source_chunks,
+    normalise_chunk,
+    source_version,
+    time_split_cutoff,
+    write_summary_snapshot,
+)
+
+logger = get_logger(__name__)
+
+
+class _ChunkWriter:
+    """
+    Appends DataFrame chunks to a CSV and its Parquet twin in one go.
+    """
+
+    def __init__(self, csv_path: str):
+        self.csv_path = csv_path
+        self.parquet_path = parquet_path(csv_path)
+        self.rows = 0
+        self._header_written = False
+        self._parquet: Optional[pq.ParquetWriter] = None
+
+        os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+        for path in (self.csv_path, self.parquet_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        # Empty chunks only matter for the header / schema of an empty output
+        if chunk.empty and self._header_written:
+            return
+
+        chunk.to_csv(self.csv_path, mode="a", header=not self._header_written, index=False)
+        self._header_written = True
+
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        if self._parquet is None:
+            self._parquet = pq.ParquetWriter(self.parquet_path, table.schema)
+        self._parquet.write_table(table.cast(self._parquet.schema))
+
+        self.rows += len(chunk)
+
+    def close(self) -> None:
+        if self._parquet is not None:
+            self._parquet.close()
+
+
+class DataIngestion:
+    """
+    Data ingestion stage.
+
+    Streams the source in chunks into raw CSV/Parquet copies, then splits the
+    rows chronologically into train/test (no shuffling, so ``RANDOM_STATE``
+    is not used). ``metadata.json`` records row counts, hashes and timings;
+    a rerun against an unchanged source is skipped.
+    """
+
+    def __init__(self, config: DataIngestionConfig = None):
+        self.config = config or DataIngestionConfig()
+
+    # ----------------------------------------------------------------
+    # Change detection
+    # ----------------------------------------------------------------
+    def _outputs(self) -> Dict[str, str]:
+        return {
+            "raw": self.config.raw_file_path,
+            "processed": self.config.processed_file_path,
+            "train": self.config.train_file_path,
+            "test": self.config.test_file_path,
+        }
+
+    def _unchanged_source_sha256(self) -> Optional[str]:
+        """
+        Return the recorded source hash when the previous run is still valid
+        (same config, outputs present, source unchanged), otherwise None.
+        """
+        metadata = load_json(self.config.metadata_file_path)
+        if not metadata:
+            return None
+
+        recorded_config = metadata.get("config", {})
+        if (recorded_config.get("test_ratio"), recorded_config.get("deduplicate", False)) != (
+            self.config.test_ratio, self.config.deduplicate
+        ):
+            return None
+
+        for path in self._outputs().values():
+            if not (os.path.exists(path) and os.path.exists(parquet_path(path))):
+                return None
+
+        recorded = metadata["source"]
+        current = source_version(self.config.source_path)
+
+        # Fast path: size and mtime unchanged
+        if (recorded["path"], recorded["size"], recorded["mtime_ns"]) == (
+            current["path"], current["size"], current["mtime_ns"]
+        ):
+            return recorded["sha256"]
+
+        # Touched but possibly identical content
+        if recorded["size"] == current["size"] and file_sha256(self.config.source_path) == recorded["sha256"]:
+            return recorded["sha256"]
+
+        return None
+
+    def _artifact(self, source_sha256: str, skipped: bool) -> DataIngestionArtifact:
+        return DataIngestionArtifact(
+            raw_file_path=self.config.raw_file_path,
+            processed_file_path=self.config.processed_file_path,
+            train_file_path=self.config.train_file_path,
+            test_file_path=self.config.test_file_path,
+            metadata_file_path=self.config.metadata_file_path,
+            schema_file_path=self.config.schema_file_path,
+            source_sha256=source_sha256,
+            skipped=skipped,
+        )
+
+    # ----------------------------------------------------------------
+    # Stage steps
+    # ----------------------------------------------------------------
+    def _ingest_raw(self) -> np.ndarray:
+        """
+        Pass 1: stream the source into the raw CSV/Parquet and collect the
+        date column, which is all the split needs.
+        """
+        writer = _ChunkWriter(self.config.raw_file_path)
+        dates = []
+        try:
+            for chunk in iter_source_chunks(self.config.source_path, self.config.chunksize):
+                chunk = normalise_chunk(chunk, self.config.date_column)
+                writer.write(chunk)
+                dates.append(chunk[self.config.date_column].to_numpy(dtype="datetime64[ns]"))
+                logger.info("Raw chunk ingested | rows=%s total=%s", len(chunk), writer.rows)
+        finally:
+            writer.close()
+
+        return np.concatenate(dates) if dates else np.array([], dtype="datetime64[ns]")
+
+    def _split(self, cutoff: pd.Timestamp, duplicate_rows: np.ndarray = None) -> Dict[str, int]:
+        """
+        Pass 2: read the raw Parquet batch by batch and route rows to the
+        processed/train/test outputs by date, leaving out ``duplicate_rows``
+        (raw row numbers) when given.
+        """
+        writers = {
+            "processed": _ChunkWriter(self.config.processed_file_path),
+            "train": _ChunkWriter(self.config.train_file_path),
+            "test": _ChunkWriter(self.config.test_file_path),
+        }
+        try:
+            raw = pq.ParquetFile(parquet_path(self.config.raw_file_path))
+            first_row = 0
+            for batch in raw.iter_batches(batch_size=self.config.chunksize):
+                chunk = batch.to_pandas()
+                if duplicate_rows is not None:
+                    chunk = DuplicateDetector.drop_rows(chunk, first_row, duplicate_rows)
+                first_row += batch.num_rows
+                dates = chunk[self.config.date_column]
+
+                valid = chunk[dates.notna()]
+                is_test = valid[self.config.date_column] >= cutoff
+
+                writers["processed"].write(valid)
+                writers["train"].write(valid[~is_test])
+                writers["test"].write(valid[is_test])
+        finally:
+            for writer in writers.values():
+                writer.close()
+
+        return {name: writer.rows for name, writer in writers.items()}
+
+    # ----------------------------------------------------------------
+    # Entry point
+    # ----------------------------------------------------------------
+    def initiate_data_ingestion(self, force: bool = False) -> DataIngestionArtifact:
+        """
+        Run the ingestion stage.
+
+        Parameters
+        ----------
+        force : bool
+            Re-ingest even when the source is unchanged.
+
+        Returns
+        -------
+        DataIngestionArtifact
+        """
+        try:
+            if not os.path.exists(self.config.source_path):
+                raise FileNotFoundError(f"Source dataset not found: {self.config.source_path}")
+
+            if not force:
+                source_sha256 = self._unchanged_source_sha256()
+                if source_sha256:
+                    logger.info("Source unchanged, skipping ingestion | path=%s", self.config.source_path)
+                    return self._artifact(source_sha256, skipped=True)
+
+            logger.info("Data ingestion started | source=%s", self.config.source_path)
+            timings = {}
+
+            start = time.perf_counter()
+            source = source_version(self.config.source_path)
+            source["sha256"] = file_sha256(self.config.source_path)
+            timings["hash_source"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            dates = self._ingest_raw()
+            timings["ingest_raw"] = time.perf_counter() - start
+
+            duplicate_rows, duplicates = None, None
+            if self.config.deduplicate:
+                start = time.perf_counter()
+                duplicate_rows, duplicates = DuplicateDetector(self.config.duplicates).find(
+                    parquet_path(self.config.raw_file_path)
+                )
+                dates = np.delete(dates, duplicate_rows)
+                timings["deduplicate"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            cutoff = time_split_cutoff(dates, self.config.test_ratio)
+            row_counts = self._split(cutoff, duplicate_rows)
+            timings["split"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            raw_parquet = parquet_path(self.config.raw_file_path)
+            schema = pq.read_schema(raw_parquet)
+            summary_frame = pd.read_parquet(raw_parquet, columns=[self.config.date_column, "CLOSED/OPEN"])
+            write_summary_snapshot(
+                self.config.source_path,
+                df=summary_frame,
+                snapshot_path=self.config.summary_file_path,
+            )
+            timings["summary_snapshot"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            outputs = {}
+            for name, path in self._outputs().items():
+                outputs[name] = {
+                    "csv": path,
+                    "parquet": parquet_path(path),
+                    "sha256": file_sha256(parquet_path(path)),
+                }
+            timings["hash_outputs"] = time.perf_counter() - start
+
+            valid_dates = np.sort(dates[~np.isnat(dates)])
+            test_start = np.searchsorted(valid_dates, np.datetime64(cutoff))
+
+            save_json(self.config.schema_file_path, {
+                "date_column": self.config.date_column,
+                "columns": {field.name: str(field.type) for field in schema},
+            })
+
+            save_json(self.config.metadata_file_path, {
+                "ingested_at": datetime.now().isoformat(timespec="seconds"),
+                "source": source,
+                "config": {
+                    "chunksize": self.config.chunksize,
+                    "test_ratio": self.config.test_ratio,
+                    "split_strategy": "time",
+                    "deduplicate": self.config.deduplicate,
+                },
+                "row_counts": {
+                    "raw": int(len(dates)) + (duplicates["duplicate_rows"] if duplicates else 0),
+                    "duplicates_dropped": duplicates["duplicate_rows"] if duplicates else 0,
+                    "invalid_date": int(len(dates) - row_counts["processed"]),
+                    **{name: int(rows) for name, rows in row_counts.items()},
+                },
+                "split": {
+                    "cutoff_date": cutoff.strftime("%Y-%m-%d"),
+                    "train_date_range": [
+                        str(valid_dates[0])[:10] if test_start > 0 else None,
+                        str(valid_dates[test_start - 1])[:10] if test_start > 0 else None,
+                    ],
+                    "test_date_range": [
+                        str(valid_dates[test_start])[:10] if test_start < valid_dates.size else None,
+                        str(valid_dates[-1])[:10] if test_start < valid_dates.size else None,
+                    ],
+                },
+                "duplicates": duplicates,
+                "outputs": outputs,
+                "timings_seconds": {step: round(seconds, 4) for step, seconds in timings.items()},
+            })
+
+            logger.info(
+                "Data ingestion completed | raw=%s duplicates_dropped=%s train=%s test=%s cutoff=%s",
+                len(dates) + (duplicates["duplicate_rows"] if duplicates else 0),
+                duplicates["duplicate_rows"] if duplicates else 0,
+                row_counts["train"],
+                row_counts["test"],
+                cutoff.date(),
+            )
+
+            return self._artifact(source["sha256"], skipped=False)
+
+        except Exception as e:
+            logger.error(f"Error during data ingestion: {str(e)}", exc_info=True)
+            raise CustomException(e, sys) from e
@@ -0,0 +1,303 @@
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.entities.component_config_entity import DataValidationConfig, parquet_path
+from src.entities.artifact_entity import DataIngestionArtifact, DataValidationArtifact
+from src.monitoring.drift_detector import DataDriftDetector
+from src.data_access.duplicate_detector import DuplicateDetector
+from src.utils.helper import load_json, save_json
+from src.utils.validation_helper import (
+    complete_daily_counts,
+    iqr_bounds,
+    longest_gap,
+    profile_table,
+    public_profile,
+    skewness,
+)
+
+logger = get_logger(__name__)
+
+
+def _check(name: str, passed: bool, blocking: bool = False, **detail) -> dict:
+    return {"check": name, "passed": bool(passed), "blocking": blocking, **detail}
+
+
+def _status(checks: List[dict]) -> str:
+    if any(not c["passed"] and c["blocking"] for c in checks):
+        return "failed"
+    if any(not c["passed"] for c in checks):
+        return "warning"
+    return "passed"
+
+
+class DataValidation:
+    """
+    Data validation stage.
+
+    The processed Parquet is read once and every column is profiled in a
+    single ``value_counts`` pass; all schema, quality, time-series and
+    statistical checks are then answered from that profile instead of
+    rescanning the data per check. Duplicates come from the fingerprint
+    detector (key columns only) and drift from the sketch-based detector. Stages run in order and the first blocking failure stops
+    the run: the remaining reports are still written, marked ``skipped``.
+    """
+
+    def __init__(self, config: DataValidationConfig = None):
+        self.config = config or DataValidationConfig()
+
+    # ----------------------------------------------------------------
+    # Schema / structure
+    # ----------------------------------------------------------------
+    def validate_schema(self, schema: pa.Schema, rows: int) -> dict:
+        cfg = self.config
+        present = schema.names
+        missing = [c for c in cfg.required_columns if c not in present]
+        unexpected = [c for c in present if c not in cfg.required_columns]
+
+        date_type = str(schema.field(cfg.date_column).type) if cfg.date_column in present else None
+        checks = [
+            _check("not_empty", rows > 0, blocking=True, rows=rows),
+            _check("required_columns", not missing, blocking=True, missing=missing),
+            _check("date_column_type", date_type is not None and date_type.startswith(("timestamp", "date")),
+                   blocking=True, type=date_type),
+            _check("unexpected_columns", not unexpected, unexpected=unexpected),
+        ]
+        return {
+            "columns": {field.name: str(field.type) for field in schema},
+            "rows": rows,
+            "checks": checks,
+        }
+
+    # ----------------------------------------------------------------
+    # Quality / integrity
+    # ----------------------------------------------------------------
+    def validate_quality(self, profiles: Dict[str, dict], metadata: dict, duplicates: dict) -> dict:
+        cfg = self.config
+        rows = next(iter(profiles.values()))["rows"]
+
+        missing = {name: p["nulls"] / max(rows, 1) for name, p in profiles.items()}
+        blank = {name: p.get("blank", 0) / max(rows, 1) for name, p in profiles.items()}
+
+        key_missing = {c: round(missing[c], 6) for c in cfg.key_columns if missing.get(c, 0) > cfg.max_missing}
+        other_missing = {
+            c: round(v, 6) for c, v in missing.items()
+            if v > cfg.max_missing and c not in cfg.key_columns
+        }
+
+        row_counts = metadata.get("row_counts", {})
+        invalid_dates = row_counts.get("invalid_date", 0)
+        invalid_date_ratio = invalid_dates / max(row_counts.get("raw", rows), 1)
+
+        checks = [
+            _check("key_columns_missing", not key_missing, blocking=True,
+                   threshold=cfg.max_missing, columns=key_missing),
+            _check("columns_missing", not other_missing, threshold=cfg.max_missing, columns=other_missing),
+            _check("blank_values", not any(v > cfg.max_missing for v in blank.values()),
+                   threshold=cfg.max_missing, columns={c: round(v, 6) for c, v in blank.items() if v}),
+            _check("duplicate_rows", duplicates["ratio"] <= cfg.max_duplicate, threshold=cfg.max_duplicate,
+                   duplicates=duplicates["duplicate_rows"], ratio=duplicates["ratio"]),
+            _check("invalid_dates", invalid_date_ratio <= cfg.max_missing, threshold=cfg.max_missing,
+                   dropped_rows=invalid_dates, ratio=round(invalid_date_ratio, 6)),
+        ]
+        return {
+            "rows": rows,
+            "missing_ratio": {c: round(v, 6) for c, v in missing.items()},
+            "duplicates": duplicates,
+            "columns": {name: public_profile(p) for name, p in profiles.items()},
+            "checks": checks,
+        }
+
+    # ----------------------------------------------------------------
+    # Time series
+    # ----------------------------------------------------------------
+    def validate_time_series(self, profiles: Dict[str, dict], metadata: dict) -> dict:
+        cfg = self.config
+        daily = profiles[cfg.date_column]["daily_counts"]
+        full = complete_daily_counts(daily)
+
+        empty_days = int((full == 0).sum())
+        empty_day_ratio = empty_days / max(len(full), 1)
+        future_days = int((daily.index > pd.Timestamp.now().normalize()).sum())
+
+        split = metadata.get("split", {})
+        train_end = (split.get("train_date_range") or [None, None])[1]
+        test_start = (split.get("test_date_range") or [None, None])[0]
+        ordered = train_end is None or test_start is None or train_end < test_start
+
+        checks = [
+            _check("chronological_split", ordered, blocking=True, train_end=train_end, test_start=test_start),
+            _check("missing_days", empty_day_ratio <= cfg.max_missing, threshold=cfg.max_missing,
+                   empty_days=empty_days, ratio=round(empty_day_ratio, 6),
+                   longest_gap_days=longest_gap(daily.index)),
+            _check("future_dates", future_days == 0, days=future_days),
+        ]
+        return {
+            "date_range": [profiles[cfg.date_column]["min"], profiles[cfg.date_column]["max"]],
+            "calendar_days": int(len(full)),
+            "days_with_rows": int(len(daily)),
+            "split": split,
+            "checks": checks,
+        }
+
+    # ----------------------------------------------------------------
+    # Statistics
+    # ----------------------------------------------------------------
+    def validate_statistics(self, profiles: Dict[str, dict]) -> dict:
+        cfg = self.config
+        volume = complete_daily_counts(profiles[cfg.date_column]["daily_counts"]).to_numpy(dtype=np.float64)
+
+        lower, upper = iqr_bounds(volume, cfg.outlier_iqr)
+        outlier_days = int(((volume < lower) | (volume > upper)).sum())
+        volume_skew = skewness(volume)
+
+        categories = {}
+        for column in cfg.category_columns:
+            if column not in profiles:
+                continue
+            counts = profiles[column]["value_counts"]
+            share = counts / max(counts.sum(), 1)
+            categories[column] = {
+                "distinct": int(len(counts)),
+                "rare": {str(k): round(float(v), 6) for k, v in share[share < cfg.rare_category_share].items()},
+            }
+
+        checks = [
+            _check("daily_volume_skewness", abs(volume_skew) <= cfg.max_skewness,
+                   threshold=cfg.max_skewness, value=round(volume_skew, 4)),
+            _check("daily_volume_outliers", outlier_days / max(volume.size, 1) <= cfg.max_outlier_day_ratio,
+                   threshold=cfg.max_outlier_day_ratio, days=outlier_days, bounds=[round(lower, 3), round(upper, 3)]),
+            _check("single_valued_categories",
+                   all(c["distinct"] > 1 for c in categories.values()),
+                   columns=[name for name, c in categories.items() if c["distinct"] <= 1]),
+        ]
+        return {
+            "daily_volume": {
+                "days": int(volume.size),
+                "mean": round(float(volume.mean()), 4) if volume.size else None,
+                "std": round(float(volume.std()), 4) if volume.size else None,
+                "min": float(volume.min()) if volume.size else None,
+                "max": float(volume.max()) if volume.size else None,
+                "skewness": round(volume_skew, 4),
+                "outlier_days": outlier_days,
+            },
+            "categories": categories,
+            "checks": checks,
+        }
+
+    # ----------------------------------------------------------------
+    # Drift
+    # ----------------------------------------------------------------
+    def validate_drift(self, ingestion_artifact: DataIngestionArtifact) -> dict:
+        detector = DataDriftDetector(self.config.drift)
+        try:
+            artifact = detector.initiate_drift_detection(ingestion_artifact)
+        except CustomException as e:
+            if isinstance(e.__cause__, ValueError):
+                # Too little history for reference and current windows
+                return {"checks": [_check("data_drift", True, skipped=str(e.__cause__))]}
+            raise
+
+        report = load_json(artifact.report_file_path, default={})
+        report["checks"] = [
+            _check("data_drift", not artifact.drift_detected, drifted_columns=artifact.drifted_columns),
+        ]
+        return report
+
+    # ----------------------------------------------------------------
+    # Entry point
+    # ----------------------------------------------------------------
+    def initiate_data_validation(self, ingestion_artifact: DataIngestionArtifact) -> DataValidationArtifact:
+        try:
+            cfg = self.config
+            os.makedirs(cfg.validation_dir, exist_ok=True)
+            path = parquet_path(ingestion_artifact.processed_file_path)
+            metadata = load_json(ingestion_artifact.metadata_file_path, default={})
+
+            state = {"profiles": None}
+
+            def profiles() -> Dict[str, dict]:
+                # Read and profiled once, after the schema is known to be usable
+                if state["profiles"] is None:
+                    start = time.perf_counter()
+                    state["profiles"] = profile_table(pq.read_table(path))
+                    logger.info("Columns profiled | seconds=%.3f", time.perf_counter() - start)
+                return state["profiles"]
+
+            stages: List[Tuple[str, str, Callable[[], dict]]] = [
+                ("schema", cfg.schema_report_file_path,
+                 lambda: self.validate_schema(pq.read_schema(path), pq.ParquetFile(path).metadata.num_rows)),
+                ("quality", cfg.quality_report_file_path,
+                 lambda: self.validate_quality(profiles(), metadata, DuplicateDetector(cfg.duplicates).find(path)[1])),
+                ("time_series", cfg.time_series_report_file_path,
+                 lambda: self.validate_time_series(profiles(), metadata)),
+                ("statistical", cfg.statistical_report_file_path, lambda: self.validate_statistics(profiles())),
+                ("drift", cfg.drift_report_file_path, lambda: self.validate_drift(ingestion_artifact)),
+            ]
+
+            summary, failed, warnings = {}, [], []
+            blocked_by = None
+
+            for name, report_path, validate in stages:
+                if blocked_by is not None:
+                    save_json(report_path, {"stage": name, "status": "skipped", "reason": f"{blocked_by} failed"})
+                    summary[name] = "skipped"
+                    continue
+
+                start = time.perf_counter()
+                report = validate()
+                status = _status(report["checks"])
+                report = {
+                    "stage": name,
+                    "status": status,
+                    "validated_at": datetime.now().isoformat(timespec="seconds"),
+                    "seconds": round(time.perf_counter() - start, 3),
+                    **report,
+                }
+                save_json(report_path, report)
+                summary[name] = status
+
+                failed += [f"{name}.{c['check']}" for c in report["checks"] if not c["passed"] and c["blocking"]]
+                warnings += [f"{name}.{c['check']}" for c in report["checks"] if not c["passed"] and not c["blocking"]]
+
+                if status == "failed":
+                    blocked_by = name
+                    logger.error("Blocking validation failure | stage=%s checks=%s", name, failed)
+
+            validation_status = blocked_by is None
+            report_paths = {name: report_path for name, report_path, _ in stages}
+            save_json(cfg.status_file_path, {
+                "validated_at": datetime.now().isoformat(timespec="seconds"),
+                "validation_status": validation_status,
+                "source_sha256": ingestion_artifact.source_sha256,
+                "stages": summary,
+                "failed_checks": failed,
+                "warnings": warnings,
+                "reports": report_paths,
+            })
+
+            logger.info(
+                "Data validation completed | status=%s stages=%s warnings=%s",
+                validation_status, summary, warnings,
+            )
+
+            return DataValidationArtifact(
+                validation_status=validation_status,
+                status_file_path=cfg.status_file_path,
+                report_file_paths=report_paths,
+                failed_checks=failed,
+                warnings=warnings,
+            )
+
+        except Exception as e:
+            logger.error(f"Error during data validation: {str(e)}", exc_info=True)
+            raise CustomException(e, sys) from e
@@ -0,0 +1,178 @@
+import os
+import sys
+import json
+import time
+import hashlib
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.entities.component_config_entity import FeatureEngineeringConfig, parquet_path
+from src.entities.artifact_entity import DataIngestionArtifact, FeatureEngineeringArtifact
+from src.utils.helper import file_sha256, load_json, save_json
+from src.utils.training_helper import build_daily_count_matrix, select_categories
+from src.utils.feature_engineering_helper import build_feature_frame
+from src.data_access.feature_store import FeatureStore
+
+logger = get_logger(__name__)
+
+
+class FeatureEngineering:
+    """
+    Feature engineering stage.
+
+    Builds one daily feature frame over the whole train + test range (so
+    test-period lags reach back into train) and splits it at the first
+    test day. Outputs are cached: the cache key is the hash of the split
+    files plus the feature settings, and a rerun with the same key reuses
+    the existing files. The full frame is published to the feature store
+    so later stages and serving read it instead of rebuilding it.
+    """
+
+    def __init__(self, config: FeatureEngineeringConfig = None):
+        self.config = config or FeatureEngineeringConfig()
+        self.store = FeatureStore(self.config.feature_store_dir)
+
+    # ----------------------------------------------------------------
+    # Cache
+    # ----------------------------------------------------------------
+    def cache_key(self, ingestion_artifact: DataIngestionArtifact) -> str:
+        """Hash of the train/test inputs and the feature settings."""
+        outputs = load_json(ingestion_artifact.metadata_file_path, default={}).get("outputs", {})
+
+        input_hashes = {}
+        for split, path in (("train", ingestion_artifact.train_file_path),
+                            ("test", ingestion_artifact.test_file_path)):
+            # Ingestion already records the hash of each split
+            input_hashes[split] = outputs.get(split, {}).get("sha256") or file_sha256(path)
+
+        payload = json.dumps({"inputs": input_hashes, "settings": self.config.feature_settings()}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _is_cached(self, cache_key: str) -> bool:
+        report = load_json(self.config.report_file_path, default={})
+        outputs = (
+            self.config.train_file_path,
+            self.config.test_file_path,
+            parquet_path(self.config.train_file_path),
+            parquet_path(self.config.test_file_path),
+        )
+        return report.get("cache_key") == cache_key and all(os.path.exists(p) for p in outputs)
+
+    # ----------------------------------------------------------------
+    # Output
+    # ----------------------------------------------------------------
+    @staticmethod
+    def _write(frame: pd.DataFrame, csv_path: str) -> None:
+        frame = frame.reset_index()
+        frame.to_csv(csv_path, index=False)
+        pq.write_table(pa.Table.from_pandas(frame, preserve_index=False), parquet_path(csv_path))
+
+    def _publish(self, features: pd.DataFrame, series: list, cache_key: str, test_start: pd.Timestamp) -> None:
+        self.store.write(
+            self.config.feature_set,
+            features,
+            metadata={
+                "cache_key": cache_key,
+                "series": list(series),
+                "test_start": test_start.strftime("%Y-%m-%d"),
+            },
+        )
+
+    def _ensure_published(self, cache_key: str) -> None:
+        """Republish the cached output if the store holds another version."""
+        manifest = self.store.manifest(self.config.feature_set) or {}
+        if manifest.get("metadata", {}).get("cache_key") == cache_key:
+            return
+
+        train = pd.read_parquet(parquet_path(self.config.train_file_path))
+        test = pd.read_parquet(parquet_path(self.config.test_file_path))
+        features = pd.concat([train, test], ignore_index=True).set_index(self.config.date_column)
+        test_start = test[self.config.date_column].min() if len(test) else features.index[-1] + pd.Timedelta(days=1)
+        series = load_json(self.config.report_file_path, default={}).get("series", [])
+        self._publish(features, series, cache_key, pd.Timestamp(test_start))
+
+    # ----------------------------------------------------------------
+    # Entry point
+    # ----------------------------------------------------------------
+    def initiate_feature_engineering(self, ingestion_artifact: DataIngestionArtifact,
+                                     force: bool = False) -> FeatureEngineeringArtifact:
+        try:
+            cfg = self.config
+            start = time.perf_counter()
+
+            cache_key = self.cache_key(ingestion_artifact)
+            if not force and self._is_cached(cache_key):
+                logger.info("Feature engineering skipped | cache hit key=%s", cache_key[:12])
+                self._ensure_published(cache_key)
+                return FeatureEngineeringArtifact(
+                    train_file_path=cfg.train_file_path,
+                    test_file_path=cfg.test_file_path,
+                    report_file_path=cfg.report_file_path,
+                    cache_key=cache_key,
+                    skipped=True,
+                )
+
+            logger.info("Feature engineering started | key=%s", cache_key[:12])
+
+            columns = [cfg.date_column, cfg.category_column]
+            train_df = pd.read_parquet(parquet_path(ingestion_artifact.train_file_path), columns=columns)
+            test_df = pd.read_parquet(parquet_path(ingestion_artifact.test_file_path), columns=columns)
+
+            categories = select_categories(train_df[cfg.category_column], cfg.max_categories)
+            counts = build_daily_count_matrix(
+                pd.concat([train_df, test_df], ignore_index=True),
+                categories,
+                cfg.date_column,
+                cfg.category_column,
+            )
+            features = build_feature_frame(counts, cfg.lags, cfg.rolling_windows)
+
+            test_start = pd.to_datetime(test_df[cfg.date_column]).min().normalize()
+            is_test = features.index >= test_start
+            train_features, test_features = features[~is_test], features[is_test]
+
+            os.makedirs(cfg.feature_engineering_dir, exist_ok=True)
+            self._write(train_features, cfg.train_file_path)
+            self._write(test_features, cfg.test_file_path)
+            self._publish(features, counts.columns.tolist(), cache_key, test_start)
+
+            elapsed = time.perf_counter() - start
+            save_json(cfg.report_file_path, {
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "cache_key": cache_key,
+                "settings": cfg.feature_settings(),
+                "series": counts.columns.tolist(),
+                "feature_columns": features.columns.tolist(),
+                "rows": {"train": int(len(train_features)), "test": int(len(test_features))},
+                "date_range": {
+                    "train": [str(train_features.index.min().date()), str(train_features.index.max().date())]
+                    if len(train_features) else None,
+                    "test": [str(test_features.index.min().date()), str(test_features.index.max().date())]
+                    if len(test_features) else None,
+                },
+                "seconds": round(elapsed, 3),
+            })
+
+            logger.info(
+                "Feature engineering completed | features=%s train_rows=%s test_rows=%s seconds=%.2f",
+                features.shape[1],
+                len(train_features),
+                len(test_features),
+                elapsed,
+            )
+
+            return FeatureEngineeringArtifact(
+                train_file_path=cfg.train_file_path,
+                test_file_path=cfg.test_file_path,
+                report_file_path=cfg.report_file_path,
+                cache_key=cache_key,
+            )
+
+        except Exception as e:
+            logger.error(f"Error during feature engineering: {str(e)}", exc_info=True)
+            raise CustomException(e, sys) from e
@@ -7,6 +7,9 @@ from datetime import datetime
 ARTIFACTS_DIR          = os.path.join("artifacts")
 DEPLOYED_ARTIFACTS_DIR = os.path.join("deployed_artifacts")
 
+# Inputs of the last completed model run (training -> registry)
+PIPELINE_STATE_FILE    = os.path.join(ARTIFACTS_DIR, "pipeline_state.json")
+
 # Timestamp
 TIMESTAMP = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -26,6 +29,7 @@ DATA_INGESTION_TEST_FILE      = "test.csv"
 
 DATA_INGESTION_METADATA_FILE  = "metadata.json"
 DATA_INGESTION_SCHEMA_FILE    = "schema.json"
+DATA_INGESTION_SUMMARY_FILE   = "summary_snapshot.json"
 
 # Parameters
 TRAIN_TEST_SPLIT_RATIO = 0.2
@@ -48,10 +52,22 @@ NUMERICAL_COLUMN_THRESHOLD     = 0.05
 CATEGORICAL_COLUMN_THRESHOLD   = 0.05
 MAX_DUPLICATE_THRESHOLD        = 0.05
 OUTLIER_IQR_THRESHOLD          = 1.5
+MAX_OUTLIER_DAY_RATIO          = 0.05
 DRIFT_THRESHOLD                = 0.05
 MIN_CORRELATION_THRESHOLD      = 0.10
 MAX_SKEWNESS_THRESHOLD         = 3.0
 
+# Grouped daily-spike outliers (per circle / division / complaint type)
+OUTLIER_GROUP_COLUMNS          = ["CIRCLE", "DIVISION", "COMPLAINT TYPE"]
+OUTLIER_MIN_DAILY_COUNT        = 3
+
+# Drift monitoring (sketches per window; DRIFT_THRESHOLD is the p-value cut-off)
+DATA_DRIFT_SKETCH_FILE         = "drift_sketches.json"
+DRIFT_PSI_THRESHOLD            = 0.2
+DRIFT_WINDOW_DAYS              = 7
+DRIFT_CURRENT_WINDOWS          = 4
+DRIFT_SKETCH_ACCURACY          = 0.01
+
 
 # =====================================================================
 # DATA PREPROCESSING CONSTANTS
@@ -71,6 +87,15 @@ FEATURE_ENGINEERING_TEST_FILE      = "test_features.csv"
 FEATURE_ENGINEERING_REPORT_FILE    = "feature_engineering_report.json"
 
 
+# =====================================================================
+# FEATURE STORE CONSTANTS
+# =====================================================================
+FEATURE_STORE_DIR            = "feature_store"
+FEATURE_STORE_MANIFEST_FILE  = "manifest.json"
+FEATURE_STORE_VALUES_FILE    = "values.f32"
+FEATURE_STORE_DAILY_FEATURES = "daily_features"
+
+
 # =====================================================================
 # DATA TRANSFORMATION CONSTANTS
 # =====================================================================
@@ -87,6 +112,8 @@ MODEL_TRAINING_DIR                 = "model_training"
 MODEL_TRAINING_FILE                = "lstm_model.keras"
 SCALLING_TRANSFORMATION_PKL_FILE   = "scalling_preprocessor.pkl"
 MODEL_TRAINING_REPORT_FILE         = "model_report.json"
+MODEL_INCREMENTAL_DIR              = "incremental"
+MODEL_INCREMENTAL_REPORT_FILE      = "incremental_report.json"
 
 
 # =====================================================================
@@ -97,24 +124,87 @@ MODEL_EVALUATION_REPORT_FILE = "model_evaluation_report.json"
 MODEL_EVALUATION_PNG_FILE    = "model_evaluation.png"
 
 
+# =====================================================================
+# MODEL MONITORING CONSTANTS
+# =====================================================================
+MODEL_MONITORING_DIR      = "model_monitoring"
+MODEL_DRIFT_STATE_FILE    = "model_drift_state.json"
+MODEL_DRIFT_SIGNAL_FILE   = "retrain_signal.json"
+
+
 # =====================================================================
 # MODEL DEPLOYMENT CONSTANTS
 # =====================================================================
 MODEL_DEPLOYMENT_DIR               = "deployment_artifacts"
 MODEL_DEPLOYMENT_MODEL_FILE        = "lstm_model.keras"
 MODEL_DEPLOYMENT_PREPROCESSOR_FILE = "preprocessor.pkl"
+MODEL_DEPLOYMENT_WEIGHTS_FILE      = "lstm_weights.npz"
+MODEL_DEPLOYMENT_TOLERANCE         = 1e-4
 MODEL_DEPLOYMENT_REPORT_FILE       = "model_deployment_report.json"
 PREDICTION_DF_FILE                 = "prediction_df_results.csv"
 
 
+# =====================================================================
+# MODEL PREDICTION CONSTANTS
+# =====================================================================
+PREDICTION_MAX_BATCH_SIZE = 64
+PREDICTION_MAX_WAIT_MS    = 5.0
+
+
+# =====================================================================
+# MODEL SEARCH CONSTANTS
+# =====================================================================
+MODEL_CONFIGS_FILE         = os.path.join("configs", "model_configs.yaml")
+MODEL_SEARCH_DIR           = "model_search"
+MODEL_SEARCH_ARRAYS_DIR    = "arrays"
+MODEL_SEARCH_JOURNAL_FILE  = "search_journal.jsonl"
+MODEL_SEARCH_REPORT_FILE   = "search_report.json"
+
+
+# =====================================================================
+# MODEL REGISTRY CONSTANTS
+# =====================================================================
+MODEL_REGISTRY_FILE          = "registry.json"
+MODEL_REGISTRY_VERSIONS_DIR  = "versions"
+MODEL_REGISTRY_MANIFEST_FILE = "manifest.json"
+MODEL_REGISTRY_MAX_LOADED    = 2
+MODEL_REGISTRY_POLL_SECONDS  = 30.0
+
+
 # =====================================================================
 # DATABASE CONSTANTS
 # =====================================================================
 DATABASE_DIR         = "database"
-DATABASE_NAME        = "student_performance_db"
-DATABASE_FILE        = "student_performance_db.csv"
-DATABASE_COLLECTION  = "student_performance_collection"
+DATABASE_NAME        = "twitter_x_complaints"
+DATABASE_FILE        = "complaints_export.csv"
+DATABASE_COLLECTION  = "complaints"
 DATABASE_REPORT_FILE = "database_report.json"
+DATABASE_URL_ENV     = "MONGODB_URL"
+DATABASE_DEFAULT_URL = "mongodb://localhost:27017"
+
+# Embedded relational store (SQLite) the APIs serve complaints from
+RELATIONAL_DB_FILE          = "complaints.db"
+RELATIONAL_DB_TABLE         = "complaints"
+RELATIONAL_DB_LOAD_REPORT   = "load_report.json"
+RELATIONAL_DB_UPSERT_KEY    = "COMPLAINT NUMBER"
+RELATIONAL_DB_INDEX_COLUMNS = ("DATE", "DEPT", "CIRCLE", "COMPLAINT TYPE", "CLOSED/OPEN",
+                               "CONSUMER NUMBER", "COMPLAINT NUMBER")
+
+
+# =====================================================================
+# CLOUD STORAGE CONSTANTS
+# =====================================================================
+CLOUD_STORAGE_BUCKET_ENV          = "ARTIFACT_BUCKET"
+CLOUD_STORAGE_ENDPOINT_ENV        = "S3_ENDPOINT_URL"   # MinIO / other S3-compatible stores
+CLOUD_STORAGE_REGION_ENV          = "AWS_DEFAULT_REGION"
+CLOUD_STORAGE_PREFIX              = "twitter_x_flow"
+CLOUD_STORAGE_CACHE_DIR           = os.path.join(".cache", "artifacts")
+CLOUD_STORAGE_CHECKSUM_KEY        = "sha256"
+CLOUD_STORAGE_MULTIPART_THRESHOLD = 16 * 1024 * 1024
+CLOUD_STORAGE_CHUNK_SIZE          = 16 * 1024 * 1024
+CLOUD_STORAGE_MAX_CONCURRENCY     = 8
+CLOUD_STORAGE_CACHE_MAX_BYTES     = 5 * 1024 ** 3
+CLOUD_STORAGE_REGISTRY_NAME       = "model_registry"
 
 
 # =====================================================================
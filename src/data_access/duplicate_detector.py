@@ -0,0 +1,197 @@
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.entities.component_config_entity import DuplicateDetectionConfig
+
+logger = get_logger(__name__)
+
+# Spilled records: fingerprint + global row number
+RECORD = np.dtype([("fingerprint", "<u8"), ("row", "<i8")])
+
+
+def key_name(columns: Tuple[str, ...]) -> str:
+    return " + ".join(columns)
+
+
+class DuplicateDetector:
+    """
+    Exact duplicate detection on key columns via 64-bit fingerprints.
+
+    Each key (``COMPLAINT NUMBER``, ``TWEET-LINK``, ...) is hashed per row
+    into a ``uint64`` with pandas' vectorised hashing, so duplicates are
+    found by sorting integers instead of comparing wide object rows. A
+    row is a duplicate when any of its keys was already seen on an
+    earlier row; the first occurrence is kept. Null keys and placeholder
+    values (e.g. ``DM`` tweet links) never match.
+
+    Files are processed in ``chunksize`` batches. Fingerprints are spilled
+    to ``partitions`` files by their top bits, and each partition is
+    sorted on its own, so memory is bounded by the largest partition
+    rather than the file. With 64-bit fingerprints the chance of any
+    collision stays below 1e-7 up to a million distinct keys.
+    """
+
+    def __init__(self, config: DuplicateDetectionConfig = None):
+        self.config = config or DuplicateDetectionConfig()
+        self._shift = np.uint64(64 - max(int(np.log2(self.config.partitions)), 0))
+
+    # ----------------------------------------------------------------
+    # Fingerprints
+    # ----------------------------------------------------------------
+    def fingerprints(self, frame: pd.DataFrame, columns: Tuple[str, ...]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        ``uint64`` fingerprint of ``columns`` per row and the mask of rows
+        whose key takes part (no nulls, blanks or ignored values).
+        """
+        keys = frame[list(columns)]
+        valid = keys.notna().all(axis=1).to_numpy(dtype=bool, copy=True)
+        for column in columns:
+            text = keys[column].astype("string").str.strip()
+            valid &= ~text.isin(("", *self.config.ignore_values)).to_numpy(dtype=bool, na_value=True)
+
+        hashed = pd.util.hash_pandas_object(keys, index=False).to_numpy(dtype=np.uint64)
+        return hashed, valid
+
+    # ----------------------------------------------------------------
+    # Detection
+    # ----------------------------------------------------------------
+    @staticmethod
+    def _first_occurrence_duplicates(records: np.ndarray) -> Tuple[np.ndarray, int]:
+        """Rows that repeat an earlier fingerprint, and the number of repeated keys."""
+        if not records.size:
+            return np.empty(0, dtype=np.int64), 0
+
+        # Row order as tie-breaker keeps the earliest row of each key
+        order = np.lexsort((records["row"], records["fingerprint"]))
+        fingerprints = records["fingerprint"][order]
+        repeat = np.empty(fingerprints.size, dtype=bool)
+        repeat[0] = False
+        repeat[1:] = fingerprints[1:] == fingerprints[:-1]
+
+        repeated_keys = int(np.count_nonzero(repeat[1:] & ~repeat[:-1])) if repeat.size > 1 else 0
+        return records["row"][order][repeat], repeated_keys
+
+    def _iter_batches(self, path: str, columns: List[str]) -> Iterator[pd.DataFrame]:
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=self.config.chunksize, columns=columns):
+            yield batch.to_pandas()
+
+    def find(self, path: str) -> Tuple[np.ndarray, dict]:
+        """
+        Duplicate rows of a Parquet file, read in chunks.
+
+        Returns
+        -------
+        (np.ndarray, dict)
+            Sorted row numbers of the duplicate rows and a summary per key.
+        """
+        try:
+            cfg = self.config
+            start = time.perf_counter()
+            columns = sorted({c for key in cfg.key_sets for c in key})
+            available = set(pq.read_schema(path).names)
+            key_sets = [key for key in cfg.key_sets if set(key) <= available]
+
+            os.makedirs(cfg.spill_dir, exist_ok=True)
+            with tempfile.TemporaryDirectory(dir=cfg.spill_dir) as spill:
+                handles = {
+                    (k, p): open(os.path.join(spill, f"{k}_{p}.bin"), "wb")
+                    for k in range(len(key_sets)) for p in range(cfg.partitions)
+                }
+                rows, ignored = 0, [0] * len(key_sets)
+                try:
+                    # Pass 1: fingerprint each chunk and spill by partition
+                    for chunk in self._iter_batches(path, [c for c in columns if c in available]):
+                        row_numbers = np.arange(rows, rows + len(chunk), dtype=np.int64)
+                        for k, key in enumerate(key_sets):
+                            hashed, valid = self.fingerprints(chunk, key)
+                            ignored[k] += int((~valid).sum())
+
+                            records = np.empty(int(valid.sum()), dtype=RECORD)
+                            records["fingerprint"], records["row"] = hashed[valid], row_numbers[valid]
+                            partition = (records["fingerprint"] >> self._shift).astype(np.int64) \
+                                if cfg.partitions > 1 else np.zeros(records.size, dtype=np.int64)
+                            for p in np.unique(partition):
+                                handles[(k, int(p))].write(records[partition == p].tobytes())
+                        rows += len(chunk)
+                finally:
+                    for handle in handles.values():
+                        handle.close()
+
+                # Pass 2: one partition in memory at a time
+                duplicates, keys = [], {}
+                for k, key in enumerate(key_sets):
+                    key_rows, repeated = [], 0
+                    for p in range(cfg.partitions):
+                        records = np.fromfile(os.path.join(spill, f"{k}_{p}.bin"), dtype=RECORD)
+                        found, n_keys = self._first_occurrence_duplicates(records)
+                        key_rows.append(found)
+                        repeated += n_keys
+                    key_rows = np.concatenate(key_rows)
+                    duplicates.append(key_rows)
+                    keys[key_name(key)] = {
+                        "duplicate_rows": int(key_rows.size),
+                        "repeated_keys": repeated,
+                        "ignored_rows": ignored[k],
+                    }
+
+            duplicate_rows = np.unique(np.concatenate(duplicates)) if duplicates else np.empty(0, dtype=np.int64)
+            summary = {
+                "rows": rows,
+                "duplicate_rows": int(duplicate_rows.size),
+                "ratio": round(duplicate_rows.size / max(rows, 1), 6),
+                "keys": keys,
+                "ignore_values": list(cfg.ignore_values),
+                "seconds": round(time.perf_counter() - start, 3),
+            }
+            logger.info("Duplicate detection | rows=%s duplicates=%s keys=%s",
+                        rows, duplicate_rows.size, {k: v["duplicate_rows"] for k, v in keys.items()})
+            return duplicate_rows, summary
+
+        except Exception as e:
+            raise CustomException(e, sys) from e
+
+    # ----------------------------------------------------------------
+    # Dedupe
+    # ----------------------------------------------------------------
+    @staticmethod
+    def drop_rows(chunk: pd.DataFrame, first_row: int, duplicate_rows: np.ndarray) -> pd.DataFrame:
+        """Rows of ``chunk`` (global rows ``first_row``...) not in ``duplicate_rows``."""
+        lo, hi = np.searchsorted(duplicate_rows, [first_row, first_row + len(chunk)])
+        if lo == hi:
+            return chunk
+        keep = np.ones(len(chunk), dtype=bool)
+        keep[duplicate_rows[lo:hi] - first_row] = False
+        return chunk[keep]
+
+    def deduplicate(self, path: str, output_path: str) -> dict:
+        """Write ``path`` without its duplicate rows, chunk by chunk."""
+        try:
+            duplicate_rows, summary = self.find(path)
+
+            writer, first_row = None, 0
+            try:
+                for batch in pq.ParquetFile(path).iter_batches(batch_size=self.config.chunksize):
+                    chunk = self.drop_rows(batch.to_pandas(), first_row, duplicate_rows)
+                    first_row += batch.num_rows
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    if writer is None:
+                        writer = pq.ParquetWriter(output_path, table.schema)
+                    writer.write_table(table.cast(writer.schema))
+            finally:
+                if writer is not None:
+                    writer.close()
+
+            return summary
+
+        except Exception as e:
+            raise CustomException(e, sys) from e
@@ -0,0 +1,253 @@
+import os
+import sys
+import threading
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.constants.paths import (
+    ARTIFACTS_DIR,
+    FEATURE_STORE_DIR,
+    FEATURE_STORE_MANIFEST_FILE,
+    FEATURE_STORE_VALUES_FILE,
+)
+from src.utils.helper import load_json, save_json
+
+logger = get_logger(__name__)
+
+DTYPE = np.float32
+ONE_DAY = pd.Timedelta(days=1)
+
+
+class FeatureStore:
+    """
+    Versioned store of daily feature matrices.
+
+    Each feature set is a directory holding a raw float32 row-major file
+    (one row per calendar day, no gaps) and ``manifest.json`` with the
+    schema, row count, date range and version. Rows are located by date
+    arithmetic, and reads return ``np.memmap`` views, so fetching the last
+    ``seq_length`` days touches only those rows.
+
+    Writers append rows first and then replace the manifest atomically;
+    readers only map the rows the manifest they read declares, so they
+    never see a partially written day. ``write`` puts each version in a
+    new values file named by the manifest, so a reader holding the old
+    manifest keeps mapping the old file, never rows of another layout.
+
+    Usage:
+        store = FeatureStore()
+        store.write("daily_features", frame)          # DatetimeIndex, daily
+        store.append("daily_features", new_days)
+        dates, values = store.tail("daily_features", 7)
+    """
+
+    def __init__(self, root: str = os.path.join(ARTIFACTS_DIR, FEATURE_STORE_DIR)):
+        self.root = root
+        self._lock = threading.Lock()
+
+    # ----------------------------------------------------------------
+    # Paths / manifest
+    # ----------------------------------------------------------------
+    def _dir(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+    @staticmethod
+    def _values_file(version: int) -> str:
+        stem, extension = os.path.splitext(FEATURE_STORE_VALUES_FILE)
+        return f"{stem}.v{version}{extension}"
+
+    def _values_path(self, manifest: dict) -> str:
+        # Manifests written before versioned files name no file
+        return os.path.join(self._dir(manifest["name"]), manifest.get("values_file", FEATURE_STORE_VALUES_FILE))
+
+    def _manifest_path(self, name: str) -> str:
+        return os.path.join(self._dir(name), FEATURE_STORE_MANIFEST_FILE)
+
+    def manifest(self, name: str) -> Optional[dict]:
+        return load_json(self._manifest_path(name))
+
+    def exists(self, name: str) -> bool:
+        return self.manifest(name) is not None
+
+    # ----------------------------------------------------------------
+    # Writes
+    # ----------------------------------------------------------------
+    @staticmethod
+    def _validate(frame: pd.DataFrame) -> pd.DatetimeIndex:
+        index = pd.DatetimeIndex(frame.index)
+        if len(index) and not (index == pd.date_range(index[0], periods=len(index), freq="D")).all():
+            raise ValueError("Feature frames must have a contiguous daily DatetimeIndex")
+        return index
+
+    def write(self, name: str, frame: pd.DataFrame, metadata: dict = None) -> dict:
+        """Replace the feature set ``name`` with ``frame`` (new version)."""
+        try:
+            index = self._validate(frame)
+            values = np.ascontiguousarray(frame.to_numpy(dtype=DTYPE))
+
+            with self._lock:
+                previous = self.manifest(name) or {}
+                os.makedirs(self._dir(name), exist_ok=True)
+                version = previous.get("version", 0) + 1
+
+                manifest = {
+                    "name": name,
+                    "version": version,
+                    "values_file": self._values_file(version),
+                    "dtype": np.dtype(DTYPE).name,
+                    "columns": [str(c) for c in frame.columns],
+                    "rows": int(len(values)),
+                    "start_date": index[0].strftime("%Y-%m-%d") if len(index) else None,
+                    "end_date": index[-1].strftime("%Y-%m-%d") if len(index) else None,
+                    "metadata": metadata if metadata is not None else previous.get("metadata", {}),
+                    "updated_at": datetime.now().isoformat(timespec="seconds"),
+                }
+                tmp_path = self._values_path(manifest) + ".tmp"
+                values.tofile(tmp_path)
+                os.replace(tmp_path, self._values_path(manifest))
+                save_json(self._manifest_path(name), manifest)
+
+                # Readers that already mapped the old file keep their mapping
+                if previous and self._values_path(previous) != self._values_path(manifest):
+                    try:
+                        os.remove(self._values_path(previous))
+                    except FileNotFoundError:
+                        pass
+
+            logger.info("Feature set written | name=%s version=%s rows=%s", name, manifest["version"], manifest["rows"])
+            return manifest
+
+        except Exception as e:
+            raise CustomException(e, sys) from e
+
+    def append(self, name: str, frame: pd.DataFrame) -> dict:
+        """
+        Add new days to ``name``. Days that already exist (e.g. a partial
+        last day) are overwritten in place; new days are appended. The
+        frame must start no later than the day after the stored end date.
+        """
+        try:
+            manifest = self.manifest(name)
+            if manifest is None or not manifest["rows"]:
+                return self.write(name, frame)
+
+            if [str(c) for c in frame.columns] != manifest["columns"]:
+                raise ValueError(f"Schema mismatch for feature set {name}")
+
+            index = self._validate(frame)
+            if not len(index):
+                return manifest
+
+            start = pd.Timestamp(manifest["start_date"])
+            end = pd.Timestamp(manifest["end_date"])
+            if index[0] > end + ONE_DAY:
+                raise ValueError(f"Gap between stored end {end.date()} and appended start {index[0].date()}")
+            if index[0] < start:
+                raise ValueError(f"Appended rows start before the stored range ({start.date()})")
+
+            values = np.ascontiguousarray(frame.to_numpy(dtype=DTYPE))
+            first_row = (index[0] - start).days
+            n_overlap = max(0, min(manifest["rows"] - first_row, len(values)))
+
+            with self._lock:
+                if n_overlap:
+                    stored = np.memmap(self._values_path(manifest), dtype=DTYPE, mode="r+",
+                                       shape=(manifest["rows"], len(manifest["columns"])))
+                    stored[first_row:first_row + n_overlap] = values[:n_overlap]
+                    stored.flush()
+                    del stored
+
+                with open(self._values_path(manifest), "ab") as f:
+                    f.write(values[n_overlap:].tobytes())
+
+                manifest = {
+                    **manifest,
+                    "version": manifest["version"] + 1,
+                    "rows": manifest["rows"] + len(values) - n_overlap,
+                    "end_date": max(end, index[-1]).strftime("%Y-%m-%d"),
+                    "updated_at": datetime.now().isoformat(timespec="seconds"),
+                }
+                save_json(self._manifest_path(name), manifest)
+
+            logger.info(
+                "Feature set appended | name=%s version=%s new_rows=%s updated_rows=%s",
+                name, manifest["version"], len(values) - n_overlap, n_overlap,
+            )
+            return manifest
+
+        except Exception as e:
+            raise CustomException(e, sys) from e
+
+    # ----------------------------------------------------------------
+    # Reads
+    # ----------------------------------------------------------------
+    def _map(self, manifest: dict) -> np.memmap:
+        return np.memmap(
+            self._values_path(manifest),
+            dtype=DTYPE,
+            mode="r",
+            shape=(manifest["rows"], len(manifest["columns"])),
+        )
+
+    def _mapped(self, name: str, attempts: int = 3) -> Tuple[dict, Optional[np.memmap]]:
+        """Manifest of ``name`` and its values (``None`` when empty)."""
+        for attempt in range(attempts):
+            manifest = self.manifest(name)
+            if manifest is None:
+                raise FileNotFoundError(f"Feature set not found: {name}")
+            if not manifest["rows"]:
+                return manifest, None
+            try:
+                return manifest, self._map(manifest)
+            except FileNotFoundError:
+                # A write replaced the version between the two reads
+                if attempt == attempts - 1:
+                    raise
+
+    def read(self, name: str, start=None, end=None,
+             columns: List[str] = None) -> Tuple[pd.DatetimeIndex, np.ndarray]:
+        """
+        Rows with ``start <= date <= end`` (inclusive, either optional).
+
+        Without ``columns`` the values are a read-only view onto the file;
+        selecting columns copies only the requested rows.
+        """
+        manifest, stored = self._mapped(name)
+        if stored is None:
+            return pd.DatetimeIndex([]), np.empty((0, len(manifest["columns"])), dtype=DTYPE)
+
+        first = pd.Timestamp(manifest["start_date"])
+        lo = 0 if start is None else max(0, (pd.Timestamp(start).normalize() - first).days)
+        hi = manifest["rows"] if end is None else min(manifest["rows"], (pd.Timestamp(end).normalize() - first).days + 1)
+        hi = max(lo, hi)
+
+        values = stored[lo:hi]
+        if columns is not None:
+            positions = [manifest["columns"].index(c) for c in columns]
+            values = np.asarray(values[:, positions])
+
+        dates = pd.date_range(first + lo * ONE_DAY, periods=hi - lo, freq="D")
+        return dates, values
+
+    def tail(self, name: str, n: int, columns: List[str] = None) -> Tuple[pd.DatetimeIndex, np.ndarray]:
+        """Last ``n`` days without reading the rest of the history."""
+        manifest = self.manifest(name)
+        if manifest is None:
+            raise FileNotFoundError(f"Feature set not found: {name}")
+
+        start = pd.Timestamp(manifest["end_date"]) - (n - 1) * ONE_DAY if manifest["rows"] else None
+        return self.read(name, start=start, columns=columns)
+
+    def read_frame(self, name: str, start=None, end=None, columns: List[str] = None) -> pd.DataFrame:
+        dates, values = self.read(name, start, end, columns)
+        return pd.DataFrame(
+            values,
+            index=pd.DatetimeIndex(dates, name="DATE"),
+            columns=columns or self.manifest(name)["columns"],
+            copy=False,
+        )
@@ -0,0 +1,264 @@
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pymongo import ASCENDING, IndexModel, MongoClient, ReplaceOne
+from pymongo.errors import BulkWriteError
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.entities.component_config_entity import DocumentDBConfig, parquet_path
+from src.entities.artifact_entity import DataIngestionArtifact, DocumentSyncArtifact
+from src.database.relational_db import blank_to_null, sql_name
+from src.utils.helper import save_json
+
+logger = get_logger(__name__)
+
+
+class DocumentDB:
+    """
+    Complaint documents in MongoDB, one per complaint number. Rows with
+    a blank number have no key field; their ``_id`` is a fingerprint of
+    the row's content and its occurrence in the load, so they are
+    upserted too.
+
+    Field names follow the relational store (``CLOSED/OPEN`` ->
+    ``closed_open``) and ``date`` is a BSON date, so range filters use the
+    compound indexes. Rows are written as unordered ``bulk_write``
+    batches: a bad document fails alone while the server applies the
+    rest of its batch, and replaying a load only rewrites the same
+    documents. Reads always project, by default to the dashboard fields.
+
+    A ``client`` (e.g. ``mongomock.MongoClient()``) may be passed in;
+    otherwise one is opened lazily from ``config.uri``.
+    """
+
+    def __init__(self, config: DocumentDBConfig = None, client: MongoClient = None):
+        self.config = config or DocumentDBConfig()
+        self._client = client
+
+    @property
+    def client(self) -> MongoClient:
+        if self._client is None:
+            self._client = MongoClient(self.config.uri, serverSelectionTimeoutMS=self.config.server_timeout_ms)
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    @property
+    def collection(self):
+        return self.client[self.config.database_name][self.config.collection_name]
+
+    @property
+    def key_field(self) -> Optional[str]:
+        return sql_name(self.config.upsert_key) if self.config.upsert_key else None
+
+    def ensure_indexes(self) -> List[str]:
+        """Create the unique key index and the dashboard compound indexes (no-op if present)."""
+        cfg = self.config
+        models = [
+            IndexModel([(sql_name(name), direction) for name, direction in index])
+            for index in cfg.indexes
+        ]
+        if self.key_field:
+            models.append(IndexModel(
+                [(self.key_field, ASCENDING)],
+                unique=True,
+                # Blank keys are dropped from their documents, so they stay out of the index
+                sparse=True,
+            ))
+        return self.collection.create_indexes(models)
+
+    # ----------------------------------------------------------------
+    # Writes
+    # ----------------------------------------------------------------
+    def _documents(self, batch: pa.RecordBatch) -> List[dict]:
+        """Documents of an Arrow batch, without null fields."""
+        columns = {}
+        for name, array in zip(batch.schema.names, batch.columns):
+            if name == self.config.date_column:
+                if not pa.types.is_timestamp(array.type):
+                    array = array.cast(pa.timestamp("us"))
+            else:
+                if not pa.types.is_string(array.type):
+                    array = array.cast(pa.string())
+                if name == self.config.upsert_key:
+                    # Blank keys would all match one document; drop them instead
+                    array = blank_to_null(array)
+            columns[sql_name(name)] = array.to_pylist()
+
+        fields = list(columns)
+        return [
+            {field: value for field, value in zip(fields, values) if value is not None}
+            for values in zip(*columns.values())
+        ]
+
+    @staticmethod
+    def _fingerprints(batch: pa.RecordBatch) -> np.ndarray:
+        """64-bit hash of each row's values."""
+        return pd.util.hash_pandas_object(batch.to_pandas(), index=False).to_numpy(dtype=np.uint64)
+
+    def _operations(self, documents: List[dict], fingerprints: np.ndarray, occurrences: Dict[int, int]) -> list:
+        """
+        Upserts by key; keyless rows by their fingerprint and how often it
+        occurred before in this load (``occurrences``), so identical rows
+        stay apart and a replay matches each one again.
+        """
+        key = self.key_field
+        operations = []
+        for doc, fingerprint in zip(documents, fingerprints.tolist()):
+            if key and key in doc:
+                operations.append(ReplaceOne({key: doc[key]}, doc, upsert=True))
+                continue
+            seen = occurrences.get(fingerprint, 0)
+            occurrences[fingerprint] = seen + 1
+            doc["_id"] = f"row-{fingerprint:016x}-{seen}"
+            operations.append(ReplaceOne({"_id": doc["_id"]}, doc, upsert=True))
+        return operations
+
+    def write_batches(self, batches: Iterable[pa.RecordBatch]) -> dict:
+        """
+        Upsert the rows of Arrow batches with unordered ``bulk_write``
+        calls of ``batch_size`` operations.
+
+        Returns
+        -------
+        dict
+            Documents written, upserted / modified / inserted counts,
+            per-document errors and throughput.
+        """
+        try:
+            cfg = self.config
+            start = time.perf_counter()
+            self.ensure_indexes()
+
+            totals = {"documents": 0, "inserted": 0, "upserted": 0, "matched": 0, "modified": 0,
+                      "errors": 0, "requests": 0}
+            first_errors: List[dict] = []
+            occurrences: Dict[int, int] = {}
+
+            for batch in batches:
+                operations = self._operations(self._documents(batch), self._fingerprints(batch), occurrences)
+                for offset in range(0, len(operations), cfg.batch_size):
+                    chunk = operations[offset:offset + cfg.batch_size]
+                    try:
+                        result = self.collection.bulk_write(chunk, ordered=False).bulk_api_result
+                    except BulkWriteError as e:
+                        # Unordered: everything but the failed documents was applied
+                        result = e.details
+                        first_errors.extend(
+                            {"index": offset + err["index"], "code": err.get("code"), "message": err.get("errmsg")}
+                            for err in result.get("writeErrors", [])[:max(0, 10 - len(first_errors))]
+                        )
+                        totals["errors"] += len(result.get("writeErrors", []))
+
+                    totals["inserted"] += result.get("nInserted", 0)
+                    totals["upserted"] += result.get("nUpserted", 0)
+                    totals["matched"] += result.get("nMatched", 0)
+                    totals["modified"] += result.get("nModified", 0)
+                    totals["requests"] += 1
+                totals["documents"] += len(operations)
+
+            seconds = time.perf_counter() - start
+            stats = {
+                **totals,
+                "batch_size": cfg.batch_size,
+                "seconds": round(seconds, 3),
+                "docs_per_second": round(totals["documents"] / seconds, 1) if seconds > 0 else None,
+                "first_errors": first_errors,
+            }
+            logger.info(
+                "Document store bulk write | documents=%s upserted=%s modified=%s errors=%s docs/s=%s",
+                stats["documents"], stats["upserted"], stats["modified"], stats["errors"], stats["docs_per_second"],
+            )
+            return stats
+
+        except Exception as e:
+            raise CustomException(e, sys) from e
+
+    def write_parquet(self, path: str, read_batch_rows: int = 50_000) -> dict:
+        return self.write_batches(pq.ParquetFile(path).iter_batches(batch_size=read_batch_rows))
+
+    def initiate_document_sync(self, ingestion_artifact: DataIngestionArtifact) -> DocumentSyncArtifact:
+        """Sync the processed Parquet of the ingestion stage into the collection."""
+        try:
+            cfg = self.config
+            stats = self.write_parquet(parquet_path(ingestion_artifact.processed_file_path))
+            save_json(cfg.report_file_path, {
+                "synced_at": datetime.now().isoformat(timespec="seconds"),
+                "database": cfg.database_name,
+                "collection": cfg.collection_name,
+                "source_sha256": ingestion_artifact.source_sha256,
+                **stats,
+            })
+
+            return DocumentSyncArtifact(
+                database_name=cfg.database_name,
+                collection_name=cfg.collection_name,
+                report_file_path=cfg.report_file_path,
+                documents=stats["documents"],
+                upserted=stats["upserted"],
+                modified=stats["modified"],
+                errors=stats["errors"],
+                docs_per_second=stats["docs_per_second"],
+            )
+
+        except Exception as e:
+            raise CustomException(e, sys) from e
+
+    # ----------------------------------------------------------------
+    # Reads
+    # ----------------------------------------------------------------
+    def _filter(self, filters: Optional[Dict[str, object]], start: Optional[str], end: Optional[str]) -> dict:
+        """Equality (or ``$in`` for lists) per source column, plus a date range."""
+        query = {}
+        for name, value in (filters or {}).items():
+            query[sql_name(name)] = {"$in": list(value)} if isinstance(value, (list, tuple, set)) else value
+
+        date_range = {}
+        if start:
+            date_range["$gte"] = pd.Timestamp(start).to_pydatetime()
+        if end:
+            date_range["$lt"] = (pd.Timestamp(end) + pd.Timedelta(days=1)).to_pydatetime()
+        if date_range:
+            query[sql_name(self.config.date_column)] = date_range
+        return query
+
+    def find(self, filters: Optional[Dict[str, object]] = None, fields: Optional[List[str]] = None,
+             start: Optional[str] = None, end: Optional[str] = None, limit: int = 100, skip: int = 0,
+             descending: bool = True) -> pd.DataFrame:
+        """
+        Complaints matching ``filters`` (source column -> value or list)
+        between ``start`` and ``end``, newest first, with only ``fields``
+        (``default_fields`` when omitted) fetched from the server.
+        """
+        try:
+            fields = list(fields or self.config.default_fields)
+            projection = {"_id": 0, **{sql_name(name): 1 for name in fields}}
+            cursor = (
+                self.collection.find(self._filter(filters, start, end), projection)
+                .sort(sql_name(self.config.date_column), -1 if descending else 1)
+                .skip(int(skip))
+                .limit(int(limit))
+            )
+            df = pd.DataFrame(list(cursor), columns=[sql_name(name) for name in fields])
+            df.columns = fields
+            return df
+
+        except Exception as e:
+            raise CustomException(e, sys) from e
+
+    def count(self, filters: Optional[Dict[str, object]] = None,
+              start: Optional[str] = None, end: Optional[str] = None) -> int:
+        try:
+            return int(self.collection.count_documents(self._filter(filters, start, end)))
+        except Exception as e:
+            raise CustomException(e, sys) from e
@@ -0,0 +1,528 @@
+import os
+import re
+import sys
+import json
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.entities.component_config_entity import RelationalDBConfig, parquet_path
+from src.entities.artifact_entity import DataIngestionArtifact, DatabaseLoadArtifact
+from src.utils.helper import load_json, save_json
+from src.utils.ingesation_helper import iter_source_chunks, normalise_chunk, source_version
+
+logger = get_logger(__name__)
+
+META_TABLE = "source_meta"
+
+
+def sql_name(column: str) -> str:
+    """SQL identifier for a source column: ``CLOSED/OPEN`` -> ``closed_open``."""
+    name = re.sub(r"[^0-9a-zA-Z]+", "_", str(column).strip()).strip("_").lower()
+    return name if name and not name[0].isdigit() else f"c_{name}"
+
+
+def quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def blank_to_null(array: pa.Array) -> pa.Array:
+    """Null for blank / whitespace-only strings: such keys identify nothing."""
+    blank = pc.equal(pc.utf8_trim_whitespace(array), "")
+    return pc.if_else(blank, pa.scalar(None, array.type), array)
+
+
+class RelationalDB:
+    """
+    Embedded SQLite store of complaint rows, the serving source of truth
+    for the report endpoints.
+
+    The table mirrors the source dataset: ``DATE`` is stored as an ISO
+    ``YYYY-MM-DD HH:MM:SS`` string (so text order is time order) and every
+    other column as trimmed text, with a B-tree index on each of
+    ``index_columns``. Reports are aggregate queries that SQLite answers
+    from those indexes, so a request never parses the Excel file.
+
+    ``sync`` rebuilds the table when the source's size or modification
+    time differs from the stamp stored with the data; rows can also be
+    bulk loaded from the ingestion stage (see ``bulk_load``).
+    """
+
+    def __init__(self, config: RelationalDBConfig = None, pool=None):
+        self.config = config or RelationalDBConfig()
+        # Optional ConnectionPool (see database_integration); without one
+        # every query opens its own connection
+        self.pool = pool
+        self._lock = threading.RLock()
+        self._meta: Optional[dict] = None
+        self._meta_stamp: Optional[tuple] = None
+
+    # ----------------------------------------------------------------
+    # Connections
+    # ----------------------------------------------------------------
+    def connect(self) -> sqlite3.Connection:
+        os.makedirs(self.config.database_dir, exist_ok=True)
+        connection = sqlite3.connect(
+            self.config.db_file_path,
+            check_same_thread=False,
+            cached_statements=self.config.pool.statement_cache_size,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA temp_store=MEMORY")
+        return connection
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        if self.pool is not None:
+            with self.pool.connection() as connection:
+                yield connection
+            return
+
+        with closing(self.connect()) as connection:
+            yield connection
+
+    def query(self, sql: str, params: Sequence = ()) -> List[tuple]:
+        with self.connection() as connection:
+            return connection.execute(sql, params).fetchall()
+
+    # ----------------------------------------------------------------
+    # Source metadata
+    # ----------------------------------------------------------------
+    def _file_stamp(self) -> tuple:
+        """Identity, size and mtime of the database file and its WAL."""
+        stamp = []
+        for path in (self.config.db_file_path, f"{self.config.db_file_path}-wal"):
+            try:
+                stat = os.stat(path)
+                stamp.append((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+            except FileNotFoundError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    @property
+    def meta(self) -> dict:
+        """
+        Source stamp and column mapping of the loaded data ({} if empty),
+        re-read whenever the database file changed, e.g. after a load by
+        another process.
+        """
+        stamp = self._file_stamp()
+        if self._meta is None or stamp != self._meta_stamp:
+            try:
+                rows = self.query(f"SELECT key, value FROM {META_TABLE}")
+            except sqlite3.OperationalError:
+                rows = []
+            self._meta = {key: json.loads(value) for key, value in rows}
+            self._meta_stamp = stamp
+        return self._meta
+
+    @property
+    def columns(self) -> Dict[str, str]:
+        """Source column name -> SQL column name, in source order."""
+        return dict(self.meta.get("columns", []))
+
+    def column(self, name: str) -> str:
+        try:
+            return quote(self.columns[name])
+        except KeyError:
+            raise ValueError(f"Unknown column: {name}") from None
+
+    def is_current(self, source_path: str) -> bool:
+        loaded = self.meta.get("source")
+        version = source_version(source_path)
+        return (
+            bool(loaded)
+            and loaded["size"] == version["size"]
+            and loaded["mtime_ns"] == version["mtime_ns"]
+            and self.meta.get("deduplicate") == self.config.deduplicate
+        )
+
+    # ----------------------------------------------------------------
+    # Bulk load
+    # ----------------------------------------------------------------
+    def _batch_rows(self, batch: pa.RecordBatch, columns: List[Tuple[str, str]]) -> List[tuple]:
+        """Row tuples for ``executemany``, converted column by column from an Arrow batch."""
+        values = []
+        for name, _ in columns:
+            index = batch.schema.get_field_index(name)
+            if index < 0:
+                values.append([None] * batch.num_rows)
+                continue
+            array = batch.column(index)
+            if name == self.config.date_column:
+                if not pa.types.is_timestamp(array.type):
+                    array = array.cast(pa.timestamp("us"))
+                array = pc.strftime(array, format="%Y-%m-%d %H:%M:%S")
+            else:
+                if not pa.types.is_string(array.type):
+                    array = array.cast(pa.string())
+                if name == self.config.upsert_key:
+                    # NULL keys never collide
+                    array = blank_to_null(array)
+            values.append(array.to_pylist())
+        return list(zip(*values))
+
+    @staticmethod
+    def _digits_only(array: pa.Array) -> bool:
+        if pa.types.is_integer(array.type):
+            return True
+        if not (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+            return False
+        return pc.all(pc.match_substring_regex(array, r"^\d+$")).as_py() is not False
+
+    def _insert_sql(self, table: str, columns: List[Tuple[str, str]], upsert: bool) -> str:
+        names = [quote(sql) for _, sql in columns]
+        statement = f"INSERT INTO {quote(table)} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})"
+        key = dict(columns).get(self.config.upsert_key)
+        if upsert and key:
+            # The target has to repeat the partial unique index's condition
+            updates = ", ".join(f"{name} = excluded.{name}" for name in names if name != quote(key))
+            statement += f" ON CONFLICT({quote(key)}) WHERE {quote(key)} IS NOT NULL DO UPDATE SET {updates}"
+        return statement
+
+    def _create_indexes(self, connection: sqlite3.Connection, columns: List[Tuple[str, str]]) -> None:
+        cfg = self.config
+        table, mapping = quote(cfg.table), dict(columns)
+        key = mapping.get(cfg.upsert_key) if cfg.deduplicate else None
+        if key:
+            connection.execute(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS {quote(f'uq_{cfg.table}_{key}')} ON {table} ({quote(key)}) "
+                f"WHERE {quote(key)} IS NOT NULL"
+            )
+        for name in cfg.index_columns:
+            sql = mapping.get(name)
+            if sql is not None and sql != key:
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {quote(f'idx_{cfg.table}_{sql}')} ON {table} ({quote(sql)})"
+                )
+
+    def bulk_load(self, batches: Iterable[pa.RecordBatch], mode: str = "replace",
+                  source: Optional[dict] = None) -> dict:
+        """
+        Write columnar batches with one prepared ``executemany`` per batch,
+        committing every ``transaction_rows`` rows.
+
+        ``replace`` is the backfill path: rows go into an unindexed staging
+        table and one final transaction builds the indexes and swaps the
+        staging table in, so readers keep the previous rows until then.
+        Every row is kept; with ``deduplicate``, repeated non-blank
+        ``upsert_key`` values are dropped first (the last row wins).
+        ``upsert`` (needs ``deduplicate``) writes into the live table with
+        ``ON CONFLICT`` on ``upsert_key``, so replaying keyed rows is a
+        no-op (rows without a key cannot be matched and are appended); it
+        falls back to ``replace`` while the table does not exist or was
+        built without deduplication.
+
+        Returns
+        -------
+        dict
+            Row counts, transactions and throughput (``rows_per_second``).
+        """
+        if mode not in ("replace", "upsert"):
+            raise ValueError(f"Unknown load mode: {mode}")
+        if mode == "upsert" and not (self.config.deduplicate and self.config.upsert_key):
+            raise ValueError("Upserts need a unique key: set deduplicate and upsert_key")
+
+        try:
+            cfg = self.config
+            start = time.perf_counter()
+
+            # Own connection: the load changes its settings and holds it throughout
+            with self._lock, closing(self.connect()) as connection:
+                connection.isolation_level = None  # transactions are explicit below
+                previous = self.meta if self._table_exists(connection, cfg.table) else {}
+                if mode == "upsert" and not previous.get("deduplicate"):
+                    mode = "replace"
+
+                columns = previous.get("columns") if mode == "upsert" else None
+                numeric = {name: name in previous.get("numeric_columns", []) for name, _ in columns or []}
+                target = cfg.table if mode == "upsert" else f"{cfg.table}__staging"
+                before = self.row_count() if mode == "upsert" else 0
+                insert = self._insert_sql(target, columns, upsert=True) if columns else None
+
+                if mode == "replace":
+                    # The staging table is disposable until the swap commits
+                    connection.execute("PRAGMA synchronous=OFF")
+                    connection.execute(f"DROP TABLE IF EXISTS {quote(target)}")
+
+                rows, pending, transactions = 0, 0, 0
+                connection.execute("BEGIN")
+                try:
+                    for batch in batches:
+                        if columns is None:
+                            columns = [(name, sql_name(name)) for name in batch.schema.names]
+                            definitions = ", ".join(f"{quote(sql)} TEXT" for _, sql in columns)
+                            connection.execute(f"CREATE TABLE {quote(target)} (id INTEGER PRIMARY KEY, {definitions})")
+                            insert = self._insert_sql(target, columns, upsert=False)
+                        else:
+                            unknown = set(batch.schema.names) - {name for name, _ in columns}
+                            if unknown:
+                                raise ValueError(f"Columns not in the store: {sorted(unknown)}")
+
+                        for name, _ in columns:
+                            index = batch.schema.get_field_index(name)
+                            if name != cfg.date_column and index >= 0:
+                                # Digit-only columns sort numerically in page queries
+                                numeric[name] = numeric.get(name, True) and self._digits_only(batch.column(index))
+
+                        connection.executemany(insert, self._batch_rows(batch, columns))
+                        rows += batch.num_rows
+                        pending += batch.num_rows
+
+                        if pending >= cfg.transaction_rows:
+                            connection.execute("COMMIT")
+                            connection.execute("BEGIN")
+                            transactions += 1
+                            pending = 0
+
+                    if columns is None:
+                        raise ValueError("No rows to load")
+
+                    key = dict(columns).get(cfg.upsert_key)
+                    if mode == "replace":
+                        if key and cfg.deduplicate:
+                            connection.execute(
+                                f"DELETE FROM {quote(target)} WHERE {quote(key)} IS NOT NULL AND id NOT IN "
+                                f"(SELECT MAX(id) FROM {quote(target)} WHERE {quote(key)} IS NOT NULL "
+                                f"GROUP BY {quote(key)})"
+                            )
+                        connection.execute(f"DROP TABLE IF EXISTS {quote(cfg.table)}")
+                        connection.execute(f"ALTER TABLE {quote(target)} RENAME TO {quote(cfg.table)}")
+                        self._create_indexes(connection, columns)
+
+                    table_rows = int(connection.execute(f"SELECT COUNT(*) FROM {quote(cfg.table)}").fetchone()[0])
+                    meta = {
+                        "source": source or previous.get("source"),
+                        "columns": [list(column) for column in columns],
+                        "numeric_columns": [name for name, is_numeric in numeric.items() if is_numeric],
+                        "rows": table_rows,
+                        "deduplicate": cfg.deduplicate,
+                        "loaded_at": datetime.now().isoformat(timespec="seconds"),
+                    }
+                    connection.execute(f"CREATE TABLE IF NOT EXISTS {META_TABLE} (key TEXT PRIMARY KEY, value TEXT)")
+                    connection.execute(f"DELETE FROM {META_TABLE}")
+                    connection.executemany(
+                        f"INSERT INTO {META_TABLE} (key, value) VALUES (?, ?)",
+                        [(k, json.dumps(v)) for k, v in meta.items()],
+                    )
+                    connection.execute("COMMIT")
+                    transactions += 1
+
+                except BaseException:
+                    if connection.in_transaction:
+                        connection.execute("ROLLBACK")
+                    raise
+
+                if mode == "replace":
+                    connection.execute("ANALYZE")
+                self._meta, self._meta_stamp = meta, self._file_stamp()
+
+            seconds = time.perf_counter() - start
+            inserted = table_rows - before
+            stats = {
+                "mode": mode,
+                "rows": rows,
+                "inserted": inserted,
+                "updated": rows - inserted if mode == "upsert" else 0,
+                "duplicates_dropped": rows - table_rows if mode == "replace" else 0,
+                "table_rows": table_rows,
+                "transactions": transactions,
+                "seconds": round(seconds, 3),
+                "rows_per_second": round(rows / seconds, 1) if seconds > 0 else None,
+            }
+            logger.info(
+                "Relational store bulk load | mode=%s rows=%s inserted=%s updated=%s rows/s=%s",
+                mode, rows, stats["inserted"], stats["updated"], stats["rows_per_second"],
+            )
+            return stats
+
+        except Exception as e:
+            raise CustomException(e, sys) from e
+
+    @staticmethod
+    def _table_exists(connection: sqlite3.Connection, name: str = META_TABLE) -> bool:
+        return connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+        ).fetchone() is not None
+
+    def _source_batches(self, source_path: str) -> Iterator[pa.RecordBatch]:
+        for chunk in iter_source_chunks(source_path, self.config.chunksize):
+            chunk = normalise_chunk(chunk, self.config.date_column)
+            yield pa.RecordBatch.from_pandas(chunk, preserve_index=False)
+
+    def load(self, source_path: str) -> dict:
+        """Replace the table with the rows of a source file (CSV, Parquet or Excel)."""
+        return self.bulk_load(self._source_batches(source_path), mode="replace", source=source_version(source_path))
+
+    def load_parquet(self, path: str, mode: str = "replace", source: Optional[dict] = None) -> dict:
+        """Bulk load a Parquet file, one record batch of ``chunksize`` rows at a time."""
+        return self.bulk_load(pq.ParquetFile(path).iter_batches(batch_size=self.config.chunksize), mode, source)
+
+    def initiate_bulk_load(self, ingestion_artifact: DataIngestionArtifact, mode: str = "replace") -> DatabaseLoadArtifact:
+        """
+        Load the processed Parquet of the ingestion stage. The store is
+        stamped with the ingestion source, so API requests against the
+        same dataset serve these rows without a rebuild.
+        """
+        try:
+            metadata = load_json(ingestion_artifact.metadata_file_path, default={})
+            source = {k: v for k, v in metadata.get("source", {}).items() if k != "sha256"} or None
+
+            stats = self.load_parquet(parquet_path(ingestion_artifact.processed_file_path), mode, source)
+            save_json(self.config.load_report_file_path, {
+                "loaded_at": self.meta["loaded_at"],
+                "source_sha256": ingestion_artifact.source_sha256,
+                **stats,
+            })
+
+            return DatabaseLoadArtifact(
+                db_file_path=self.config.db_file_path,
+                report_file_path=self.config.load_report_file_path,
+                mode=stats["mode"],
+                rows=stats["rows"],
+                inserted=stats["inserted"],
+                updated=stats["updated"],
+                rows_per_second=stats["rows_per_second"],
+            )
+
+        except Exception as e:
+            raise CustomException(e, sys) from e
+
+    def sync(self, source_path: str) -> "RelationalDB":
+        """Load ``source_path`` if the stored rows are missing or stale."""
+        if not os.path.exists(source_path):
+            raise FileNotFoundError(f"Dataset file not found: {source_path}")
+        if not self.is_current(source_path):
+            with self._lock:
+                if not self.is_current(source_path):
+                    logger.info("Relational store stale or missing, rebuilding | source=%s", source_path)
+                    self.load(source_path)
+        return self
+
+    # ----------------------------------------------------------------
+    # Aggregates
+    # ----------------------------------------------------------------
+    def row_count(self) -> int:
+        return int(self.query(f"SELECT COUNT(*) FROM {quote(self.config.table)}")[0][0])
+
+    def null_counts(self) -> pd.Series:
+        """Missing values per source column, in one table scan."""
+        columns = self.columns
+        sums = ", ".join(f"SUM({quote(sql)} IS NULL)" for sql in columns.values())
+        counts = self.query(f"SELECT {sums} FROM {quote(self.config.table)}")[0]
+        return pd.Series([int(c or 0) for c in counts], index=list(columns), dtype="int64")
+
+    def value_counts(self, column: str, min_count: int = 1) -> pd.Series:
+        """Non-null values of ``column`` and their counts, most frequent first."""
+        sql = self.column(column)
+        rows = self.query(
+            f"SELECT {sql}, COUNT(*) AS n FROM {quote(self.config.table)} WHERE {sql} IS NOT NULL "
+            f"GROUP BY {sql} HAVING n >= ? ORDER BY n DESC, {sql}",
+            (min_count,),
+        )
+        return pd.Series(
+            [n for _, n in rows], index=pd.Index([v for v, _ in rows], name=column), name="count", dtype="int64"
+        )
+
+    def count_where(self, column: str, value: Optional[str] = None, negate: bool = False) -> int:
+        """Non-null ``column`` values (equal to / different from ``value`` when given)."""
+        sql = self.column(column)
+        where, params = f"{sql} IS NOT NULL", ()
+        if value is not None:
+            where += f" AND {sql} {'!=' if negate else '='} ?"
+            params = (value,)
+        return int(self.query(f"SELECT COUNT(*) FROM {quote(self.config.table)} WHERE {where}", params)[0][0])
+
+    def group_counts(self, columns: List[str], count_column: Optional[str] = None) -> pd.DataFrame:
+        """
+        Row counts per combination of ``columns`` (nulls kept as a group).
+        With ``count_column`` only its non-null values are counted.
+        """
+        keys = [self.column(c) for c in columns]
+        counted = f"COUNT({self.column(count_column)})" if count_column else "COUNT(*)"
+        rows = self.query(
+            f"SELECT {', '.join(keys)}, {counted} FROM {quote(self.config.table)} GROUP BY {', '.join(keys)}"
+        )
+        return pd.DataFrame(rows, columns=[*columns, "count"])
+
+    def date_range(self) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]:
+        date = self.column(self.config.date_column)
+        low, high = self.query(f"SELECT MIN({date}), MAX({date}) FROM {quote(self.config.table)}")[0]
+        return (pd.Timestamp(low) if low else None), (pd.Timestamp(high) if high else None)
+
+    def daily_counts(self, start: Optional[str] = None, end: Optional[str] = None) -> pd.Series:
+        """Complaints per calendar day between ``start`` and ``end`` (inclusive)."""
+        date = self.column(self.config.date_column)
+        where, params = [f"{date} IS NOT NULL"], []
+        if start:
+            where.append(f"{date} >= ?")
+            params.append(pd.Timestamp(start).strftime("%Y-%m-%d"))
+        if end:
+            where.append(f"{date} < ?")
+            params.append((pd.Timestamp(end) + pd.Timedelta(days=1)).strftime("%Y-%m-%d"))
+
+        rows = self.query(
+            f"SELECT substr({date}, 1, 10) AS day, COUNT(*) FROM {quote(self.config.table)} "
+            f"WHERE {' AND '.join(where)} GROUP BY day ORDER BY day",
+            params,
+        )
+        return pd.Series(
+            [n for _, n in rows], index=pd.DatetimeIndex([d for d, _ in rows], name=self.config.date_column),
+            dtype="int64",
+        )
+
+    # ----------------------------------------------------------------
+    # Rows
+    # ----------------------------------------------------------------
+    def _frame(self, rows: List[tuple], columns: List[str]) -> pd.DataFrame:
+        df = pd.DataFrame(rows, columns=columns)
+        if self.config.date_column in df.columns:
+            df[self.config.date_column] = pd.to_datetime(df[self.config.date_column], errors="coerce")
+        return df
+
+    def read_frame(self, columns: List[str] = None) -> pd.DataFrame:
+        """All rows of ``columns`` (every column when omitted), in load order."""
+        columns = list(columns or self.columns)
+        selected = ", ".join(self.column(c) for c in columns)
+        return self._frame(self.query(f"SELECT {selected} FROM {quote(self.config.table)} ORDER BY id"), columns)
+
+    def page(self, offset: int, limit: int, sort_by: Optional[str] = None, ascending: bool = True,
+             search: Optional[str] = None, search_columns: Sequence[str] = ()) -> Tuple[int, pd.DataFrame]:
+        """
+        One window of rows and the number of rows matching ``search``
+        (case-insensitive substring over ``search_columns``). Nulls sort last.
+        """
+        table = quote(self.config.table)
+        where, params = "", []
+        searchable = [c for c in search_columns if c in self.columns]
+        if search and searchable:
+            pattern = "%" + re.sub(r"([\\%_])", r"\\\1", search) + "%"
+            where = "WHERE " + " OR ".join(f"{self.column(c)} LIKE ? ESCAPE '\\'" for c in searchable)
+            params = [pattern] * len(searchable)
+
+        order = "id"
+        if sort_by is not None:
+            sql = self.column(sort_by)
+            key = f"CAST({sql} AS INTEGER)" if sort_by in self.meta.get("numeric_columns", []) else sql
+            order = f"{sql} IS NULL, {key} {'ASC' if ascending else 'DESC'}, id"
+
+        columns = list(self.columns)
+        selected = ", ".join(self.column(c) for c in columns)
+        with self.connection() as connection:
+            total = connection.execute(f"SELECT COUNT(*) FROM {table} {where}", params).fetchone()[0]
+            rows = connection.execute(
+                f"SELECT {selected} FROM {table} {where} ORDER BY {order} LIMIT ? OFFSET ?",
+                [*params, limit, offset],
+            ).fetchall()
+        return int(total), self._frame(rows, columns)
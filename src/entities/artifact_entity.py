@@ -0,0 +1,219 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+# =====================================================================
+# DATA INGESTION
+# =====================================================================
+
+@dataclass
+class DataIngestionArtifact:
+    """
+    Outputs of the data ingestion stage. Each CSV has a Parquet twin
+    (see ``parquet_path``); downstream stages should prefer the Parquet.
+    """
+
+    raw_file_path: str
+    processed_file_path: str
+    train_file_path: str
+    test_file_path: str
+    metadata_file_path: str
+    schema_file_path: str
+    source_sha256: str
+    skipped: bool = False
+
+
+# =====================================================================
+# DATA VALIDATION
+# =====================================================================
+
+@dataclass
+class DataValidationArtifact:
+    """
+    Outcome of data validation. ``validation_status`` is False when a
+    blocking check failed; later reports are then marked as skipped.
+    """
+
+    validation_status: bool
+    status_file_path: str
+    report_file_paths: dict
+    failed_checks: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
+# =====================================================================
+# DATA DRIFT
+# =====================================================================
+
+@dataclass
+class DataDriftArtifact:
+    """
+    Drift report of the latest windows against the reference windows,
+    and the sketch state it was computed from.
+    """
+
+    report_file_path: str
+    sketch_file_path: str
+    drift_detected: bool
+    drifted_columns: List[str] = field(default_factory=list)
+
+
+# =====================================================================
+# FEATURE ENGINEERING
+# =====================================================================
+
+@dataclass
+class FeatureEngineeringArtifact:
+    """
+    Daily feature matrices for the train and test periods (CSV plus
+    Parquet twin). ``skipped`` is set when the cached output was reused.
+    """
+
+    train_file_path: str
+    test_file_path: str
+    report_file_path: str
+    cache_key: str
+    skipped: bool = False
+
+
+# =====================================================================
+# MODEL TRAINING
+# =====================================================================
+
+@dataclass
+class ModelTrainingArtifact:
+    """
+    Trained forecaster, its fitted preprocessor and the training report.
+    """
+
+    model_file_path: str
+    preprocessor_file_path: str
+    report_file_path: str
+    test_mae: float
+
+
+# =====================================================================
+# INCREMENTAL TRAINING
+# =====================================================================
+
+@dataclass
+class IncrementalTrainingArtifact:
+    """
+    Outcome of an incremental update. ``version`` is the newly registered
+    version when the candidate was promoted, else the unchanged active one.
+    """
+
+    promoted: bool
+    version: Optional[str]
+    base_version: Optional[str]
+    baseline_mae: Optional[float]
+    candidate_mae: Optional[float]
+    report_file_path: str
+    reason: str = ""
+
+
+# =====================================================================
+# MODEL EVALUATION
+# =====================================================================
+
+@dataclass
+class ModelEvaluationArtifact:
+    """
+    Walk-forward backtest report and chart, with the overall errors
+    across every fold and horizon step.
+    """
+
+    report_file_path: str
+    png_file_path: str
+    mae: float
+    mape: Optional[float]
+    n_folds: int
+
+
+# =====================================================================
+# MODEL SEARCH
+# =====================================================================
+
+@dataclass
+class ModelSearchArtifact:
+    """
+    Outcome of a hyperparameter search: the best configuration at full
+    budget plus the report and the resumable trial journal.
+    """
+
+    report_file_path: str
+    journal_file_path: str
+    best_family: Optional[str]
+    best_params: Optional[dict]
+    best_score_mae: Optional[float]
+
+
+# =====================================================================
+# MODEL DEPLOYMENT
+# =====================================================================
+
+@dataclass
+class ModelDeploymentArtifact:
+    """
+    NumPy-runtime weights exported from the trained model, with the
+    largest absolute difference from Keras seen during verification.
+    """
+
+    weights_file_path: str
+    preprocessor_file_path: str
+    report_file_path: str
+    max_abs_error: float
+
+
+# =====================================================================
+# MODEL REGISTRY
+# =====================================================================
+
+@dataclass
+class ModelRegistryArtifact:
+    """
+    Result of registering a trained model. ``already_registered`` is set
+    when an identical model was found and reused.
+    """
+
+    version: str
+    version_dir: str
+    activated: bool
+    already_registered: bool = False
+
+
+# =====================================================================
+# RELATIONAL DATABASE
+# =====================================================================
+
+@dataclass
+class DatabaseLoadArtifact:
+    """
+    Result of a bulk load into the relational store. ``updated`` counts
+    rows whose complaint number was already present (upsert mode).
+    """
+
+    db_file_path: str
+    report_file_path: str
+    mode: str
+    rows: int
+    inserted: int
+    updated: int
+    rows_per_second: Optional[float]
+
+
+@dataclass
+class DocumentSyncArtifact:
+    """
+    Result of syncing complaints to the document store. ``errors`` counts
+    per-document write errors; the unordered batches apply the rest.
+    """
+
+    database_name: str
+    collection_name: str
+    report_file_path: str
+    documents: int
+    upserted: int
+    modified: int
+    errors: int
+    docs_per_second: Optional[float]
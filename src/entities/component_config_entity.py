@@ -0,0 +1,721 @@
+import os
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+from src.constants.paths import (
+    ARTIFACTS_DIR,
+    DEPLOYED_ARTIFACTS_DIR,
+    DATA_INGESTION_DIR,
+    DATA_INGESTION_RAW_DIR,
+    DATA_INGESTION_PROCESSED_DIR,
+    DATA_INGESTION_SPLIT_DIR,
+    DATA_INGESTION_RAW_FILE,
+    DATA_INGESTION_PROCESSED_FILE,
+    DATA_INGESTION_TRAIN_FILE,
+    DATA_INGESTION_TEST_FILE,
+    DATA_INGESTION_METADATA_FILE,
+    DATA_INGESTION_SCHEMA_FILE,
+    DATA_INGESTION_SUMMARY_FILE,
+    TRAIN_TEST_SPLIT_RATIO,
+    DATA_VALIDATION_DIR,
+    DATA_VALIDATION_DRIFT_REPORT,
+    DATA_VALIDATION_STATUS_FILE,
+    DATA_VALIDATION_QUALITY_REPORT,
+    SCHEMA_STRUCTURE_VALIDATION_REPORT,
+    STATISTICAL_VALIDATION_REPORT,
+    TIME_SERIES_VALIDATION_REPORT,
+    MAX_MISSING_THRESHOLD,
+    MAX_DUPLICATE_THRESHOLD,
+    CATEGORICAL_COLUMN_THRESHOLD,
+    OUTLIER_IQR_THRESHOLD,
+    MAX_OUTLIER_DAY_RATIO,
+    MAX_SKEWNESS_THRESHOLD,
+    DATA_DRIFT_SKETCH_FILE,
+    DRIFT_THRESHOLD,
+    DRIFT_PSI_THRESHOLD,
+    DRIFT_WINDOW_DAYS,
+    DRIFT_CURRENT_WINDOWS,
+    DRIFT_SKETCH_ACCURACY,
+    FEATURE_ENGINEERING_DIR,
+    FEATURE_ENGINEERING_TRAIN_FILE,
+    FEATURE_ENGINEERING_TEST_FILE,
+    FEATURE_ENGINEERING_REPORT_FILE,
+    FEATURE_STORE_DIR,
+    FEATURE_STORE_DAILY_FEATURES,
+    MODEL_TRAINING_DIR,
+    MODEL_TRAINING_FILE,
+    SCALLING_TRANSFORMATION_PKL_FILE,
+    MODEL_TRAINING_REPORT_FILE,
+    MODEL_INCREMENTAL_DIR,
+    MODEL_INCREMENTAL_REPORT_FILE,
+    MODEL_EVALUATION_DIR,
+    MODEL_EVALUATION_REPORT_FILE,
+    MODEL_EVALUATION_PNG_FILE,
+    MODEL_MONITORING_DIR,
+    MODEL_DRIFT_STATE_FILE,
+    MODEL_DRIFT_SIGNAL_FILE,
+    RANDOM_STATE,
+    MODEL_DEPLOYMENT_DIR,
+    MODEL_DEPLOYMENT_PREPROCESSOR_FILE,
+    MODEL_DEPLOYMENT_WEIGHTS_FILE,
+    MODEL_DEPLOYMENT_REPORT_FILE,
+    MODEL_DEPLOYMENT_TOLERANCE,
+    PREDICTION_DF_FILE,
+    PREDICTION_MAX_BATCH_SIZE,
+    PREDICTION_MAX_WAIT_MS,
+    MODEL_CONFIGS_FILE,
+    MODEL_SEARCH_DIR,
+    MODEL_SEARCH_ARRAYS_DIR,
+    MODEL_SEARCH_JOURNAL_FILE,
+    MODEL_SEARCH_REPORT_FILE,
+    MODEL_REGISTRY_FILE,
+    MODEL_REGISTRY_VERSIONS_DIR,
+    MODEL_REGISTRY_MAX_LOADED,
+    MODEL_REGISTRY_POLL_SECONDS,
+    DATABASE_DIR,
+    DATABASE_NAME,
+    DATABASE_COLLECTION,
+    DATABASE_REPORT_FILE,
+    DATABASE_URL_ENV,
+    DATABASE_DEFAULT_URL,
+    CLOUD_STORAGE_BUCKET_ENV,
+    CLOUD_STORAGE_ENDPOINT_ENV,
+    CLOUD_STORAGE_REGION_ENV,
+    CLOUD_STORAGE_PREFIX,
+    CLOUD_STORAGE_CACHE_DIR,
+    CLOUD_STORAGE_CHECKSUM_KEY,
+    CLOUD_STORAGE_MULTIPART_THRESHOLD,
+    CLOUD_STORAGE_CHUNK_SIZE,
+    CLOUD_STORAGE_MAX_CONCURRENCY,
+    CLOUD_STORAGE_CACHE_MAX_BYTES,
+    RELATIONAL_DB_FILE,
+    RELATIONAL_DB_TABLE,
+    RELATIONAL_DB_LOAD_REPORT,
+    RELATIONAL_DB_UPSERT_KEY,
+    RELATIONAL_DB_INDEX_COLUMNS,
+    dataset_path,
+    seq_length,
+)
+
+
+def parquet_path(csv_path: str) -> str:
+    """Columnar twin of a CSV artifact (same name, ``.parquet`` suffix)."""
+    return os.path.splitext(csv_path)[0] + ".parquet"
+
+
+# =====================================================================
+# DUPLICATE DETECTION
+# =====================================================================
+
+@dataclass
+class DuplicateDetectionConfig:
+    """
+    Keys whose repeated values mark a complaint row as a duplicate. Each
+    entry of ``key_sets`` is checked on its own; ``ignore_values`` never
+    match (``DM`` tweets have no link). ``partitions`` must be a power of
+    two; fingerprints are spilled under ``spill_dir`` while detecting.
+    """
+
+    key_sets: Tuple[Tuple[str, ...], ...] = (("COMPLAINT NUMBER",), ("TWEET-LINK",))
+    ignore_values: Tuple[str, ...] = ("DM",)
+    chunksize: int = 100_000
+    partitions: int = 16
+    spill_dir: str = os.path.join(ARTIFACTS_DIR, DATA_VALIDATION_DIR)
+
+
+# =====================================================================
+# DATA INGESTION
+# =====================================================================
+
+@dataclass
+class DataIngestionConfig:
+    """
+    Paths and parameters of the data ingestion stage.
+
+    The split is chronological: the most recent ``test_ratio`` share of
+    rows (rounded to whole days) becomes the test set. With
+    ``deduplicate`` the rows flagged by ``duplicates`` are dropped before
+    the split, so every downstream count sees each complaint once.
+    """
+
+    source_path: str = dataset_path
+    ingestion_dir: str = os.path.join(ARTIFACTS_DIR, DATA_INGESTION_DIR)
+    chunksize: int = 50_000
+    test_ratio: float = TRAIN_TEST_SPLIT_RATIO
+    date_column: str = "DATE"
+    deduplicate: bool = False
+    duplicates: DuplicateDetectionConfig = field(default_factory=DuplicateDetectionConfig)
+
+    @property
+    def raw_file_path(self) -> str:
+        return os.path.join(self.ingestion_dir, DATA_INGESTION_RAW_DIR, DATA_INGESTION_RAW_FILE)
+
+    @property
+    def processed_file_path(self) -> str:
+        return os.path.join(self.ingestion_dir, DATA_INGESTION_PROCESSED_DIR, DATA_INGESTION_PROCESSED_FILE)
+
+    @property
+    def train_file_path(self) -> str:
+        return os.path.join(self.ingestion_dir, DATA_INGESTION_SPLIT_DIR, DATA_INGESTION_TRAIN_FILE)
+
+    @property
+    def test_file_path(self) -> str:
+        return os.path.join(self.ingestion_dir, DATA_INGESTION_SPLIT_DIR, DATA_INGESTION_TEST_FILE)
+
+    @property
+    def metadata_file_path(self) -> str:
+        return os.path.join(self.ingestion_dir, DATA_INGESTION_METADATA_FILE)
+
+    @property
+    def schema_file_path(self) -> str:
+        return os.path.join(self.ingestion_dir, DATA_INGESTION_SCHEMA_FILE)
+
+    @property
+    def summary_file_path(self) -> str:
+        return os.path.join(self.ingestion_dir, DATA_INGESTION_SUMMARY_FILE)
+
+
+# =====================================================================
+# DATA DRIFT
+# =====================================================================
+
+@dataclass
+class DataDriftConfig:
+    """
+    Sketch-based drift monitoring. Data is summarised per ``window_days``
+    window; the last ``current_windows`` windows are compared with the
+    earlier ones (or the last ``reference_windows`` of them). A column
+    drifts when its PSI exceeds ``psi_threshold`` or a test's p-value is
+    below ``p_value_threshold``.
+    """
+
+    drift_dir: str = os.path.join(ARTIFACTS_DIR, DATA_VALIDATION_DIR)
+    date_column: str = "DATE"
+    category_columns: Tuple[str, ...] = ("DEPT", "CIRCLE", "COMPLAINT TYPE")
+    window_days: int = DRIFT_WINDOW_DAYS
+    current_windows: int = DRIFT_CURRENT_WINDOWS
+    reference_windows: Optional[int] = None
+    relative_accuracy: float = DRIFT_SKETCH_ACCURACY
+    psi_threshold: float = DRIFT_PSI_THRESHOLD
+    p_value_threshold: float = DRIFT_THRESHOLD
+
+    @property
+    def sketch_file_path(self) -> str:
+        return os.path.join(self.drift_dir, DATA_DRIFT_SKETCH_FILE)
+
+    @property
+    def report_file_path(self) -> str:
+        return os.path.join(self.drift_dir, DATA_VALIDATION_DRIFT_REPORT)
+
+
+# =====================================================================
+# DATA VALIDATION
+# =====================================================================
+
+@dataclass
+class DataValidationConfig:
+    """
+    Schema, quality, time-series, statistical and drift validation of the
+    ingested data, in that order. Missing values in ``key_columns`` and
+    structural problems are blocking; the remaining checks only warn.
+    """
+
+    validation_dir: str = os.path.join(ARTIFACTS_DIR, DATA_VALIDATION_DIR)
+    date_column: str = "DATE"
+    required_columns: Tuple[str, ...] = (
+        "DATE", "SHIFT DUTY", "QUERY/REQUEST/COMPLAINT", "COMPLAINT DETAILS",
+        "COMPLAINT NUMBER", "SECTION", "SUB-DIVISION", "DIVISION", "CIRCLE",
+        "COMPLAINT TYPE", "CONSUMER NUMBER", "MOBILE NUMB", "DEPT",
+        "CLOSED/OPEN", "TWEET-LINK", "COMPLAINANT NAME",
+    )
+    key_columns: Tuple[str, ...] = ("DATE", "COMPLAINT TYPE")
+    category_columns: Tuple[str, ...] = ("DEPT", "CIRCLE", "DIVISION", "COMPLAINT TYPE", "SHIFT DUTY", "CLOSED/OPEN")
+    duplicates: DuplicateDetectionConfig = field(default_factory=DuplicateDetectionConfig)
+
+    max_missing: float = MAX_MISSING_THRESHOLD
+    max_duplicate: float = MAX_DUPLICATE_THRESHOLD
+    rare_category_share: float = CATEGORICAL_COLUMN_THRESHOLD
+    outlier_iqr: float = OUTLIER_IQR_THRESHOLD
+    max_outlier_day_ratio: float = MAX_OUTLIER_DAY_RATIO
+    max_skewness: float = MAX_SKEWNESS_THRESHOLD
+    drift: DataDriftConfig = field(default_factory=DataDriftConfig)
+
+    @property
+    def schema_report_file_path(self) -> str:
+        return os.path.join(self.validation_dir, SCHEMA_STRUCTURE_VALIDATION_REPORT)
+
+    @property
+    def quality_report_file_path(self) -> str:
+        return os.path.join(self.validation_dir, DATA_VALIDATION_QUALITY_REPORT)
+
+    @property
+    def time_series_report_file_path(self) -> str:
+        return os.path.join(self.validation_dir, TIME_SERIES_VALIDATION_REPORT)
+
+    @property
+    def statistical_report_file_path(self) -> str:
+        return os.path.join(self.validation_dir, STATISTICAL_VALIDATION_REPORT)
+
+    @property
+    def drift_report_file_path(self) -> str:
+        return self.drift.report_file_path
+
+    @property
+    def status_file_path(self) -> str:
+        return os.path.join(self.validation_dir, DATA_VALIDATION_STATUS_FILE)
+
+
+# =====================================================================
+# FEATURE ENGINEERING
+# =====================================================================
+
+@dataclass
+class FeatureEngineeringConfig:
+    """
+    Calendar, lag and rolling-mean features of the daily count series
+    (TOTAL plus the ``max_categories`` most frequent complaint types).
+    The full frame is also published to the feature store as
+    ``feature_set``.
+    """
+
+    feature_engineering_dir: str = os.path.join(ARTIFACTS_DIR, FEATURE_ENGINEERING_DIR)
+    feature_store_dir: str = os.path.join(ARTIFACTS_DIR, FEATURE_STORE_DIR)
+    feature_set: str = FEATURE_STORE_DAILY_FEATURES
+    date_column: str = "DATE"
+    category_column: str = "COMPLAINT TYPE"
+    max_categories: Optional[int] = 10
+    lags: Tuple[int, ...] = (1, 7, 14, 28)
+    rolling_windows: Tuple[int, ...] = (7, 14, 28)
+
+    @property
+    def train_file_path(self) -> str:
+        return os.path.join(self.feature_engineering_dir, FEATURE_ENGINEERING_TRAIN_FILE)
+
+    @property
+    def test_file_path(self) -> str:
+        return os.path.join(self.feature_engineering_dir, FEATURE_ENGINEERING_TEST_FILE)
+
+    @property
+    def report_file_path(self) -> str:
+        return os.path.join(self.feature_engineering_dir, FEATURE_ENGINEERING_REPORT_FILE)
+
+    def feature_settings(self) -> dict:
+        """Settings that change the output (part of the cache key)."""
+        return {
+            "date_column": self.date_column,
+            "category_column": self.category_column,
+            "max_categories": self.max_categories,
+            "lags": list(self.lags),
+            "rolling_windows": list(self.rolling_windows),
+        }
+
+
+# =====================================================================
+# MODEL TRAINING
+# =====================================================================
+
+@dataclass
+class ModelTrainingConfig:
+    """
+    Daily complaint-volume forecaster: an LSTM over the last ``seq_length``
+    days of counts (TOTAL plus one series per COMPLAINT TYPE) predicting the
+    counts ``horizon`` days ahead.
+    """
+
+    model_training_dir: str = os.path.join(ARTIFACTS_DIR, MODEL_TRAINING_DIR)
+    date_column: str = "DATE"
+    category_column: str = "COMPLAINT TYPE"
+    max_categories: Optional[int] = 10
+    seq_length: int = seq_length
+    horizon: int = 1
+
+    # Model
+    lstm_units: int = 64
+    dropout: float = 0.2
+    learning_rate: float = 1e-3
+
+    # Fit loop
+    epochs: int = 100
+    batch_size: int = 32
+    validation_ratio: float = 0.1
+    patience: int = 10
+    steps_per_execution: int = 16
+    intra_op_threads: int = 0
+    inter_op_threads: int = 0
+    random_state: int = RANDOM_STATE
+
+    @property
+    def model_file_path(self) -> str:
+        return os.path.join(self.model_training_dir, MODEL_TRAINING_FILE)
+
+    @property
+    def preprocessor_file_path(self) -> str:
+        return os.path.join(self.model_training_dir, SCALLING_TRANSFORMATION_PKL_FILE)
+
+    @property
+    def report_file_path(self) -> str:
+        return os.path.join(self.model_training_dir, MODEL_TRAINING_REPORT_FILE)
+
+
+# =====================================================================
+# MODEL EVALUATION
+# =====================================================================
+
+@dataclass
+class ModelEvaluationConfig:
+    """
+    Walk-forward (rolling-origin) backtest. The last ``n_folds`` blocks of
+    ``fold_days`` forecast origins are each scored by a model trained on
+    all days up to the block start, forecasting ``horizon_steps`` days
+    ahead. Folds run in ``max_workers`` processes limited to
+    ``threads_per_worker`` threads each.
+
+    ``params`` are forecaster parameters for ``family``; by default the
+    LSTM settings of ``training``.
+    """
+
+    training: ModelTrainingConfig = field(default_factory=ModelTrainingConfig)
+    evaluation_dir: str = os.path.join(ARTIFACTS_DIR, MODEL_EVALUATION_DIR)
+    feature_store_dir: str = os.path.join(ARTIFACTS_DIR, FEATURE_STORE_DIR)
+    feature_set: str = FEATURE_STORE_DAILY_FEATURES
+
+    family: str = "lstm"
+    params: Optional[dict] = None
+    budget: int = 30
+    n_folds: int = 5
+    fold_days: int = 28
+    horizon_steps: int = 7
+    max_workers: int = max(1, (os.cpu_count() or 1) // 2)
+    threads_per_worker: int = 1
+
+    def model_params(self) -> dict:
+        if self.params is not None:
+            return dict(self.params)
+        t = self.training
+        return {
+            "lstm_units": t.lstm_units,
+            "dropout": t.dropout,
+            "learning_rate": t.learning_rate,
+            "batch_size": t.batch_size,
+        }
+
+    @property
+    def report_file_path(self) -> str:
+        return os.path.join(self.evaluation_dir, MODEL_EVALUATION_REPORT_FILE)
+
+    @property
+    def png_file_path(self) -> str:
+        return os.path.join(self.evaluation_dir, MODEL_EVALUATION_PNG_FILE)
+
+
+# =====================================================================
+# MODEL DRIFT MONITORING
+# =====================================================================
+
+@dataclass
+class ModelDriftConfig:
+    """
+    Rolling error monitor of the served forecaster. The first
+    ``warmup_days`` observations set the baseline error per series;
+    after that a retrain signal is raised when the ``window_days`` MAE
+    exceeds the baseline by more than ``max_mae_increase`` (relative),
+    or when CUSUM (on bias) or Page-Hinkley (on absolute error) alarms.
+    Detector parameters are in units of the baseline MAE.
+    """
+
+    monitor_dir: str = os.path.join(ARTIFACTS_DIR, MODEL_MONITORING_DIR)
+    window_days: int = 28
+    warmup_days: int = 56
+    max_mae_increase: float = 0.5
+    cusum_k: float = 0.5
+    cusum_h: float = 8.0
+    ph_delta: float = 0.1
+    ph_threshold: float = 15.0
+
+    @property
+    def state_file_path(self) -> str:
+        return os.path.join(self.monitor_dir, MODEL_DRIFT_STATE_FILE)
+
+    @property
+    def signal_file_path(self) -> str:
+        return os.path.join(self.monitor_dir, MODEL_DRIFT_SIGNAL_FILE)
+
+
+# =====================================================================
+# MODEL SEARCH
+# =====================================================================
+
+@dataclass
+class ModelSearchConfig:
+    """
+    Hyperparameter search over the model factory. The search space lives
+    in ``configs/model_configs.yaml``; window preparation follows
+    ``training``. Each of ``max_workers`` processes is limited to
+    ``threads_per_worker`` threads.
+    """
+
+    training: ModelTrainingConfig = field(default_factory=ModelTrainingConfig)
+    search_dir: str = os.path.join(ARTIFACTS_DIR, MODEL_SEARCH_DIR)
+    config_file_path: str = MODEL_CONFIGS_FILE
+    families: Optional[Tuple[str, ...]] = None
+    max_workers: int = max(1, (os.cpu_count() or 1) // 2)
+    threads_per_worker: int = 1
+    resume: bool = True
+
+    @property
+    def arrays_dir(self) -> str:
+        return os.path.join(self.search_dir, MODEL_SEARCH_ARRAYS_DIR)
+
+    @property
+    def journal_file_path(self) -> str:
+        return os.path.join(self.search_dir, MODEL_SEARCH_JOURNAL_FILE)
+
+    @property
+    def report_file_path(self) -> str:
+        return os.path.join(self.search_dir, MODEL_SEARCH_REPORT_FILE)
+
+
+# =====================================================================
+# MODEL PREDICTION
+# =====================================================================
+
+@dataclass
+class ModelPredictionConfig:
+    """
+    Serving settings for the forecaster. Concurrent requests are grouped
+    into one model call of at most ``max_batch_size`` windows, waiting no
+    longer than ``max_wait_ms`` for the batch to fill.
+    """
+
+    training: ModelTrainingConfig = field(default_factory=ModelTrainingConfig)
+    prediction_dir: str = os.path.join(ARTIFACTS_DIR, MODEL_DEPLOYMENT_DIR)
+    max_batch_size: int = PREDICTION_MAX_BATCH_SIZE
+    max_wait_ms: float = PREDICTION_MAX_WAIT_MS
+
+    @property
+    def model_file_path(self) -> str:
+        return self.training.model_file_path
+
+    @property
+    def preprocessor_file_path(self) -> str:
+        return self.training.preprocessor_file_path
+
+    @property
+    def prediction_file_path(self) -> str:
+        return os.path.join(self.prediction_dir, PREDICTION_DF_FILE)
+
+
+# =====================================================================
+# MODEL DEPLOYMENT
+# =====================================================================
+
+@dataclass
+class ModelDeploymentConfig:
+    """
+    Export of the trained Keras model to the NumPy runtime. The export is
+    rejected when outputs differ from Keras by more than ``tolerance``.
+    """
+
+    deployment_dir: str = os.path.join(ARTIFACTS_DIR, MODEL_DEPLOYMENT_DIR)
+    tolerance: float = MODEL_DEPLOYMENT_TOLERANCE
+    verification_samples: int = 256
+    random_state: int = RANDOM_STATE
+
+    @property
+    def weights_file_path(self) -> str:
+        return os.path.join(self.deployment_dir, MODEL_DEPLOYMENT_WEIGHTS_FILE)
+
+    @property
+    def preprocessor_file_path(self) -> str:
+        return os.path.join(self.deployment_dir, MODEL_DEPLOYMENT_PREPROCESSOR_FILE)
+
+    @property
+    def report_file_path(self) -> str:
+        return os.path.join(self.deployment_dir, MODEL_DEPLOYMENT_REPORT_FILE)
+
+
+# =====================================================================
+# MODEL REGISTRY
+# =====================================================================
+
+@dataclass
+class ModelRegistryConfig:
+    """
+    File-based registry of model + preprocessor versions. ``registry.json``
+    holds the version index and the active pointer.
+    """
+
+    registry_dir: str = DEPLOYED_ARTIFACTS_DIR
+    max_loaded_versions: int = MODEL_REGISTRY_MAX_LOADED
+    poll_interval_seconds: float = MODEL_REGISTRY_POLL_SECONDS
+
+    @property
+    def registry_file_path(self) -> str:
+        return os.path.join(self.registry_dir, MODEL_REGISTRY_FILE)
+
+    @property
+    def versions_dir(self) -> str:
+        return os.path.join(self.registry_dir, MODEL_REGISTRY_VERSIONS_DIR)
+
+
+# =====================================================================
+# INCREMENTAL TRAINING
+# =====================================================================
+
+@dataclass
+class IncrementalTrainingConfig:
+    """
+    Fine-tuning of the active registered model on days that arrived after
+    it was trained, mixed with ``replay_ratio`` x as many windows sampled
+    from older history. The last ``holdout_days`` are held out; the
+    candidate is promoted only if its holdout MAE is no worse than the
+    current model's by more than ``max_regression`` (relative).
+    """
+
+    incremental_dir: str = os.path.join(ARTIFACTS_DIR, MODEL_TRAINING_DIR, MODEL_INCREMENTAL_DIR)
+    feature_store_dir: str = os.path.join(ARTIFACTS_DIR, FEATURE_STORE_DIR)
+    feature_set: str = FEATURE_STORE_DAILY_FEATURES
+    registry: ModelRegistryConfig = field(default_factory=ModelRegistryConfig)
+
+    holdout_days: int = 14
+    replay_ratio: float = 2.0
+    epochs: int = 5
+    batch_size: int = 32
+    learning_rate: float = 3e-4
+    max_regression: float = 0.0
+    random_state: int = RANDOM_STATE
+
+    @property
+    def model_file_path(self) -> str:
+        return os.path.join(self.incremental_dir, MODEL_TRAINING_FILE)
+
+    @property
+    def preprocessor_file_path(self) -> str:
+        return os.path.join(self.incremental_dir, SCALLING_TRANSFORMATION_PKL_FILE)
+
+    @property
+    def report_file_path(self) -> str:
+        return os.path.join(self.incremental_dir, MODEL_INCREMENTAL_REPORT_FILE)
+
+
+# =====================================================================
+# RELATIONAL DATABASE
+# =====================================================================
+
+@dataclass
+class ConnectionPoolConfig:
+    """
+    Pool of store connections shared by the API backends. At most
+    ``size`` are open; callers wait up to ``timeout_seconds`` for one.
+    A connection idle longer than ``health_check_seconds`` is pinged
+    before reuse, and each keeps ``statement_cache_size`` prepared
+    statements.
+    """
+
+    size: int = 8
+    timeout_seconds: float = 10.0
+    health_check_seconds: float = 30.0
+    statement_cache_size: int = 256
+
+
+@dataclass
+class RelationalDBConfig:
+    """
+    Embedded SQLite file the APIs serve complaints from. It is rebuilt
+    from the source dataset whenever the source's size or modification
+    time changes; ``index_columns`` get one B-tree index each.
+
+    Bulk loads write ``chunksize``-row batches and commit every
+    ``transaction_rows`` rows. Every row is kept unless ``deduplicate``
+    is set: then ``upsert_key`` is unique among non-blank keys (the last
+    row wins) and is the conflict target of upserts. Blank keys are
+    stored as NULL and never merged.
+    """
+
+    database_dir: str = os.path.join(ARTIFACTS_DIR, DATABASE_DIR)
+    table: str = RELATIONAL_DB_TABLE
+    date_column: str = "DATE"
+    index_columns: Tuple[str, ...] = RELATIONAL_DB_INDEX_COLUMNS
+    upsert_key: Optional[str] = RELATIONAL_DB_UPSERT_KEY
+    deduplicate: bool = False
+    chunksize: int = 50_000
+    transaction_rows: int = 200_000
+    pool: ConnectionPoolConfig = field(default_factory=ConnectionPoolConfig)
+
+    @property
+    def db_file_path(self) -> str:
+        return os.path.join(self.database_dir, RELATIONAL_DB_FILE)
+
+    @property
+    def load_report_file_path(self) -> str:
+        return os.path.join(self.database_dir, RELATIONAL_DB_LOAD_REPORT)
+
+
+# =====================================================================
+# DOCUMENT DATABASE
+# =====================================================================
+
+@dataclass
+class DocumentDBConfig:
+    """
+    MongoDB collection complaints are synced to for the CRM side.
+
+    Writes are unordered ``bulk_write`` calls of ``batch_size``
+    operations, upserted on ``upsert_key``. ``indexes`` are compound
+    indexes matching the dashboard's filters (status, type, circle /
+    division, department, each with a date range); reads project to
+    ``default_fields`` unless fields are given. ``uri`` defaults to the
+    ``MONGODB_URL`` environment variable.
+    """
+
+    uri: str = field(default_factory=lambda: os.getenv(DATABASE_URL_ENV, DATABASE_DEFAULT_URL))
+    database_name: str = DATABASE_NAME
+    collection_name: str = DATABASE_COLLECTION
+    database_dir: str = os.path.join(ARTIFACTS_DIR, DATABASE_DIR)
+    date_column: str = "DATE"
+    upsert_key: Optional[str] = RELATIONAL_DB_UPSERT_KEY
+    batch_size: int = 1_000
+    server_timeout_ms: int = 5_000
+    indexes: Tuple[Tuple[Tuple[str, int], ...], ...] = (
+        (("CLOSED/OPEN", 1), ("DATE", -1)),
+        (("COMPLAINT TYPE", 1), ("DATE", -1)),
+        (("CIRCLE", 1), ("DIVISION", 1), ("DATE", -1)),
+        (("DEPT", 1), ("CLOSED/OPEN", 1), ("DATE", -1)),
+    )
+    default_fields: Tuple[str, ...] = (
+        "DATE", "COMPLAINT NUMBER", "COMPLAINT TYPE", "CIRCLE", "DIVISION", "DEPT", "CLOSED/OPEN",
+    )
+
+    @property
+    def report_file_path(self) -> str:
+        return os.path.join(self.database_dir, DATABASE_REPORT_FILE)
+
+
+# =====================================================================
+# CLOUD STORAGE
+# =====================================================================
+
+@dataclass
+class CloudStorageConfig:
+    """
+    S3-compatible store for model and dataset artifacts.
+
+    Objects live under ``prefix`` in ``bucket`` and carry their SHA-256
+    in the ``checksum_key`` metadata entry. Files above
+    ``multipart_threshold`` are transferred in ``chunk_size`` parts on
+    ``max_concurrency`` threads. Downloads are read through ``cache_dir``,
+    keyed by content hash and pruned to ``cache_max_bytes`` (least
+    recently used first). ``endpoint_url`` points at MinIO or another
+    S3-compatible server; ``None`` means AWS.
+    """
+
+    bucket: Optional[str] = field(default_factory=lambda: os.getenv(CLOUD_STORAGE_BUCKET_ENV))
+    endpoint_url: Optional[str] = field(default_factory=lambda: os.getenv(CLOUD_STORAGE_ENDPOINT_ENV))
+    region_name: Optional[str] = field(default_factory=lambda: os.getenv(CLOUD_STORAGE_REGION_ENV))
+    prefix: str = CLOUD_STORAGE_PREFIX
+    cache_dir: str = CLOUD_STORAGE_CACHE_DIR
+    cache_max_bytes: int = CLOUD_STORAGE_CACHE_MAX_BYTES
+    checksum_key: str = CLOUD_STORAGE_CHECKSUM_KEY
+    multipart_threshold: int = CLOUD_STORAGE_MULTIPART_THRESHOLD
+    chunk_size: int = CLOUD_STORAGE_CHUNK_SIZE
+    max_concurrency: int = CLOUD_STORAGE_MAX_CONCURRENCY
@@ -0,0 +1,42 @@
+import threading
+
+from src.logging.logger import get_logger
+from src.constants.paths import CLOUD_STORAGE_REGISTRY_NAME, MODEL_REGISTRY_FILE
+from src.entities.component_config_entity import CloudStorageConfig, ModelRegistryConfig
+from src.cloud.aws_storage import S3Storage
+
+logger = get_logger(__name__)
+
+_lock = threading.Lock()
+_storage: S3Storage = None
+
+
+def get_artifact_storage(config: CloudStorageConfig = None) -> S3Storage:
+    """Process-wide ``S3Storage``; the boto3 client is thread-safe and pools its connections."""
+    global _storage
+    with _lock:
+        if _storage is None:
+            _storage = S3Storage(config)
+            logger.info(
+                "Artifact storage configured | bucket=%s prefix=%s endpoint=%s",
+                _storage.config.bucket, _storage.config.prefix, _storage.config.endpoint_url or "aws",
+            )
+        return _storage
+
+
+def push_model_registry(config: ModelRegistryConfig = None) -> dict:
+    """Upload the model registry (index + versions); unchanged files are skipped."""
+    config = config or ModelRegistryConfig()
+    return get_artifact_storage().upload_dir(config.registry_dir, CLOUD_STORAGE_REGISTRY_NAME)
+
+
+def pull_model_registry(config: ModelRegistryConfig = None) -> dict:
+    """
+    Restore the model registry locally, through the artifact cache. The
+    index comes last, so a watching ``ServingModel`` never sees an active
+    version whose files are not there yet.
+    """
+    config = config or ModelRegistryConfig()
+    return get_artifact_storage().download_dir(
+        CLOUD_STORAGE_REGISTRY_NAME, config.registry_dir, last=(MODEL_REGISTRY_FILE,),
+    )
@@ -0,0 +1,250 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+from src.logging.logger import get_logger
+from src.entities.component_config_entity import ConnectionPoolConfig, DocumentDBConfig, RelationalDBConfig
+from src.database.relational_db import RelationalDB
+from src.database.document_db import DocumentDB
+
+logger = get_logger(__name__)
+
+
+# =====================================================================
+# CONNECTION POOL
+# =====================================================================
+
+class _Lease:
+    """Connection checked out for one unit of work (a call, a request)."""
+
+    def __init__(self, pool: "ConnectionPool", connection: Optional[sqlite3.Connection] = None):
+        self.pool = pool
+        self.connection = connection
+        self.lock = threading.RLock()
+
+
+# Lease of the current thread / asyncio task. Threads start with an empty
+# context and tasks copy their parent's, so reuse follows the unit of work.
+_current_lease: ContextVar[Optional[_Lease]] = ContextVar("database_lease", default=None)
+
+
+class ConnectionPool:
+    """
+    Bounded pool of SQLite connections.
+
+    Idle connections are kept on a LIFO stack, so the most recently used
+    (warm page cache, prepared statements) is handed out first. Within one
+    thread or asyncio task, nested ``connection()`` calls reuse the
+    connection already checked out; a ``session()`` (one per API request)
+    keeps it for every query of the request and returns it at the end.
+    A connection that sat idle for ``health_check_seconds`` is pinged
+    before reuse and replaced if the ping fails.
+    """
+
+    def __init__(self, factory: Callable[[], sqlite3.Connection], config: ConnectionPoolConfig = None):
+        self.factory = factory
+        self.config = config or ConnectionPoolConfig()
+        self._slots = threading.BoundedSemaphore(self.config.size)
+        self._idle: deque = deque()
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {"created": 0, "acquired": 0, "reused": 0, "waited": 0, "health_check_failures": 0}
+
+    # ----------------------------------------------------------------
+    # Checkout
+    # ----------------------------------------------------------------
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def _healthy(self, connection: sqlite3.Connection) -> bool:
+        try:
+            connection.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _acquire(self) -> sqlite3.Connection:
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+
+        if not self._slots.acquire(blocking=False):
+            self._count("waited")
+            if not self._slots.acquire(timeout=self.config.timeout_seconds):
+                raise TimeoutError(
+                    f"No database connection free within {self.config.timeout_seconds}s "
+                    f"(pool size {self.config.size})"
+                )
+
+        try:
+            while True:
+                with self._lock:
+                    idle = self._idle.pop() if self._idle else None
+                if idle is None:
+                    connection = self.factory()
+                    self._count("created")
+                    break
+
+                connection, idle_since = idle
+                if time.monotonic() - idle_since < self.config.health_check_seconds or self._healthy(connection):
+                    break
+                self._count("health_check_failures")
+                logger.warning("Pooled connection failed health check, replacing it")
+                connection.close()
+
+            self._count("acquired")
+            return connection
+
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _release(self, connection: sqlite3.Connection) -> None:
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+            if self._closed:
+                connection.close()
+            else:
+                with self._lock:
+                    self._idle.append((connection, time.monotonic()))
+        except sqlite3.Error:
+            connection.close()
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """A pooled connection, reused if this thread/task already holds one."""
+        lease = _current_lease.get()
+        if lease is not None and lease.pool is self:
+            with lease.lock:
+                if lease.connection is None:
+                    lease.connection = self._acquire()
+                else:
+                    self._count("reused")
+                yield lease.connection
+            return
+
+        connection = self._acquire()
+        token = _current_lease.set(_Lease(self, connection))
+        try:
+            yield connection
+        finally:
+            _current_lease.reset(token)
+            self._release(connection)
+
+    @contextmanager
+    def session(self) -> Iterator[None]:
+        """
+        Scope of one request: the first query checks a connection out,
+        later ones (in this thread/task or its worker threads) reuse it,
+        and it returns to the pool when the scope ends.
+        """
+        lease = _Lease(self)
+        token = _current_lease.set(lease)
+        try:
+            yield
+        finally:
+            _current_lease.reset(token)
+            if lease.connection is not None:
+                self._release(lease.connection)
+
+    # ----------------------------------------------------------------
+    # Health / shutdown
+    # ----------------------------------------------------------------
+    def health(self) -> dict:
+        start = time.perf_counter()
+        with self.connection() as connection:
+            healthy = self._healthy(connection)
+        with self._lock:
+            idle = len(self._idle)
+        return {
+            "healthy": healthy,
+            "ping_ms": round((time.perf_counter() - start) * 1000, 3),
+            "size": self.config.size,
+            "idle": idle,
+            **self.stats,
+        }
+
+    def close(self) -> None:
+        self._closed = True
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for connection, _ in idle:
+            connection.close()
+        logger.info("Connection pool closed | stats=%s", self.stats)
+
+
+# =====================================================================
+# SHARED STORE
+# =====================================================================
+
+_lock = threading.Lock()
+_relational_db: RelationalDB = None
+_document_db: DocumentDB = None
+
+
+def get_relational_db(config: RelationalDBConfig = None) -> RelationalDB:
+    """Process-wide ``RelationalDB`` with its connection pool, shared by the API backends."""
+    global _relational_db
+    with _lock:
+        if _relational_db is None:
+            db = RelationalDB(config)
+            db.pool = ConnectionPool(db.connect, db.config.pool)
+            _relational_db = db
+            logger.info(
+                "Relational store opened | path=%s pool_size=%s",
+                db.config.db_file_path, db.config.pool.size,
+            )
+        return _relational_db
+
+
+def get_connection_pool() -> ConnectionPool:
+    return get_relational_db().pool
+
+
+def get_complaints_db(dataset_path: str) -> RelationalDB:
+    """Shared store, rebuilt first if ``dataset_path`` changed since the last load."""
+    return get_relational_db().sync(dataset_path)
+
+
+async def run_db(func: Callable, *args, **kwargs):
+    """
+    Run a blocking store call from async code on a worker thread. The
+    task's context is copied, so it reuses the task's session connection.
+    """
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+
+def get_document_db(config: DocumentDBConfig = None) -> DocumentDB:
+    """
+    Process-wide ``DocumentDB``. ``MongoClient`` keeps its own connection
+    pool and is thread-safe, so one client serves every caller.
+    """
+    global _document_db
+    with _lock:
+        if _document_db is None:
+            _document_db = DocumentDB(config)
+            logger.info(
+                "Document store configured | database=%s collection=%s",
+                _document_db.config.database_name, _document_db.config.collection_name,
+            )
+        return _document_db
+
+
+def close_connections() -> None:
+    """Close the shared stores; the next ``get_*`` call opens fresh ones."""
+    global _relational_db, _document_db
+    with _lock:
+        if _relational_db is not None and _relational_db.pool is not None:
+            _relational_db.pool.close()
+        _relational_db = None
+        if _document_db is not None:
+            _document_db.close()
+            _document_db = None
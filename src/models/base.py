@@ -0,0 +1,108 @@
+from dataclasses import dataclass, field
+from typing import List
+
+import numpy as np
+
+
+# =====================================================================
+# FORECAST PREPROCESSOR
+# =====================================================================
+
+@dataclass
+class ForecastPreprocessor:
+    """
+    Min-max scaling of the daily count series plus the metadata needed to
+    build model inputs at serving time (series names and window length).
+
+    Pure NumPy, so serving does not need scikit-learn or TensorFlow to
+    unpickle it.
+    """
+
+    columns: List[str]
+    seq_length: int
+    horizon: int = 1
+    data_min: np.ndarray = field(default=None, repr=False)
+    data_max: np.ndarray = field(default=None, repr=False)
+
+    @property
+    def n_series(self) -> int:
+        return len(self.columns)
+
+    def fit(self, values: np.ndarray) -> "ForecastPreprocessor":
+        values = np.asarray(values, dtype=np.float32)
+        self.data_min = values.min(axis=0)
+        self.data_max = values.max(axis=0)
+        return self
+
+    @property
+    def _scale(self) -> np.ndarray:
+        span = self.data_max - self.data_min
+        return np.where(span > 0, span, 1.0).astype(np.float32)
+
+    def transform(self, values: np.ndarray) -> np.ndarray:
+        values = np.asarray(values, dtype=np.float32)
+        return ((values - self.data_min) / self._scale).astype(np.float32)
+
+    def inverse_transform(self, values: np.ndarray) -> np.ndarray:
+        values = np.asarray(values, dtype=np.float32)
+        return values * self._scale + self.data_min
+
+
+# =====================================================================
+# NUMPY FORWARD PASS
+# =====================================================================
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+@dataclass
+class NumpyForecastModel:
+    """
+    TensorFlow-free forward pass of the LSTM -> Dense forecaster, built
+    from weights exported by ``src.models.deployer``.
+
+    Follows Keras' LSTM: gates ordered (input, forget, cell, output),
+    sigmoid recurrent activation and tanh cell activation. Dropout is the
+    identity at inference. Exposes ``predict_on_batch`` so it can stand in
+    for the Keras model in ``ForecastPredictor``.
+    """
+
+    kernel: np.ndarray
+    recurrent_kernel: np.ndarray
+    bias: np.ndarray
+    dense_kernel: np.ndarray
+    dense_bias: np.ndarray
+
+    @property
+    def units(self) -> int:
+        return self.recurrent_kernel.shape[0]
+
+    @classmethod
+    def load(cls, path: str) -> "NumpyForecastModel":
+        with np.load(path) as weights:
+            return cls(**{name: weights[name].astype(np.float32) for name in cls.__dataclass_fields__})
+
+    def save(self, path: str) -> None:
+        np.savez(path, **{name: getattr(self, name) for name in self.__dataclass_fields__})
+
+    def predict_on_batch(self, X: np.ndarray) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float32)
+        batch, steps, _ = X.shape
+        units = self.units
+
+        # Input projection for every timestep in one matmul
+        projected = X @ self.kernel + self.bias
+
+        h = np.zeros((batch, units), dtype=np.float32)
+        c = np.zeros((batch, units), dtype=np.float32)
+        for t in range(steps):
+            z = projected[:, t] + h @ self.recurrent_kernel
+            i = _sigmoid(z[:, :units])
+            f = _sigmoid(z[:, units:2 * units])
+            g = np.tanh(z[:, 2 * units:3 * units])
+            o = _sigmoid(z[:, 3 * units:])
+            c = f * c + i * g
+            h = o * np.tanh(c)
+
+        return h @ self.dense_kernel + self.dense_bias
@@ -0,0 +1,161 @@
+import os
+import sys
+import time
+import shutil
+from datetime import datetime
+
+import numpy as np
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.entities.component_config_entity import ModelDeploymentConfig
+from src.entities.artifact_entity import ModelDeploymentArtifact, ModelTrainingArtifact
+from src.models.base import NumpyForecastModel
+from src.utils.helper import file_sha256, save_json
+
+logger = get_logger(__name__)
+
+
+# =====================================================================
+# EXPORT
+# =====================================================================
+
+def export_numpy_model(model) -> NumpyForecastModel:
+    """
+    Copy the weights of an Input -> LSTM -> Dropout -> Dense Keras model
+    into a ``NumpyForecastModel``.
+
+    Raises ValueError for any other architecture or LSTM configuration the
+    NumPy forward pass does not implement.
+    """
+    lstm = dense = None
+
+    for layer in model.layers:
+        kind = type(layer).__name__
+        if kind in ("InputLayer", "Dropout"):
+            continue
+        if kind == "LSTM" and lstm is None and dense is None:
+            lstm = layer
+        elif kind == "Dense" and lstm is not None and dense is None:
+            dense = layer
+        else:
+            raise ValueError(f"Unsupported layer for NumPy export: {layer.name} ({kind})")
+
+    if lstm is None or dense is None:
+        raise ValueError("NumPy export expects an LSTM layer followed by a Dense layer")
+
+    config = lstm.get_config()
+    unsupported = {
+        "activation": config.get("activation") != "tanh",
+        "recurrent_activation": config.get("recurrent_activation") != "sigmoid",
+        "use_bias": not config.get("use_bias", True),
+        "return_sequences": config.get("return_sequences", False),
+        "go_backwards": config.get("go_backwards", False),
+    }
+    if dense.get_config().get("activation") != "linear":
+        unsupported["dense_activation"] = True
+
+    if any(unsupported.values()):
+        raise ValueError(
+            "Unsupported settings for NumPy export: "
+            + ", ".join(name for name, bad in unsupported.items() if bad)
+        )
+
+    kernel, recurrent_kernel, bias = lstm.get_weights()
+    dense_kernel, dense_bias = dense.get_weights()
+
+    return NumpyForecastModel(
+        kernel=kernel.astype(np.float32),
+        recurrent_kernel=recurrent_kernel.astype(np.float32),
+        bias=bias.astype(np.float32),
+        dense_kernel=dense_kernel.astype(np.float32),
+        dense_bias=dense_bias.astype(np.float32),
+    )
+
+
+def verify_numpy_model(model, runtime: NumpyForecastModel, X: np.ndarray) -> float:
+    """Largest absolute difference between Keras and NumPy outputs on ``X``."""
+    expected = np.asarray(model.predict_on_batch(X))
+    actual = runtime.predict_on_batch(X)
+    return float(np.max(np.abs(expected - actual))) if expected.size else 0.0
+
+
+# =====================================================================
+# DEPLOYER
+# =====================================================================
+
+class ModelDeployer:
+    """
+    Exports the trained forecaster to the TensorFlow-free runtime and
+    verifies it against Keras before it can be registered.
+    """
+
+    def __init__(self, config: ModelDeploymentConfig = None):
+        self.config = config or ModelDeploymentConfig()
+
+    def initiate_model_deployment(self, training_artifact: ModelTrainingArtifact) -> ModelDeploymentArtifact:
+        try:
+            import keras
+
+            cfg = self.config
+            logger.info("Model deployment started | model=%s", training_artifact.model_file_path)
+
+            model = keras.models.load_model(training_artifact.model_file_path, compile=False)
+            runtime = export_numpy_model(model)
+
+            # Verification inputs span (and exceed) the scaled training range
+            _, seq_length, n_series = model.input_shape
+            rng = np.random.default_rng(cfg.random_state)
+            X = rng.uniform(-0.25, 1.5, size=(cfg.verification_samples, seq_length, n_series)).astype(np.float32)
+
+            max_abs_error = verify_numpy_model(model, runtime, X)
+            if max_abs_error > cfg.tolerance:
+                raise ValueError(
+                    f"NumPy runtime differs from Keras by {max_abs_error:.3g} "
+                    f"(tolerance {cfg.tolerance:.3g})"
+                )
+
+            os.makedirs(cfg.deployment_dir, exist_ok=True)
+            runtime.save(cfg.weights_file_path)
+            shutil.copy2(training_artifact.preprocessor_file_path, cfg.preprocessor_file_path)
+
+            # Rough serving cost of each runtime for one request
+            sample = X[:1]
+            timings = {}
+            for name, predict in (("keras", model.predict_on_batch), ("numpy", runtime.predict_on_batch)):
+                predict(sample)
+                start = time.perf_counter()
+                for _ in range(20):
+                    predict(sample)
+                timings[name] = round((time.perf_counter() - start) / 20 * 1000.0, 4)
+
+            save_json(cfg.report_file_path, {
+                "exported_at": datetime.now().isoformat(timespec="seconds"),
+                "source_model_file": training_artifact.model_file_path,
+                "source_model_sha256": file_sha256(training_artifact.model_file_path),
+                "runtime": "numpy",
+                "units": runtime.units,
+                "input_shape": [seq_length, n_series],
+                "verification_samples": cfg.verification_samples,
+                "max_abs_error": max_abs_error,
+                "tolerance": cfg.tolerance,
+                "single_request_ms": timings,
+            })
+
+            logger.info(
+                "Model deployment completed | max_abs_error=%.3g keras_ms=%s numpy_ms=%s",
+                max_abs_error,
+                timings["keras"],
+                timings["numpy"],
+            )
+
+            return ModelDeploymentArtifact(
+                weights_file_path=cfg.weights_file_path,
+                preprocessor_file_path=cfg.preprocessor_file_path,
+                report_file_path=cfg.report_file_path,
+                max_abs_error=max_abs_error,
+            )
+
+        except Exception as e:
+            logger.error(f"Error during model deployment: {str(e)}", exc_info=True)
+            raise CustomException(e, sys) from e
@@ -0,0 +1,283 @@
+import os
+import sys
+import time
+from concurrent.futures import as_completed
+from datetime import datetime
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.entities.component_config_entity import ModelEvaluationConfig
+from src.entities.artifact_entity import ModelEvaluationArtifact
+from src.data_access.feature_store import FeatureStore
+from src.models.base import ForecastPreprocessor
+from src.models.factory import create_forecaster
+from src.utils.helper import save_json
+from src.utils.training_helper import make_supervised_windows, worker_pool
+from src.utils.evaluation_helper import (
+    error_summary,
+    horizon_actuals,
+    recursive_forecast,
+    windows_ending_at,
+)
+
+logger = get_logger(__name__)
+
+
+# =====================================================================
+# WORKER SIDE
+# =====================================================================
+
+_worker_threads = 1
+
+
+def _init_worker(threads: int) -> None:
+    """Thread count handed to the forecasters (native pools are limited by ``worker_pool``)."""
+    global _worker_threads
+    _worker_threads = threads
+
+
+def _run_fold(task: dict) -> dict:
+    """
+    Train on every day up to the fold's first origin and forecast
+    ``steps`` days ahead from each origin in the fold.
+
+    Counts are read from the feature store (a memory-mapped file written
+    by feature engineering), so workers do not rebuild them.
+    """
+    start = time.perf_counter()
+
+    store = FeatureStore(task["feature_store_dir"])
+    _, values = store.read(task["feature_set"], end=task["end_date"], columns=task["series"])
+    values = np.asarray(values, dtype=np.float32)
+
+    origins = np.arange(task["first_origin"], task["last_origin"] + 1)
+    seq_length, steps = task["seq_length"], task["steps"]
+
+    # Scaling is fitted on the fold's training days only
+    train_values = values[:task["first_origin"] + 1]
+    preprocessor = ForecastPreprocessor(list(task["series"]), seq_length).fit(train_values)
+    scaled = preprocessor.transform(values)
+
+    X, y = make_supervised_windows(scaled[:task["first_origin"] + 1], seq_length, 1)
+    n_val = max(1, int(len(X) * task["validation_ratio"]))
+
+    forecaster = create_forecaster(task["family"], task["params"], threads=_worker_threads,
+                                   random_state=task["random_state"])
+    forecaster.fit(X[:-n_val], y[:-n_val], X[-n_val:], y[-n_val:], budget=task["budget"])
+    fit_seconds = time.perf_counter() - start
+
+    predicted = recursive_forecast(forecaster.predict, windows_ending_at(scaled, origins, seq_length), steps)
+    predicted = np.clip(preprocessor.inverse_transform(predicted), 0, None)
+    actual = horizon_actuals(values, origins, steps)
+
+    seconds = time.perf_counter() - start
+    return {
+        "fold": task["fold"],
+        "actual": actual,
+        "predicted": predicted,
+        "train_windows": int(len(X)),
+        "fit_seconds": round(fit_seconds, 3),
+        "predict_seconds": round(seconds - fit_seconds, 3),
+        "seconds": round(seconds, 3),
+        "pid": os.getpid(),
+    }
+
+
+# =====================================================================
+# DRIVER
+# =====================================================================
+
+class ModelEvaluator:
+    """
+    Walk-forward (rolling-origin) backtest.
+
+    The forecast origins closest to the end of the history are cut into
+    ``n_folds`` consecutive blocks of ``fold_days``. Each fold retrains the
+    forecaster on an expanding window (all days up to its first origin)
+    and forecasts ``horizon_steps`` days recursively from every origin in
+    the block, one batched model call per step. Folds are independent and
+    run in parallel processes; errors are pooled per horizon step and per
+    complaint type.
+    """
+
+    def __init__(self, config: ModelEvaluationConfig = None):
+        self.config = config or ModelEvaluationConfig()
+        self.store = FeatureStore(self.config.feature_store_dir)
+
+    # ----------------------------------------------------------------
+    # Folds
+    # ----------------------------------------------------------------
+    def series(self) -> List[str]:
+        manifest = self.store.manifest(self.config.feature_set)
+        if manifest is None:
+            raise FileNotFoundError(f"Feature set not found: {self.config.feature_set}")
+
+        series = manifest.get("metadata", {}).get("series")
+        if not series:
+            raise ValueError("Feature set has no series metadata; rerun feature engineering")
+        return list(series)
+
+    def make_folds(self, dates: pd.DatetimeIndex, series: List[str]) -> List[dict]:
+        cfg = self.config
+        seq_length = cfg.training.seq_length
+
+        # Last origin still has horizon_steps actual days after it
+        last_origin = len(dates) - 1 - cfg.horizon_steps
+        first_origin = last_origin - cfg.n_folds * cfg.fold_days + 1
+
+        min_train_days = seq_length + 2 * cfg.fold_days
+        if first_origin + 1 < min_train_days:
+            raise ValueError(
+                f"Not enough history for {cfg.n_folds} folds of {cfg.fold_days} days "
+                f"(have {len(dates)} days, need {min_train_days + cfg.n_folds * cfg.fold_days + cfg.horizon_steps})"
+            )
+
+        folds = []
+        for fold in range(cfg.n_folds):
+            lo = first_origin + fold * cfg.fold_days
+            hi = lo + cfg.fold_days - 1
+            folds.append({
+                "fold": fold,
+                "feature_store_dir": cfg.feature_store_dir,
+                "feature_set": cfg.feature_set,
+                "series": series,
+                "end_date": dates[hi + cfg.horizon_steps].strftime("%Y-%m-%d"),
+                "first_origin": lo,
+                "last_origin": hi,
+                "seq_length": seq_length,
+                "steps": cfg.horizon_steps,
+                "family": cfg.family,
+                "params": cfg.model_params(),
+                "budget": cfg.budget,
+                "validation_ratio": cfg.training.validation_ratio,
+                "random_state": cfg.training.random_state,
+            })
+        return folds
+
+    # ----------------------------------------------------------------
+    # Chart
+    # ----------------------------------------------------------------
+    @staticmethod
+    def save_chart(summary: dict, path: str) -> None:
+        # Figure without pyplot: no GUI backend, safe inside the API/Streamlit
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(12, 4.5))
+        ax_step, ax_series = fig.subplots(1, 2)
+
+        steps = [h["step"] for h in summary["per_horizon"]]
+        ax_step.plot(steps, [h["mae"] for h in summary["per_horizon"]], marker="o", label="MAE")
+        ax_step.set_xlabel("Horizon (days ahead)")
+        ax_step.set_ylabel("MAE (complaints/day)")
+        ax_step.set_xticks(steps)
+        ax_step.set_title("Error by horizon")
+        mape_axis = ax_step.twinx()
+        mape_axis.plot(steps, [h["mape"] or 0 for h in summary["per_horizon"]],
+                       marker="s", color="tab:orange", label="MAPE %")
+        mape_axis.set_ylabel("MAPE (%)")
+
+        names = list(summary["per_series"])
+        ax_series.barh(names, [summary["per_series"][n]["mae"] for n in names])
+        ax_series.invert_yaxis()
+        ax_series.set_xlabel("MAE (complaints/day)")
+        ax_series.set_title("Error by complaint type")
+
+        fig.tight_layout()
+        fig.savefig(path, dpi=110)
+
+    # ----------------------------------------------------------------
+    # Entry point
+    # ----------------------------------------------------------------
+    def initiate_model_evaluation(self) -> ModelEvaluationArtifact:
+        try:
+            cfg = self.config
+            start = time.perf_counter()
+
+            series = self.series()
+            dates, _ = self.store.read(cfg.feature_set)
+            folds = self.make_folds(dates, series)
+
+            logger.info(
+                "Walk-forward evaluation started | family=%s folds=%s fold_days=%s horizon=%s workers=%s",
+                cfg.family, cfg.n_folds, cfg.fold_days, cfg.horizon_steps, cfg.max_workers,
+            )
+
+            results = {}
+            with worker_pool(min(cfg.max_workers, len(folds)), cfg.threads_per_worker,
+                             _init_worker, (cfg.threads_per_worker,)) as pool:
+                futures = [pool.submit(_run_fold, task) for task in folds]
+                for future in as_completed(futures):
+                    result = future.result()
+                    results[result["fold"]] = result
+                    logger.info("Fold %s done | fit=%.1fs predict=%.2fs",
+                                result["fold"], result["fit_seconds"], result["predict_seconds"])
+
+            ordered = [results[task["fold"]] for task in folds]
+            actual = np.concatenate([r["actual"] for r in ordered])
+            predicted = np.concatenate([r["predicted"] for r in ordered])
+            summary = error_summary(actual, predicted, series)
+
+            fold_reports = []
+            for task, result in zip(folds, ordered):
+                fold_summary = error_summary(result["actual"], result["predicted"], series)
+                fold_reports.append({
+                    "fold": task["fold"],
+                    "train_end": str(dates[task["first_origin"]].date()),
+                    "origins": [str(dates[task["first_origin"]].date()), str(dates[task["last_origin"]].date())],
+                    "train_windows": result["train_windows"],
+                    "mae": fold_summary["mae"],
+                    "mape": fold_summary["mape"],
+                    "fit_seconds": result["fit_seconds"],
+                    "predict_seconds": result["predict_seconds"],
+                    "seconds": result["seconds"],
+                })
+
+            wall_seconds = time.perf_counter() - start
+            fold_seconds = sum(r["seconds"] for r in ordered)
+
+            os.makedirs(cfg.evaluation_dir, exist_ok=True)
+            save_json(cfg.report_file_path, {
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "family": cfg.family,
+                "params": cfg.model_params(),
+                "budget": cfg.budget,
+                "settings": {
+                    "n_folds": cfg.n_folds,
+                    "fold_days": cfg.fold_days,
+                    "horizon_steps": cfg.horizon_steps,
+                    "seq_length": cfg.training.seq_length,
+                    "max_workers": cfg.max_workers,
+                    "threads_per_worker": cfg.threads_per_worker,
+                },
+                "feature_set": cfg.feature_set,
+                "feature_set_version": self.store.manifest(cfg.feature_set)["version"],
+                **summary,
+                "folds": fold_reports,
+                "timing": {
+                    "wall_seconds": round(wall_seconds, 3),
+                    "fold_seconds": round(fold_seconds, 3),
+                    "parallel_speedup": round(fold_seconds / wall_seconds, 2) if wall_seconds else None,
+                },
+            })
+            self.save_chart(summary, cfg.png_file_path)
+
+            logger.info(
+                "Walk-forward evaluation completed | mae=%.3f mape=%s wall=%.1fs fold_total=%.1fs",
+                summary["mae"], summary["mape"], wall_seconds, fold_seconds,
+            )
+
+            return ModelEvaluationArtifact(
+                report_file_path=cfg.report_file_path,
+                png_file_path=cfg.png_file_path,
+                mae=summary["mae"],
+                mape=summary["mape"],
+                n_folds=cfg.n_folds,
+            )
+
+        except Exception as e:
+            logger.error(f"Error during model evaluation: {str(e)}", exc_info=True)
+            raise CustomException(e, sys) from e
@@ -0,0 +1,162 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Type
+
+import numpy as np
+
+from src.constants.paths import RANDOM_STATE
+
+
+# =====================================================================
+# FORECASTER INTERFACE
+# =====================================================================
+
+class BaseForecaster(ABC):
+    """
+    Common interface for the model families the search can evaluate.
+
+    Every forecaster maps windows shaped (samples, seq_length, series) to
+    next-day values shaped (samples, series), both in scaled units.
+    ``budget`` is the family's training length (epochs, boosting rounds,
+    iterations) and is what successive halving grows between rungs.
+    """
+
+    family: str = ""
+    budget_param: str = ""
+
+    def __init__(self, params: dict, threads: int = 1, random_state: int = RANDOM_STATE):
+        self.params = dict(params)
+        self.threads = threads
+        self.random_state = random_state
+        self.model = None
+
+    @abstractmethod
+    def fit(self, X: np.ndarray, y: np.ndarray, X_val: np.ndarray, y_val: np.ndarray,
+            budget: int) -> "BaseForecaster":
+        """Train for ``budget`` units, validating on ``X_val`` / ``y_val``."""
+
+    @abstractmethod
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Next-day values shaped (samples, series)."""
+
+    @staticmethod
+    def flatten(X: np.ndarray) -> np.ndarray:
+        """(samples, seq_length, series) -> (samples, seq_length * series) for tree models."""
+        return np.asarray(X, dtype=np.float32).reshape(len(X), -1)
+
+
+# =====================================================================
+# LSTM
+# =====================================================================
+
+class LSTMForecaster(BaseForecaster):
+    family = "lstm"
+    budget_param = "epochs"
+
+    def fit(self, X, y, X_val, y_val, budget):
+        import keras
+        import tensorflow as tf
+        from src.models.trainer import build_lstm_model, configure_cpu_threads
+
+        # Thread pools can only be sized once per process (first trial)
+        if tf.config.threading.get_intra_op_parallelism_threads() != self.threads:
+            configure_cpu_threads(self.threads, 1)
+        keras.utils.set_random_seed(self.random_state)
+
+        params = dict(self.params)
+        batch_size = params.pop("batch_size", 32)
+        patience = params.pop("patience", 5)
+
+        self.model = build_lstm_model(X.shape[1], X.shape[2], **params)
+        self.model.fit(
+            np.asarray(X), np.asarray(y),
+            validation_data=(np.asarray(X_val), np.asarray(y_val)),
+            epochs=int(budget),
+            batch_size=batch_size,
+            shuffle=True,
+            callbacks=[keras.callbacks.EarlyStopping(patience=patience, restore_best_weights=True)],
+            verbose=0,
+        )
+        return self
+
+    def predict(self, X):
+        return np.asarray(self.model.predict_on_batch(np.asarray(X, dtype=np.float32)))
+
+
+# =====================================================================
+# GRADIENT BOOSTING
+# =====================================================================
+
+class XGBoostForecaster(BaseForecaster):
+    family = "xgboost"
+    budget_param = "n_estimators"
+
+    def fit(self, X, y, X_val, y_val, budget):
+        from xgboost import XGBRegressor
+
+        params = dict(self.params)
+        patience = params.pop("patience", 20)
+
+        # 2-D targets are fitted natively as a multi-output model
+        self.model = XGBRegressor(
+            n_estimators=int(budget),
+            tree_method="hist",
+            n_jobs=self.threads,
+            random_state=self.random_state,
+            early_stopping_rounds=patience,
+            **params,
+        )
+        self.model.fit(self.flatten(X), np.asarray(y), eval_set=[(self.flatten(X_val), np.asarray(y_val))], verbose=False)
+        return self
+
+    def predict(self, X):
+        return self.model.predict(self.flatten(X)).reshape(len(X), -1)
+
+
+class CatBoostForecaster(BaseForecaster):
+    family = "catboost"
+    budget_param = "iterations"
+
+    def fit(self, X, y, X_val, y_val, budget):
+        from catboost import CatBoostRegressor
+
+        params = dict(self.params)
+        patience = params.pop("patience", 20)
+
+        self.model = CatBoostRegressor(
+            iterations=int(budget),
+            loss_function="MultiRMSE",
+            thread_count=self.threads,
+            random_seed=self.random_state,
+            early_stopping_rounds=patience,
+            allow_writing_files=False,
+            verbose=False,
+            **params,
+        )
+        self.model.fit(self.flatten(X), np.asarray(y), eval_set=(self.flatten(X_val), np.asarray(y_val)))
+        return self
+
+    def predict(self, X):
+        return self.model.predict(self.flatten(X)).reshape(len(X), -1)
+
+
+# =====================================================================
+# FACTORY
+# =====================================================================
+
+MODEL_FAMILIES: Dict[str, Type[BaseForecaster]] = {
+    LSTMForecaster.family: LSTMForecaster,
+    XGBoostForecaster.family: XGBoostForecaster,
+    CatBoostForecaster.family: CatBoostForecaster,
+}
+
+
+def create_forecaster(family: str, params: dict, threads: int = 1,
+                      random_state: int = RANDOM_STATE) -> BaseForecaster:
+    """
+    Instantiate a forecaster by family name (``lstm``, ``xgboost``,
+    ``catboost``). Framework imports happen on ``fit``, so only the
+    families actually used need to be installed.
+    """
+    if family not in MODEL_FAMILIES:
+        raise ValueError(f"Unknown model family: {family} (expected one of {sorted(MODEL_FAMILIES)})")
+    return MODEL_FAMILIES[family](params, threads=threads, random_state=random_state)
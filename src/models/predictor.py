@@ -0,0 +1,283 @@
+import sys
+import time
+import pickle
+import asyncio
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.models.base import ForecastPreprocessor, NumpyForecastModel
+from src.utils.training_helper import TOTAL_SERIES, build_daily_count_matrix
+from src.constants.paths import PREDICTION_MAX_BATCH_SIZE, PREDICTION_MAX_WAIT_MS
+
+logger = get_logger(__name__)
+
+
+# =====================================================================
+# FORECAST PREDICTOR
+# =====================================================================
+
+class ForecastPredictor:
+    """
+    Trained forecaster plus its preprocessor.
+
+    ``predict`` takes raw daily counts shaped (batch, seq_length, series)
+    and returns next-day counts shaped (batch, series) from a single
+    model call, whatever the batch size.
+    """
+
+    def __init__(self, model, preprocessor: ForecastPreprocessor):
+        self.model = model
+        self.preprocessor = preprocessor
+
+    @classmethod
+    def load(cls, model_file_path: str, preprocessor_file_path: str) -> "ForecastPredictor":
+        """
+        Load a ``.npz`` NumPy-runtime export (no TensorFlow import) or a
+        Keras model file.
+        """
+        try:
+            if model_file_path.endswith(".npz"):
+                model = NumpyForecastModel.load(model_file_path)
+            else:
+                # TensorFlow is only imported when a Keras model is served
+                import keras
+
+                model = keras.models.load_model(model_file_path, compile=False)
+
+            with open(preprocessor_file_path, "rb") as f:
+                preprocessor = pickle.load(f)
+
+            logger.info(
+                "Forecast model loaded | path=%s series=%s",
+                model_file_path,
+                preprocessor.n_series,
+            )
+            return cls(model, preprocessor)
+
+        except Exception as e:
+            raise CustomException(e, sys) from e
+
+    @property
+    def columns(self) -> List[str]:
+        return self.preprocessor.columns
+
+    @property
+    def input_shape(self) -> Tuple[int, int]:
+        return self.preprocessor.seq_length, self.preprocessor.n_series
+
+    def validate_window(self, window) -> np.ndarray:
+        """Coerce one request window to float32 (seq_length, series)."""
+        window = np.asarray(window, dtype=np.float32)
+        if window.shape != self.input_shape:
+            raise ValueError(
+                f"Expected history of shape {self.input_shape} "
+                f"(days x series {self.columns}), got {window.shape}"
+            )
+        return window
+
+    def predict(self, windows: np.ndarray) -> np.ndarray:
+        windows = np.asarray(windows, dtype=np.float32)
+        scaled = self.preprocessor.transform(windows)
+        output = np.asarray(self.model.predict_on_batch(scaled))
+        return np.clip(self.preprocessor.inverse_transform(output), 0, None)
+
+    def count_matrix(self, df: pd.DataFrame, date_column: str = "DATE",
+                     category_column: str = "COMPLAINT TYPE", **kwargs) -> pd.DataFrame:
+        """Daily count matrix of ``df`` in the series order the model expects."""
+        categories = [c for c in self.columns if c != TOTAL_SERIES]
+        return build_daily_count_matrix(df, categories, date_column, category_column, **kwargs)
+
+    def latest_window(self, df: pd.DataFrame, **kwargs) -> Tuple[pd.Timestamp, np.ndarray]:
+        """Last ``seq_length`` days of ``df`` and the date being forecast."""
+        matrix = self.count_matrix(df, **kwargs)
+        seq_length = self.preprocessor.seq_length
+        if len(matrix) < seq_length:
+            raise ValueError(f"Need at least {seq_length} days of history, got {len(matrix)}")
+
+        target_date = matrix.index[-1] + pd.Timedelta(days=self.preprocessor.horizon)
+        return target_date, matrix.to_numpy()[-seq_length:]
+
+    def latest_window_from_store(self, store, feature_set: str) -> Tuple[pd.Timestamp, np.ndarray]:
+        """
+        Same as ``latest_window`` but reads only the last ``seq_length``
+        rows of the model's series from a ``FeatureStore``.
+        """
+        seq_length = self.preprocessor.seq_length
+        dates, values = store.tail(feature_set, seq_length, columns=self.columns)
+        if len(dates) < seq_length:
+            raise ValueError(f"Need at least {seq_length} days of history, got {len(dates)}")
+
+        target_date = dates[-1] + pd.Timedelta(days=self.preprocessor.horizon)
+        return target_date, values
+
+
+# =====================================================================
+# MICRO-BATCHING
+# =====================================================================
+
+class MicroBatchPredictor:
+    """
+    Groups concurrent single-window requests into batched model calls.
+
+    Callers ``await predict(window)``; a background task collects queued
+    windows until ``max_batch_size`` is reached or ``max_wait_ms`` has
+    passed since the first one arrived, runs ``predict_fn`` once on the
+    stacked batch in a worker thread and resolves each caller's future
+    with its own row.
+
+    A caller may pass its own ``predict_fn`` (e.g. the predictor it
+    validated the window against): windows are only stacked with others
+    for the same function, so a model swap never mixes two models' inputs
+    in one call.
+
+    Usage:
+        batcher = MicroBatchPredictor(predictor.predict)
+        await batcher.start()
+        forecast = await batcher.predict(window)
+        await batcher.stop()
+    """
+
+    def __init__(self,
+                 predict_fn: Callable[[np.ndarray], np.ndarray],
+                 max_batch_size: int = PREDICTION_MAX_BATCH_SIZE,
+                 max_wait_ms: float = PREDICTION_MAX_WAIT_MS):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # Requests taken off the queue and not answered yet
+        self._batch: list = []
+
+        self.batches = 0
+        self.requests = 0
+        self.largest_batch = 0
+
+    # ----------------------------------------------------------------
+    # Lifecycle
+    # ----------------------------------------------------------------
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._worker(), name="forecast-micro-batcher")
+
+    @staticmethod
+    def _fail(requests: list, error: Exception) -> None:
+        for _, _, future in requests:
+            if not future.done():
+                future.set_exception(error)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        # Fail anything still queued instead of leaving callers hanging
+        queued = []
+        while not self._queue.empty():
+            queued.append(self._queue.get_nowait())
+        self._fail(queued, RuntimeError("Forecast batcher stopped"))
+
+    # ----------------------------------------------------------------
+    # Requests
+    # ----------------------------------------------------------------
+    async def predict(self, window: np.ndarray,
+                      predict_fn: Optional[Callable[[np.ndarray], np.ndarray]] = None) -> np.ndarray:
+        if not self.running:
+            raise RuntimeError("Forecast batcher is not running")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((predict_fn or self.predict_fn, window, future))
+        return await future
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "mean_batch_size": round(self.requests / self.batches, 3) if self.batches else 0.0,
+            "largest_batch": self.largest_batch,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000.0,
+        }
+
+    # ----------------------------------------------------------------
+    # Worker
+    # ----------------------------------------------------------------
+    async def _collect(self) -> None:
+        """Block for the first request, then fill ``_batch`` until size or deadline."""
+        loop = asyncio.get_running_loop()
+        self._batch.append(await self._queue.get())
+        deadline = loop.time() + self.max_wait
+
+        while len(self._batch) < self.max_batch_size:
+            # Take whatever is already queued without waiting
+            if not self._queue.empty():
+                self._batch.append(self._queue.get_nowait())
+                continue
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                self._batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+    async def _run(self, predict_fn: Callable, requests: list) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            windows = np.stack([window for _, window, _ in requests])
+            start = time.perf_counter()
+            outputs = await loop.run_in_executor(None, predict_fn, windows)
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+        except Exception as e:
+            logger.exception("Batched forecast failed | batch=%s", len(requests))
+            self._fail(requests, e)
+            return
+
+        self.batches += 1
+        self.requests += len(requests)
+        self.largest_batch = max(self.largest_batch, len(requests))
+        logger.debug("Forecast batch | size=%s model_ms=%.2f", len(requests), elapsed_ms)
+
+        for row, (_, _, future) in zip(outputs, requests):
+            if not future.done():
+                future.set_result(row)
+
+    async def _worker(self) -> None:
+        try:
+            while True:
+                await self._collect()
+                # Callers that gave up (client disconnect) are dropped from the batch
+                groups = {}
+                for request in self._batch:
+                    if not request[2].done():
+                        groups.setdefault(request[0], []).append(request)
+
+                for predict_fn, requests in groups.items():
+                    await self._run(predict_fn, requests)
+                self._batch = []
+
+        except asyncio.CancelledError:
+            # Also fail requests already collected or waiting on the model
+            self._fail(self._batch, RuntimeError("Forecast batcher stopped"))
+            self._batch = []
+            raise
@@ -0,0 +1,394 @@
+import os
+import sys
+import uuid
+import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.entities.component_config_entity import ModelRegistryConfig
+from src.constants.paths import (
+    MODEL_DEPLOYMENT_MODEL_FILE,
+    MODEL_DEPLOYMENT_PREPROCESSOR_FILE,
+    MODEL_DEPLOYMENT_WEIGHTS_FILE,
+    MODEL_REGISTRY_MANIFEST_FILE,
+)
+from src.models.predictor import ForecastPredictor
+from src.utils.helper import file_lock, file_sha256, load_json, save_json
+
+logger = get_logger(__name__)
+
+
+# =====================================================================
+# REGISTRY
+# =====================================================================
+
+class ModelRegistry:
+    """
+    File-based registry of model + preprocessor versions.
+
+    Layout::
+
+        <registry_dir>/registry.json          index + active pointer
+        <registry_dir>/versions/v0001/        model, preprocessor, manifest.json
+                                              and optional NumPy-runtime weights
+
+    A version directory is staged under a temporary name and renamed into
+    place, and ``registry.json`` is replaced atomically, so readers never
+    see a half-written version or index. Index updates hold an
+    inter-process lock (``.registry.json.lock``), so the pipeline, the
+    incremental trainer and the API can write concurrently. Loaded predictors are cached per
+    version (LRU, ``max_loaded_versions``) and only loaded on first use.
+    """
+
+    def __init__(self,
+                 config: ModelRegistryConfig = None,
+                 loader: Callable[[str], object] = None):
+        self.config = config or ModelRegistryConfig()
+        self.loader = loader or load_version_predictor
+        self._lock = threading.RLock()
+        self._loaded: "OrderedDict[str, object]" = OrderedDict()
+
+    # ----------------------------------------------------------------
+    # Index
+    # ----------------------------------------------------------------
+    def _read_index(self) -> dict:
+        return load_json(self.config.registry_file_path, default={"active": None, "versions": {}})
+
+    @contextmanager
+    def _index_lock(self) -> Iterator[None]:
+        """Serialise read-modify-write cycles of the index across threads and processes."""
+        directory, filename = os.path.split(self.config.registry_file_path)
+        with self._lock, file_lock(os.path.join(directory, f".{filename}.lock")):
+            yield
+
+    def _write_index(self, index: dict) -> None:
+        index["updated_at"] = datetime.now().isoformat(timespec="seconds")
+        save_json(self.config.registry_file_path, index)
+
+    def list_versions(self) -> Dict[str, dict]:
+        return self._read_index()["versions"]
+
+    def active_version(self) -> Optional[str]:
+        return self._read_index()["active"]
+
+    def version_dir(self, version: str) -> str:
+        return os.path.join(self.config.versions_dir, version)
+
+    def model_file_path(self, version: str) -> str:
+        return os.path.join(self.version_dir(version), MODEL_DEPLOYMENT_MODEL_FILE)
+
+    def preprocessor_file_path(self, version: str) -> str:
+        return os.path.join(self.version_dir(version), MODEL_DEPLOYMENT_PREPROCESSOR_FILE)
+
+    def index_mtime(self) -> Optional[int]:
+        """Modification time of ``registry.json`` (None when absent)."""
+        try:
+            return os.stat(self.config.registry_file_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    # ----------------------------------------------------------------
+    # Writes
+    # ----------------------------------------------------------------
+    def register(self,
+                 model_file_path: str,
+                 preprocessor_file_path: str,
+                 metrics: dict = None,
+                 activate: bool = False,
+                 weights_file_path: Optional[str] = None) -> Tuple[str, bool]:
+        """
+        Copy a model + preprocessor pair (and the NumPy-runtime export,
+        when given) into a new version.
+
+        A model whose files match an existing version by SHA-256 is not
+        copied again; that version is returned instead.
+
+        Returns
+        -------
+        tuple
+            (version, already_registered)
+        """
+        try:
+            model_sha256 = file_sha256(model_file_path)
+            weights_sha256 = file_sha256(weights_file_path) if weights_file_path else None
+
+            with self._index_lock():
+                index = self._read_index()
+
+                existing = next(
+                    (
+                        v for v, info in index["versions"].items()
+                        if info["model_sha256"] == model_sha256
+                        and info.get("weights_sha256") == weights_sha256
+                    ),
+                    None,
+                )
+                if existing is not None:
+                    logger.info("Model already registered | version=%s", existing)
+                    if activate and index["active"] != existing:
+                        index["active"] = existing
+                        self._write_index(index)
+                        logger.info("Model version activated | version=%s", existing)
+                    return existing, True
+
+                os.makedirs(self.config.versions_dir, exist_ok=True)
+                staging_dir = os.path.join(self.config.versions_dir, f".staging-{uuid.uuid4().hex}")
+                os.makedirs(staging_dir)
+
+                shutil.copy2(model_file_path, os.path.join(staging_dir, MODEL_DEPLOYMENT_MODEL_FILE))
+                shutil.copy2(preprocessor_file_path, os.path.join(staging_dir, MODEL_DEPLOYMENT_PREPROCESSOR_FILE))
+                if weights_file_path:
+                    shutil.copy2(weights_file_path, os.path.join(staging_dir, MODEL_DEPLOYMENT_WEIGHTS_FILE))
+
+                info = {
+                    "registered_at": datetime.now().isoformat(timespec="seconds"),
+                    "model_sha256": model_sha256,
+                    "weights_sha256": weights_sha256,
+                    "runtime": "numpy" if weights_file_path else "keras",
+                    "source_model_file": os.path.abspath(model_file_path),
+                    "metrics": metrics or {},
+                }
+                save_json(os.path.join(staging_dir, MODEL_REGISTRY_MANIFEST_FILE), info)
+
+                version = self._next_version(index)
+                os.replace(staging_dir, self.version_dir(version))
+
+                index["versions"][version] = info
+                if activate or index["active"] is None:
+                    index["active"] = version
+                self._write_index(index)
+
+            logger.info("Model registered | version=%s active=%s", version, index["active"])
+            return version, False
+
+        except Exception as e:
+            raise CustomException(e, sys) from e
+
+    def _next_version(self, index: dict) -> str:
+        numbers = [int(v[1:]) for v in index["versions"]]
+        number = max(numbers, default=0) + 1
+        while os.path.exists(self.version_dir(f"v{number:04d}")):
+            number += 1
+        return f"v{number:04d}"
+
+    def activate(self, version: str) -> None:
+        with self._index_lock():
+            index = self._read_index()
+            if version not in index["versions"]:
+                raise KeyError(f"Unknown model version: {version}")
+            index["active"] = version
+            self._write_index(index)
+        logger.info("Model version activated | version=%s", version)
+
+    # ----------------------------------------------------------------
+    # Loading
+    # ----------------------------------------------------------------
+    def load(self, version: Optional[str] = None):
+        """
+        Predictor for ``version`` (default: the active one), loaded on
+        first use and cached.
+        """
+        version = version or self.active_version()
+        if version is None:
+            raise LookupError("No model version is registered")
+
+        with self._lock:
+            if version in self._loaded:
+                self._loaded.move_to_end(version)
+                return self._loaded[version]
+
+            if version not in self.list_versions():
+                raise KeyError(f"Unknown model version: {version}")
+
+        # Load outside the lock so a slow load does not block lookups
+        predictor = self.loader(self.version_dir(version))
+
+        with self._lock:
+            self._loaded[version] = predictor
+            self._loaded.move_to_end(version)
+            while len(self._loaded) > self.config.max_loaded_versions:
+                evicted, _ = self._loaded.popitem(last=False)
+                logger.info("Model version evicted from memory | version=%s", evicted)
+
+        return predictor
+
+    def loaded_versions(self) -> List[str]:
+        with self._lock:
+            return list(self._loaded)
+
+
+def load_version_predictor(version_dir: str) -> ForecastPredictor:
+    """
+    Serve the NumPy-runtime export when the version has one, so the
+    serving process does not import TensorFlow; fall back to Keras.
+    """
+    weights_file_path = os.path.join(version_dir, MODEL_DEPLOYMENT_WEIGHTS_FILE)
+    model_file_path = (
+        weights_file_path if os.path.exists(weights_file_path)
+        else os.path.join(version_dir, MODEL_DEPLOYMENT_MODEL_FILE)
+    )
+    return ForecastPredictor.load(
+        model_file_path,
+        os.path.join(version_dir, MODEL_DEPLOYMENT_PREPROCESSOR_FILE),
+    )
+
+
+# =====================================================================
+# SERVING HOLDER
+# =====================================================================
+
+class ServingModel:
+    """
+    The predictor a serving process answers with.
+
+    The active (version, predictor) pair is held in a single attribute, so
+    a swap is one reference assignment: requests already running keep the
+    old model, the next request gets the new one. New versions are loaded
+    and warmed in a background thread before they are swapped in.
+    """
+
+    def __init__(self, registry: ModelRegistry = None):
+        self.registry = registry or ModelRegistry()
+        self._current: Tuple[Optional[str], Optional[object]] = (None, None)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-preload")
+        self._pending: Optional[Future] = None
+        self._seen_index_mtime = None
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+
+    # ----------------------------------------------------------------
+    # Current model
+    # ----------------------------------------------------------------
+    @property
+    def version(self) -> Optional[str]:
+        return self._current[0]
+
+    @property
+    def predictor(self):
+        return self._current[1]
+
+    @property
+    def ready(self) -> bool:
+        return self._current[1] is not None
+
+    def predict(self, windows: np.ndarray) -> np.ndarray:
+        """Predict with whichever version is current when the call starts."""
+        predictor = self._current[1]
+        if predictor is None:
+            raise RuntimeError("No model version is loaded")
+        return predictor.predict(windows)
+
+    # ----------------------------------------------------------------
+    # Loading and swapping
+    # ----------------------------------------------------------------
+    @staticmethod
+    def warm_up(predictor) -> None:
+        """Run one dummy batch so graph tracing / allocation is paid up front."""
+        seq_length, n_series = predictor.input_shape
+        predictor.predict(np.zeros((1, seq_length, n_series), dtype=np.float32))
+
+    def _prepare_and_swap(self, version: str) -> str:
+        predictor = self.registry.load(version)
+        self.warm_up(predictor)
+
+        previous = self._current[0]
+        self._current = (version, predictor)
+        logger.info("Serving model swapped | %s -> %s", previous, version)
+        return version
+
+    def load_active(self) -> Optional[str]:
+        """Load and warm the active version in the calling thread."""
+        mtime = self.registry.index_mtime()
+        version = self.registry.active_version()
+        if version is None:
+            logger.warning("No active model version in registry | dir=%s", self.registry.config.registry_dir)
+            self._seen_index_mtime = mtime
+            return None
+        version = self._prepare_and_swap(version)
+        self._seen_index_mtime = mtime
+        return version
+
+    def preload(self, version: str) -> Future:
+        """Load and warm ``version`` in the background, then swap it in."""
+        if version == self.version:
+            future = Future()
+            future.set_result(version)
+            return future
+
+        self._pending = self._executor.submit(self._prepare_and_swap, version)
+        self._pending.add_done_callback(self._log_failed_preload)
+        return self._pending
+
+    @staticmethod
+    def _log_failed_preload(future: Future) -> None:
+        if future.exception() is not None:
+            logger.error("Background model preload failed", exc_info=future.exception())
+
+    def refresh(self) -> Optional[Future]:
+        """
+        Preload the registry's active version if it changed. The index is
+        only marked as seen once that version is served, so a failed
+        preload is retried on the next poll.
+        """
+        mtime = self.registry.index_mtime()
+        if mtime == self._seen_index_mtime:
+            return None
+        if self._pending is not None and not self._pending.done():
+            return self._pending
+
+        version = self.registry.active_version()
+        if version is None or version == self.version:
+            self._seen_index_mtime = mtime
+            return None
+
+        future = self.preload(version)
+        future.add_done_callback(lambda done: self._mark_seen(done, mtime))
+        return future
+
+    def _mark_seen(self, future: Future, mtime: Optional[int]) -> None:
+        if future.exception() is None:
+            self._seen_index_mtime = mtime
+
+    # ----------------------------------------------------------------
+    # Registry watcher
+    # ----------------------------------------------------------------
+    def start_watching(self, interval_seconds: float = None) -> None:
+        """Poll ``registry.json`` and hot-swap when the active version changes."""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+
+        interval = interval_seconds or self.registry.config.poll_interval_seconds
+        self._stop.clear()
+
+        def watch():
+            while not self._stop.wait(interval):
+                try:
+                    self.refresh()
+                except Exception:
+                    logger.exception("Registry poll failed")
+
+        self._watcher = threading.Thread(target=watch, name="model-registry-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=5)
+            self._watcher = None
+        self._executor.shutdown(wait=False)
+
+    def status(self) -> dict:
+        return {
+            "serving_version": self.version,
+            "active_version": self.registry.active_version(),
+            "loaded_versions": self.registry.loaded_versions(),
+            "preload_running": self._pending is not None and not self._pending.done(),
+        }
@@ -0,0 +1,338 @@
+import os
+import sys
+import json
+import math
+import time
+import pickle
+import hashlib
+import itertools
+from concurrent.futures import as_completed
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.entities.component_config_entity import ModelSearchConfig
+from src.entities.artifact_entity import DataIngestionArtifact, ModelSearchArtifact
+from src.models.factory import MODEL_FAMILIES, create_forecaster
+from src.utils.helper import read_yaml, save_json
+from src.utils.training_helper import worker_pool
+
+logger = get_logger(__name__)
+
+# Early stopping watches the "val" tail; trials are ranked on the later "score" tail
+ARRAY_NAMES = ("X_train", "y_train", "X_val", "y_val", "X_score", "y_score")
+PREPROCESSOR_FILE = "preprocessor.pkl"
+
+
+# =====================================================================
+# WORKER SIDE
+# =====================================================================
+
+_worker_arrays: Dict[str, np.ndarray] = {}
+_worker_preprocessor = None
+_worker_threads = 1
+
+
+def _init_worker(arrays_dir: str, threads: int) -> None:
+    """
+    Memory-map the shared arrays. Every worker maps the same read-only
+    ``.npy`` files, so the windows are paged in from the OS cache instead
+    of being copied per trial.
+    """
+    global _worker_preprocessor, _worker_threads
+
+    _worker_threads = threads
+
+    for name in ARRAY_NAMES:
+        _worker_arrays[name] = np.load(os.path.join(arrays_dir, f"{name}.npy"), mmap_mode="r")
+    with open(os.path.join(arrays_dir, PREPROCESSOR_FILE), "rb") as f:
+        _worker_preprocessor = pickle.load(f)
+
+
+def _run_trial(trial: dict) -> dict:
+    start = time.perf_counter()
+    try:
+        forecaster = create_forecaster(trial["family"], trial["params"], threads=_worker_threads)
+        forecaster.fit(
+            _worker_arrays["X_train"],
+            _worker_arrays["y_train"],
+            _worker_arrays["X_val"],
+            _worker_arrays["y_val"],
+            budget=trial["budget"],
+        )
+        # Scored on a tail early stopping never saw, in original count units
+        predicted = forecaster.predict(_worker_arrays["X_score"])
+        error = (
+            _worker_preprocessor.inverse_transform(predicted)
+            - _worker_preprocessor.inverse_transform(_worker_arrays["y_score"])
+        )
+        return {
+            **trial,
+            "status": "ok",
+            "score_mae": float(np.abs(error).mean()),
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+
+    except Exception as e:
+        return {
+            **trial,
+            "status": "failed",
+            "error": f"{type(e).__name__}: {e}",
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+
+
+# =====================================================================
+# SEARCH SPACE
+# =====================================================================
+
+def trial_id(family: str, params: dict) -> str:
+    payload = json.dumps({"family": family, "params": params}, sort_keys=True)
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+
+def expand_grid(space: dict, max_candidates: int = None, random_state: int = 0) -> List[dict]:
+    """Cartesian product of ``space``; randomly subsampled to ``max_candidates``."""
+    names = sorted(space)
+    grid = [dict(zip(names, values)) for values in itertools.product(*(space[n] for n in names))]
+    if max_candidates and len(grid) > max_candidates:
+        rng = np.random.default_rng(random_state)
+        grid = [grid[i] for i in sorted(rng.choice(len(grid), max_candidates, replace=False))]
+    return grid
+
+
+def rung_budgets(min_budget: int, max_budget: int, eta: int) -> List[int]:
+    """Budgets min_budget * eta^k, ending exactly at ``max_budget``."""
+    budgets = []
+    budget = min_budget
+    while budget < max_budget:
+        budgets.append(int(budget))
+        budget *= eta
+    budgets.append(int(max_budget))
+    return budgets
+
+
+# =====================================================================
+# DRIVER
+# =====================================================================
+
+class HyperparameterSearch:
+    """
+    Successive-halving search over the model factory.
+
+    All candidates of every family are trained at the family's smallest
+    budget; after each rung only the best ``1/eta`` continue at the next
+    budget (``eta`` times larger) until the maximum budget. Trials of a
+    rung run in a process pool; within a trial, early stopping on the
+    validation tail cuts training short. Trials are ranked on a separate,
+    later scoring tail, so the tail that picked the stopping epoch does
+    not also pick the winner.
+
+    Completed trials are appended to a JSONL journal keyed by candidate,
+    budget and data fingerprint; a rerun on the same data skips them.
+    """
+
+    def __init__(self, config: ModelSearchConfig = None):
+        self.config = config or ModelSearchConfig()
+
+    # ----------------------------------------------------------------
+    # Shared arrays
+    # ----------------------------------------------------------------
+    def prepare_arrays(self, ingestion_artifact: DataIngestionArtifact) -> str:
+        """
+        Build train windows, split off chronological validation (early
+        stopping) and scoring (ranking) tails and save everything as
+        ``.npy`` for the workers to memory-map.
+
+        Returns the data fingerprint used to key the journal.
+        """
+        from src.models.trainer import ModelTrainer
+
+        trainer = ModelTrainer(self.config.training)
+        data = trainer.prepare_data(*trainer.load_split(ingestion_artifact))
+
+        X, y = data["X_train"], data["y_train"]
+        n_tail = max(1, int(len(X) * self.config.training.validation_ratio))
+        if len(X) <= 2 * n_tail:
+            raise ValueError(f"Too few training windows ({len(X)}) for validation and scoring tails")
+
+        val_start, score_start = len(X) - 2 * n_tail, len(X) - n_tail
+        arrays = {
+            "X_train": X[:val_start],
+            "y_train": y[:val_start],
+            "X_val": X[val_start:score_start],
+            "y_val": y[val_start:score_start],
+            "X_score": X[score_start:],
+            "y_score": y[score_start:],
+        }
+
+        os.makedirs(self.config.arrays_dir, exist_ok=True)
+        digest = hashlib.blake2b(digest_size=16)
+        for name in ARRAY_NAMES:
+            array = np.ascontiguousarray(arrays[name], dtype=np.float32)
+            np.save(os.path.join(self.config.arrays_dir, f"{name}.npy"), array)
+            digest.update(array.tobytes())
+            digest.update(str(array.shape).encode())
+
+        with open(os.path.join(self.config.arrays_dir, PREPROCESSOR_FILE), "wb") as f:
+            pickle.dump(data["preprocessor"], f)
+
+        return digest.hexdigest()
+
+    # ----------------------------------------------------------------
+    # Journal
+    # ----------------------------------------------------------------
+    def read_journal(self, data_fingerprint: str) -> Dict[Tuple[str, int], dict]:
+        done = {}
+        if not self.config.resume or not os.path.exists(self.config.journal_file_path):
+            return done
+
+        with open(self.config.journal_file_path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A run killed mid-write leaves a partial last line
+                    continue
+                if record.get("data_fingerprint") == data_fingerprint and record.get("status") == "ok":
+                    done[(record["trial_id"], record["budget"])] = record
+        return done
+
+    def append_journal(self, record: dict) -> None:
+        with open(self.config.journal_file_path, "a") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    # ----------------------------------------------------------------
+    # Search
+    # ----------------------------------------------------------------
+    def load_space(self) -> Tuple[dict, Dict[str, dict]]:
+        spec = read_yaml(self.config.config_file_path)
+        settings = spec.get("search", {})
+        families = spec.get("families", {})
+
+        selected = self.config.families or tuple(families)
+        unknown = [f for f in selected if f not in MODEL_FAMILIES or f not in families]
+        if unknown:
+            raise ValueError(f"Families not available in factory/config: {unknown}")
+
+        return settings, {name: families[name] for name in selected}
+
+    def run(self, ingestion_artifact: DataIngestionArtifact) -> ModelSearchArtifact:
+        try:
+            cfg = self.config
+            logger.info("Model search started | workers=%s threads_per_worker=%s",
+                        cfg.max_workers, cfg.threads_per_worker)
+
+            settings, families = self.load_space()
+            eta = int(settings.get("eta", 3))
+            max_candidates = settings.get("max_candidates_per_family")
+
+            data_fingerprint = self.prepare_arrays(ingestion_artifact)
+            done = self.read_journal(data_fingerprint)
+            if done:
+                logger.info("Resuming search | journaled trials=%s", len(done))
+
+            budgets = {
+                name: rung_budgets(spec["min_budget"], spec["max_budget"], eta)
+                for name, spec in families.items()
+            }
+            survivors = {
+                name: expand_grid(spec["space"], max_candidates, cfg.training.random_state)
+                for name, spec in families.items()
+            }
+
+            results: List[dict] = []
+            final: Dict[str, List[dict]] = {}
+            n_rungs = max(len(b) for b in budgets.values())
+
+            with worker_pool(cfg.max_workers, cfg.threads_per_worker,
+                             _init_worker, (cfg.arrays_dir, cfg.threads_per_worker)) as pool:
+                for rung in range(n_rungs):
+                    rung_results: Dict[str, List[dict]] = {name: [] for name in families}
+                    pending = []
+
+                    for name in families:
+                        if rung >= len(budgets[name]):
+                            continue
+                        for params in survivors[name]:
+                            trial = {
+                                "trial_id": trial_id(name, params),
+                                "family": name,
+                                "params": params,
+                                "rung": rung,
+                                "budget": budgets[name][rung],
+                                "data_fingerprint": data_fingerprint,
+                            }
+                            key = (trial["trial_id"], trial["budget"])
+                            if key in done:
+                                rung_results[name].append(done[key])
+                            else:
+                                pending.append(trial)
+
+                    logger.info("Rung %s | trials=%s journaled=%s", rung, len(pending),
+                                sum(len(r) for r in rung_results.values()))
+
+                    futures = [pool.submit(_run_trial, trial) for trial in pending]
+                    for future in as_completed(futures):
+                        record = future.result()
+                        record["finished_at"] = datetime.now().isoformat(timespec="seconds")
+                        self.append_journal(record)
+
+                        if record["status"] == "ok":
+                            rung_results[record["family"]].append(record)
+                            logger.info("Trial done | %s %s budget=%s score_mae=%.4f (%.1fs)",
+                                        record["family"], record["params"], record["budget"],
+                                        record["score_mae"], record["seconds"])
+                        else:
+                            logger.warning("Trial failed | %s %s | %s",
+                                           record["family"], record["params"], record["error"])
+
+                    # Promote the best 1/eta of each family to the next rung
+                    for name, records in rung_results.items():
+                        if rung >= len(budgets[name]):
+                            continue
+                        records.sort(key=lambda r: r["score_mae"])
+                        results.extend(records)
+
+                        if rung == len(budgets[name]) - 1:
+                            final[name] = records
+                        else:
+                            keep = max(1, math.ceil(len(records) / eta))
+                            survivors[name] = [r["params"] for r in records[:keep]]
+
+            leaderboard = sorted(
+                (r for records in final.values() for r in records),
+                key=lambda r: r["score_mae"],
+            )
+            best = leaderboard[0] if leaderboard else None
+
+            save_json(cfg.report_file_path, {
+                "completed_at": datetime.now().isoformat(timespec="seconds"),
+                "data_fingerprint": data_fingerprint,
+                "eta": eta,
+                "budgets": budgets,
+                "best": best,
+                "leaderboard": leaderboard,
+                "trials": len(results),
+                "trials_resumed": sum(1 for r in results if (r["trial_id"], r["budget"]) in done),
+                "trial_seconds": round(sum(r["seconds"] for r in results), 3),
+            })
+
+            logger.info("Model search completed | best=%s", best and (best["family"], best["params"], best["score_mae"]))
+
+            return ModelSearchArtifact(
+                report_file_path=cfg.report_file_path,
+                journal_file_path=cfg.journal_file_path,
+                best_family=best["family"] if best else None,
+                best_params=best["params"] if best else None,
+                best_score_mae=best["score_mae"] if best else None,
+            )
+
+        except Exception as e:
+            logger.error(f"Error during model search: {str(e)}", exc_info=True)
+            raise CustomException(e, sys) from e
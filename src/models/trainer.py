@@ -0,0 +1,478 @@
+import os
+import sys
+import time
+import pickle
+from datetime import datetime
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+import keras
+import tensorflow as tf
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.entities.component_config_entity import (
+    IncrementalTrainingConfig,
+    ModelDeploymentConfig,
+    ModelTrainingConfig,
+    parquet_path,
+)
+from src.entities.artifact_entity import (
+    DataIngestionArtifact,
+    IncrementalTrainingArtifact,
+    ModelTrainingArtifact,
+)
+from src.constants.paths import MODEL_DEPLOYMENT_DIR
+from src.data_access.feature_store import FeatureStore
+from src.models.base import ForecastPreprocessor
+from src.models.deployer import ModelDeployer
+from src.models.registry import ModelRegistry
+from src.utils.helper import save_json
+from src.utils.training_helper import (
+    build_daily_count_matrix,
+    forecast_metrics,
+    make_supervised_windows,
+    select_categories,
+)
+
+logger = get_logger(__name__)
+
+
+# =====================================================================
+# MODEL DEFINITION
+# =====================================================================
+
+def build_lstm_model(seq_length: int, n_series: int, lstm_units: int = 64,
+                     dropout: float = 0.2, learning_rate: float = 1e-3,
+                     steps_per_execution: int = 1) -> keras.Model:
+    """
+    Single-layer LSTM mapping a (seq_length, n_series) window to the next
+    value of every series.
+
+    The recurrence is unrolled: with a week-long window this is cheaper on
+    CPU than the symbolic loop.
+    """
+    inputs = keras.Input(shape=(seq_length, n_series), dtype="float32")
+    x = keras.layers.LSTM(lstm_units, unroll=True)(inputs)
+    x = keras.layers.Dropout(dropout)(x)
+    outputs = keras.layers.Dense(n_series)(x)
+
+    model = keras.Model(inputs, outputs, name="complaint_volume_lstm")
+    model.compile(
+        optimizer=keras.optimizers.Adam(learning_rate=learning_rate),
+        loss="mse",
+        metrics=["mae"],
+        steps_per_execution=steps_per_execution,
+    )
+    return model
+
+
+def configure_cpu_threads(intra_op_threads: int = 0, inter_op_threads: int = 0) -> None:
+    """
+    Bound TensorFlow's CPU thread pools (0 keeps the TensorFlow default).
+    Must run before TensorFlow initialises its runtime.
+    """
+    try:
+        if intra_op_threads:
+            tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+        if inter_op_threads:
+            tf.config.threading.set_inter_op_parallelism_threads(inter_op_threads)
+    except RuntimeError:
+        logger.warning("TensorFlow runtime already initialised; thread settings unchanged")
+
+
+# =====================================================================
+# TRAINER
+# =====================================================================
+
+class ModelTrainer:
+    """
+    Trains the daily complaint-volume forecaster on the ingestion split.
+    """
+
+    def __init__(self, config: ModelTrainingConfig = None):
+        self.config = config or ModelTrainingConfig()
+
+    # ----------------------------------------------------------------
+    # Data preparation
+    # ----------------------------------------------------------------
+    def load_split(self, ingestion_artifact: DataIngestionArtifact) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Read only the columns the forecaster needs from the Parquet split.
+        """
+        columns = [self.config.date_column, self.config.category_column]
+        train_df = pd.read_parquet(parquet_path(ingestion_artifact.train_file_path), columns=columns)
+        test_df = pd.read_parquet(parquet_path(ingestion_artifact.test_file_path), columns=columns)
+        return train_df, test_df
+
+    def prepare_data(self, train_df: pd.DataFrame, test_df: pd.DataFrame) -> Dict[str, object]:
+        """
+        Build daily count matrices, fit the scaler on train and cut both
+        periods into float32 windows. Test windows are primed with the last
+        ``seq_length`` train days so the first test day is forecastable.
+        """
+        cfg = self.config
+        categories = select_categories(train_df[cfg.category_column], cfg.max_categories)
+
+        train_matrix = build_daily_count_matrix(
+            train_df, categories, cfg.date_column, cfg.category_column
+        )
+        test_matrix = build_daily_count_matrix(
+            test_df, categories, cfg.date_column, cfg.category_column,
+            start=train_matrix.index[-1] + pd.Timedelta(days=1),
+        ) if len(test_df) else train_matrix.iloc[:0]
+
+        preprocessor = ForecastPreprocessor(
+            columns=train_matrix.columns.tolist(),
+            seq_length=cfg.seq_length,
+            horizon=cfg.horizon,
+        ).fit(train_matrix.to_numpy())
+
+        train_scaled = preprocessor.transform(train_matrix.to_numpy())
+        test_scaled = preprocessor.transform(test_matrix.to_numpy())
+
+        X_train, y_train = make_supervised_windows(train_scaled, cfg.seq_length, cfg.horizon)
+        X_test, y_test = make_supervised_windows(
+            np.concatenate([train_scaled[-cfg.seq_length:], test_scaled]),
+            cfg.seq_length,
+            cfg.horizon,
+        )
+
+        return {
+            "preprocessor": preprocessor,
+            "train_matrix": train_matrix,
+            "test_matrix": test_matrix,
+            "X_train": X_train,
+            "y_train": y_train,
+            "X_test": X_test,
+            "y_test": y_test,
+        }
+
+    # ----------------------------------------------------------------
+    # Fit loop
+    # ----------------------------------------------------------------
+    def fit(self, model: keras.Model, X: np.ndarray, y: np.ndarray) -> keras.callbacks.History:
+        """
+        Fit on in-memory float32 arrays. The most recent ``validation_ratio``
+        of windows is held out (chronologically) for early stopping.
+        """
+        cfg = self.config
+        n_val = int(len(X) * cfg.validation_ratio) if len(X) >= 20 else 0
+
+        if n_val:
+            X_fit, y_fit = X[:-n_val], y[:-n_val]
+            validation_data = (X[-n_val:], y[-n_val:])
+            monitor = "val_loss"
+        else:
+            X_fit, y_fit = X, y
+            validation_data = None
+            monitor = "loss"
+
+        callbacks = [
+            keras.callbacks.EarlyStopping(
+                monitor=monitor,
+                patience=cfg.patience,
+                restore_best_weights=True,
+            )
+        ]
+
+        return model.fit(
+            X_fit,
+            y_fit,
+            validation_data=validation_data,
+            epochs=cfg.epochs,
+            batch_size=cfg.batch_size,
+            shuffle=True,
+            callbacks=callbacks,
+            verbose=2,
+        )
+
+    # ----------------------------------------------------------------
+    # Entry point
+    # ----------------------------------------------------------------
+    def initiate_model_training(self, ingestion_artifact: DataIngestionArtifact) -> ModelTrainingArtifact:
+        """
+        Train, evaluate on the test period and persist the model,
+        preprocessor and report.
+        """
+        try:
+            cfg = self.config
+            logger.info("Model training started")
+
+            configure_cpu_threads(cfg.intra_op_threads, cfg.inter_op_threads)
+            keras.utils.set_random_seed(cfg.random_state)
+
+            train_df, test_df = self.load_split(ingestion_artifact)
+            data = self.prepare_data(train_df, test_df)
+            preprocessor: ForecastPreprocessor = data["preprocessor"]
+
+            if len(data["X_train"]) == 0:
+                raise ValueError(
+                    f"Not enough training days ({len(data['train_matrix'])}) "
+                    f"for seq_length={cfg.seq_length}"
+                )
+
+            logger.info(
+                "Training windows | train=%s test=%s series=%s",
+                len(data["X_train"]),
+                len(data["X_test"]),
+                preprocessor.n_series,
+            )
+
+            model = build_lstm_model(
+                cfg.seq_length,
+                preprocessor.n_series,
+                lstm_units=cfg.lstm_units,
+                dropout=cfg.dropout,
+                learning_rate=cfg.learning_rate,
+                steps_per_execution=cfg.steps_per_execution,
+            )
+
+            start = time.perf_counter()
+            history = self.fit(model, data["X_train"], data["y_train"])
+            fit_seconds = time.perf_counter() - start
+
+            # Test metrics in original count units
+            if len(data["X_test"]):
+                predicted = model.predict(data["X_test"], batch_size=256, verbose=0)
+                test_metrics = forecast_metrics(
+                    preprocessor.inverse_transform(data["y_test"]),
+                    np.clip(preprocessor.inverse_transform(predicted), 0, None),
+                    preprocessor.columns,
+                )
+            else:
+                test_metrics = forecast_metrics(np.empty((0, 0)), np.empty((0, 0)), preprocessor.columns)
+
+            os.makedirs(cfg.model_training_dir, exist_ok=True)
+            model.save(cfg.model_file_path)
+            with open(cfg.preprocessor_file_path, "wb") as f:
+                pickle.dump(preprocessor, f)
+
+            save_json(cfg.report_file_path, {
+                "trained_at": datetime.now().isoformat(timespec="seconds"),
+                "source_sha256": ingestion_artifact.source_sha256,
+                "series": preprocessor.columns,
+                "seq_length": cfg.seq_length,
+                "horizon": cfg.horizon,
+                "train_date_range": [
+                    data["train_matrix"].index[0].strftime("%Y-%m-%d"),
+                    data["train_matrix"].index[-1].strftime("%Y-%m-%d"),
+                ],
+                "train_windows": int(len(data["X_train"])),
+                "test_windows": int(len(data["X_test"])),
+                "epochs_run": len(history.history["loss"]),
+                "fit_seconds": round(fit_seconds, 3),
+                "final_loss": float(history.history["loss"][-1]),
+                "test_metrics": test_metrics,
+            })
+
+            logger.info(
+                "Model training completed | epochs=%s fit_seconds=%.2f test_mae=%s",
+                len(history.history["loss"]),
+                fit_seconds,
+                test_metrics["mae"],
+            )
+
+            return ModelTrainingArtifact(
+                model_file_path=cfg.model_file_path,
+                preprocessor_file_path=cfg.preprocessor_file_path,
+                report_file_path=cfg.report_file_path,
+                test_mae=test_metrics["mae"],
+            )
+
+        except Exception as e:
+            logger.error(f"Error during model training: {str(e)}", exc_info=True)
+            raise CustomException(e, sys) from e
+
+
+# =====================================================================
+# INCREMENTAL TRAINER
+# =====================================================================
+
+class IncrementalTrainer:
+    """
+    Daily refresh of the active registered model.
+
+    Windows whose target day is after the model's ``trained_through`` date
+    (and before the holdout) are the new data; a random replay sample of
+    older windows is mixed in to limit forgetting. The fine-tuned copy is
+    compared with the current model on the most recent ``holdout_days``
+    and registered + activated only if it does not regress.
+
+    The preprocessor of the base version is kept unchanged so the scaled
+    inputs mean the same thing to the fine-tuned weights.
+    """
+
+    def __init__(self, config: IncrementalTrainingConfig = None):
+        self.config = config or IncrementalTrainingConfig()
+        self.registry = ModelRegistry(self.config.registry)
+        self.store = FeatureStore(self.config.feature_store_dir)
+
+    def _trained_through(self, version: str, manifest: dict) -> pd.Timestamp:
+        metrics = self.registry.list_versions()[version].get("metrics", {})
+        if metrics.get("trained_through"):
+            return pd.Timestamp(metrics["trained_through"])
+
+        # Versions from a full training run saw everything before the test split
+        test_start = manifest.get("metadata", {}).get("test_start")
+        if test_start:
+            return pd.Timestamp(test_start) - pd.Timedelta(days=1)
+
+        raise ValueError(f"Cannot tell which days model version {version} was trained on")
+
+    @staticmethod
+    def _holdout_metrics(model, preprocessor: ForecastPreprocessor, X: np.ndarray, y: np.ndarray) -> dict:
+        predicted = model.predict(preprocessor.transform(X), batch_size=256, verbose=0)
+        return forecast_metrics(y, np.clip(preprocessor.inverse_transform(predicted), 0, None), preprocessor.columns)
+
+    def _finish(self, report: dict, artifact: IncrementalTrainingArtifact) -> IncrementalTrainingArtifact:
+        save_json(self.config.report_file_path, {
+            "run_at": datetime.now().isoformat(timespec="seconds"),
+            **report,
+            "promoted": artifact.promoted,
+            "version": artifact.version,
+            "reason": artifact.reason,
+        })
+        logger.info("Incremental training finished | promoted=%s version=%s reason=%s",
+                    artifact.promoted, artifact.version, artifact.reason)
+        return artifact
+
+    def initiate_incremental_training(self) -> IncrementalTrainingArtifact:
+        try:
+            cfg = self.config
+            start = time.perf_counter()
+            os.makedirs(cfg.incremental_dir, exist_ok=True)
+
+            base_version = self.registry.active_version()
+            if base_version is None:
+                raise ValueError("No active model version to update")
+
+            manifest = self.store.manifest(cfg.feature_set)
+            if manifest is None:
+                raise FileNotFoundError(f"Feature set not found: {cfg.feature_set}")
+
+            with open(self.registry.preprocessor_file_path(base_version), "rb") as f:
+                preprocessor: ForecastPreprocessor = pickle.load(f)
+
+            # ----------------------------------------------------------
+            # Windows: new / replay / holdout by target date
+            # ----------------------------------------------------------
+            dates, values = self.store.read(cfg.feature_set, columns=preprocessor.columns)
+            X, y = make_supervised_windows(values, preprocessor.seq_length, preprocessor.horizon)
+            offset = preprocessor.seq_length + preprocessor.horizon - 1
+            target_dates = dates[offset:offset + len(y)]
+
+            trained_through = self._trained_through(base_version, manifest)
+            holdout_start = dates[-1] - pd.Timedelta(days=cfg.holdout_days - 1)
+
+            is_holdout = target_dates >= holdout_start
+            new_idx = np.flatnonzero((target_dates > trained_through) & ~is_holdout)
+            old_idx = np.flatnonzero((target_dates <= trained_through) & ~is_holdout)
+            holdout_idx = np.flatnonzero(is_holdout)
+
+            report = {
+                "base_version": base_version,
+                "trained_through": trained_through.strftime("%Y-%m-%d"),
+                "holdout_range": [holdout_start.strftime("%Y-%m-%d"), dates[-1].strftime("%Y-%m-%d")],
+                "new_windows": int(len(new_idx)),
+            }
+
+            if not len(holdout_idx):
+                raise ValueError("Feature store is too short for the holdout")
+
+            if not len(new_idx):
+                return self._finish(report, IncrementalTrainingArtifact(
+                    promoted=False,
+                    version=base_version,
+                    base_version=base_version,
+                    baseline_mae=None,
+                    candidate_mae=None,
+                    report_file_path=cfg.report_file_path,
+                    reason=f"No new days after {trained_through.date()} outside the holdout",
+                ))
+
+            rng = np.random.default_rng(cfg.random_state)
+            n_replay = min(len(old_idx), int(round(cfg.replay_ratio * len(new_idx))))
+            replay_idx = rng.choice(old_idx, size=n_replay, replace=False) if n_replay else old_idx[:0]
+            fit_idx = np.concatenate([new_idx, replay_idx])
+            report["replay_windows"] = int(n_replay)
+
+            # ----------------------------------------------------------
+            # Fine-tune a copy of the active model
+            # ----------------------------------------------------------
+            keras.utils.set_random_seed(cfg.random_state)
+            base_model = keras.models.load_model(self.registry.model_file_path(base_version), compile=False)
+            baseline = self._holdout_metrics(base_model, preprocessor, X[holdout_idx], y[holdout_idx])
+
+            candidate = keras.models.clone_model(base_model)
+            candidate.set_weights(base_model.get_weights())
+            candidate.compile(
+                optimizer=keras.optimizers.Adam(learning_rate=cfg.learning_rate),
+                loss="mse",
+                metrics=["mae"],
+            )
+
+            fit_start = time.perf_counter()
+            candidate.fit(
+                preprocessor.transform(X[fit_idx]),
+                preprocessor.transform(y[fit_idx]),
+                epochs=cfg.epochs,
+                batch_size=cfg.batch_size,
+                shuffle=True,
+                verbose=0,
+            )
+            report["fit_seconds"] = round(time.perf_counter() - fit_start, 3)
+
+            challenger = self._holdout_metrics(candidate, preprocessor, X[holdout_idx], y[holdout_idx])
+            report["holdout_metrics"] = {"baseline": baseline, "candidate": challenger}
+
+            promoted = challenger["mae"] <= baseline["mae"] * (1.0 + cfg.max_regression)
+            version = base_version
+            reason = (
+                f"Holdout MAE {challenger['mae']:.4f} vs {baseline['mae']:.4f} "
+                f"({'promoted' if promoted else 'regressed, kept current model'})"
+            )
+
+            if promoted:
+                candidate.save(cfg.model_file_path)
+                with open(cfg.preprocessor_file_path, "wb") as f:
+                    pickle.dump(preprocessor, f)
+
+                candidate_artifact = ModelTrainingArtifact(
+                    model_file_path=cfg.model_file_path,
+                    preprocessor_file_path=cfg.preprocessor_file_path,
+                    report_file_path=cfg.report_file_path,
+                    test_mae=challenger["mae"],
+                )
+                deployment = ModelDeployer(ModelDeploymentConfig(
+                    deployment_dir=os.path.join(cfg.incremental_dir, MODEL_DEPLOYMENT_DIR),
+                )).initiate_model_deployment(candidate_artifact)
+
+                version, _ = self.registry.register(
+                    cfg.model_file_path,
+                    cfg.preprocessor_file_path,
+                    metrics={
+                        "trained_at": datetime.now().isoformat(timespec="seconds"),
+                        "incremental_from": base_version,
+                        "trained_through": target_dates[new_idx[-1]].strftime("%Y-%m-%d"),
+                        "holdout_metrics": challenger,
+                    },
+                    activate=True,
+                    weights_file_path=deployment.weights_file_path,
+                )
+
+            report["seconds"] = round(time.perf_counter() - start, 3)
+            return self._finish(report, IncrementalTrainingArtifact(
+                promoted=promoted,
+                version=version,
+                base_version=base_version,
+                baseline_mae=baseline["mae"],
+                candidate_mae=challenger["mae"],
+                report_file_path=cfg.report_file_path,
+                reason=reason,
+            ))
+
+        except Exception as e:
+            logger.error(f"Error during incremental training: {str(e)}", exc_info=True)
+            raise CustomException(e, sys) from e
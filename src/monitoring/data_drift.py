@@ -0,0 +1,279 @@
+import math
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+
+# =====================================================================
+# CATEGORY FREQUENCY SKETCH
+# =====================================================================
+
+class CategorySketch:
+    """
+    Exact frequency table of one categorical column. Category counts are
+    additive, so sketches of disjoint windows merge by summing.
+    """
+
+    def __init__(self, counts: Dict[str, int] = None):
+        self.counts: Dict[str, int] = dict(counts or {})
+
+    @property
+    def total(self) -> int:
+        return int(sum(self.counts.values()))
+
+    def update(self, values: pd.Series) -> "CategorySketch":
+        for key, count in values.fillna("MISSING").astype(str).value_counts(sort=False).items():
+            self.counts[key] = self.counts.get(key, 0) + int(count)
+        return self
+
+    def merge(self, other: "CategorySketch") -> "CategorySketch":
+        merged = CategorySketch(self.counts)
+        for key, count in other.counts.items():
+            merged.counts[key] = merged.counts.get(key, 0) + count
+        return merged
+
+    def to_dict(self) -> dict:
+        return dict(self.counts)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CategorySketch":
+        return cls({k: int(v) for k, v in data.items()})
+
+
+# =====================================================================
+# QUANTILE SKETCH
+# =====================================================================
+
+class QuantileSketch:
+    """
+    Relative-error quantile sketch (DDSketch-style) for non-negative values.
+
+    Positive values fall into logarithmic buckets ``(gamma^(i-1), gamma^i]``
+    with ``gamma = (1 + a) / (1 - a)``, so every quantile is returned within
+    relative error ``a``; zeros get their own bucket. Buckets with the same
+    ``a`` line up, so sketches merge by adding bucket counts and can be
+    compared bucket by bucket.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, bins: Dict[int, int] = None, zero_count: int = 0):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins: Dict[int, int] = dict(bins or {})
+        self.zero_count = int(zero_count)
+
+    @property
+    def count(self) -> int:
+        return self.zero_count + int(sum(self.bins.values()))
+
+    def update(self, values: Iterable[float]) -> "QuantileSketch":
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if (values < 0).any():
+            raise ValueError("QuantileSketch only accepts non-negative values")
+
+        self.zero_count += int((values == 0).sum())
+        positive = values[values > 0]
+        if positive.size:
+            keys, counts = np.unique(np.ceil(np.log(positive) / self._log_gamma).astype(np.int64),
+                                     return_counts=True)
+            for key, count in zip(keys.tolist(), counts.tolist()):
+                self.bins[key] = self.bins.get(key, 0) + count
+        return self
+
+    def _check_compatible(self, other: "QuantileSketch") -> None:
+        if not math.isclose(self.relative_accuracy, other.relative_accuracy):
+            raise ValueError("Quantile sketches with different accuracy cannot be combined")
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        self._check_compatible(other)
+        merged = QuantileSketch(self.relative_accuracy, self.bins, self.zero_count + other.zero_count)
+        for key, count in other.bins.items():
+            merged.bins[key] = merged.bins.get(key, 0) + count
+        return merged
+
+    def _value(self, key: int) -> float:
+        # Midpoint (in relative terms) of bucket (gamma^(k-1), gamma^k]
+        return 2.0 * self.gamma ** key / (self.gamma + 1)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+        seen = self.zero_count
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self.bins))
+
+    def cdf_at_buckets(self, keys: np.ndarray) -> np.ndarray:
+        """Share of values at or below the upper edge of each bucket key."""
+        if not self.count:
+            return np.zeros(len(keys))
+        own = np.array(sorted(self.bins), dtype=np.int64)
+        cumulative = np.concatenate(([0], np.cumsum([self.bins[k] for k in own.tolist()])))
+        below = cumulative[np.searchsorted(own, keys, side="right")]
+        return (self.zero_count + below) / self.count
+
+    def to_dict(self) -> dict:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "zero_count": self.zero_count,
+            "bins": {str(k): v for k, v in self.bins.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "QuantileSketch":
+        return cls(data["relative_accuracy"], {int(k): int(v) for k, v in data["bins"].items()}, data["zero_count"])
+
+
+# =====================================================================
+# WINDOW SKETCH
+# =====================================================================
+
+class WindowSketch:
+    """
+    Everything drift monitoring keeps about one time window: a frequency
+    table per categorical column and a quantile sketch of daily volume.
+
+    Daily volume is only known once a day is complete, so per-day counts
+    are held in ``open_days`` until ``close()`` moves them into the
+    volume sketch; a window covers a few days, which bounds that buffer.
+    """
+
+    def __init__(self, start: str, end: str, columns: List[str], relative_accuracy: float = 0.01):
+        self.start = start
+        self.end = end
+        self.rows = 0
+        self.categories = {column: CategorySketch() for column in columns}
+        self.volume = QuantileSketch(relative_accuracy)
+        self.open_days: Dict[str, int] = {}
+        self.closed = False
+
+    def update(self, frame: pd.DataFrame, date_column: str) -> "WindowSketch":
+        self.rows += len(frame)
+        for column, sketch in self.categories.items():
+            sketch.update(frame[column])
+
+        if self.closed:
+            # Late rows: categories stay exact, the closed volume sketch cannot be amended
+            return self
+
+        day_counts = pd.to_datetime(frame[date_column]).dt.strftime("%Y-%m-%d").value_counts(sort=False)
+        for day, count in day_counts.items():
+            self.open_days[day] = self.open_days.get(day, 0) + int(count)
+        return self
+
+    def daily_volume(self) -> QuantileSketch:
+        """Volume sketch including the still-open days."""
+        if not self.open_days:
+            return self.volume
+        partial = QuantileSketch(self.volume.relative_accuracy).update(self._day_values(max(self.open_days)))
+        return self.volume.merge(partial)
+
+    def _day_values(self, through: str) -> np.ndarray:
+        # Days of the window without complaints are zero-volume days
+        days = pd.date_range(self.start, through, freq="D")
+        return np.array([self.open_days.get(d.strftime("%Y-%m-%d"), 0) for d in days], dtype=np.float64)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        if self.open_days:
+            self.volume = self.volume.update(self._day_values(self.end))
+        self.open_days = {}
+        self.closed = True
+
+    def to_dict(self) -> dict:
+        return {
+            "start": self.start,
+            "end": self.end,
+            "rows": self.rows,
+            "closed": self.closed,
+            "categories": {c: s.to_dict() for c, s in self.categories.items()},
+            "volume": self.volume.to_dict(),
+            "open_days": self.open_days,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WindowSketch":
+        window = cls(data["start"], data["end"], list(data["categories"]), data["volume"]["relative_accuracy"])
+        window.rows = int(data["rows"])
+        window.closed = bool(data["closed"])
+        window.categories = {c: CategorySketch.from_dict(s) for c, s in data["categories"].items()}
+        window.volume = QuantileSketch.from_dict(data["volume"])
+        window.open_days = {k: int(v) for k, v in data["open_days"].items()}
+        return window
+
+
+def merge_windows(windows: List[WindowSketch]) -> dict:
+    """Merged category tables and volume sketch of ``windows``."""
+    categories: Dict[str, CategorySketch] = {}
+    volume: Optional[QuantileSketch] = None
+    rows = 0
+
+    for window in windows:
+        rows += window.rows
+        for column, sketch in window.categories.items():
+            categories[column] = categories[column].merge(sketch) if column in categories else sketch
+        daily = window.daily_volume()
+        volume = volume.merge(daily) if volume is not None else daily
+
+    return {"rows": rows, "categories": categories, "volume": volume}
+
+
+# =====================================================================
+# DRIFT STATISTICS FROM SKETCHES
+# =====================================================================
+
+def psi(reference: CategorySketch, current: CategorySketch, epsilon: float = 1e-4) -> float:
+    """Population Stability Index over the union of categories."""
+    keys = sorted(set(reference.counts) | set(current.counts))
+    ref = np.array([reference.counts.get(k, 0) for k in keys], dtype=np.float64)
+    cur = np.array([current.counts.get(k, 0) for k in keys], dtype=np.float64)
+
+    ref = np.clip(ref / max(ref.sum(), 1), epsilon, None)
+    cur = np.clip(cur / max(cur.sum(), 1), epsilon, None)
+    return float(((cur - ref) * np.log(cur / ref)).sum())
+
+
+def chi_square(reference: CategorySketch, current: CategorySketch) -> dict:
+    """Chi-square test of homogeneity on the 2 x k table of counts."""
+    keys = sorted(set(reference.counts) | set(current.counts))
+    table = np.array([
+        [reference.counts.get(k, 0) for k in keys],
+        [current.counts.get(k, 0) for k in keys],
+    ], dtype=np.float64)
+
+    if table.shape[1] < 2 or (table.sum(axis=1) == 0).any():
+        return {"statistic": 0.0, "dof": 0, "p_value": 1.0}
+
+    expected = table.sum(axis=1, keepdims=True) * table.sum(axis=0, keepdims=True) / table.sum()
+    statistic = float(((table - expected) ** 2 / np.where(expected > 0, expected, 1)).sum())
+    dof = table.shape[1] - 1
+    return {"statistic": statistic, "dof": dof, "p_value": float(stats.chi2.sf(statistic, dof))}
+
+
+def ks_test(reference: QuantileSketch, current: QuantileSketch) -> dict:
+    """
+    Two-sample Kolmogorov-Smirnov statistic from two aligned quantile
+    sketches (CDFs compared at every bucket edge), with the asymptotic
+    p-value for the effective sample size.
+    """
+    reference._check_compatible(current)
+    if not reference.count or not current.count:
+        return {"statistic": 0.0, "p_value": 1.0}
+
+    keys = np.array(sorted(set(reference.bins) | set(current.bins)), dtype=np.int64)
+    # Leading key below every bucket evaluates the zero bucket alone
+    keys = np.concatenate(([keys[0] - 1 if keys.size else 0], keys))
+    statistic = float(np.abs(reference.cdf_at_buckets(keys) - current.cdf_at_buckets(keys)).max())
+
+    n_eff = reference.count * current.count / (reference.count + current.count)
+    p_value = float(stats.kstwobign.sf(statistic * math.sqrt(n_eff)))
+    return {"statistic": statistic, "p_value": min(1.0, p_value)}
@@ -0,0 +1,334 @@
+import sys
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.entities.component_config_entity import ModelDriftConfig
+from src.utils.helper import load_json, save_json
+
+logger = get_logger(__name__)
+
+Values = Union[Dict[str, float], List[float], np.ndarray]
+
+MAE_TO_STD = float(np.sqrt(np.pi / 2))
+
+
+# =====================================================================
+# ROLLING STATISTICS
+# =====================================================================
+
+class RingBuffer:
+    """
+    Fixed-size window of per-series values with a running sum, so the
+    windowed mean is O(1) per push. The sum is recomputed exactly each
+    time the buffer wraps, which keeps float error from accumulating.
+    """
+
+    def __init__(self, capacity: int, width: int):
+        self.data = np.zeros((capacity, width), dtype=np.float64)
+        self.head = 0
+        self.size = 0
+        self.total = np.zeros(width, dtype=np.float64)
+
+    @property
+    def capacity(self) -> int:
+        return self.data.shape[0]
+
+    @property
+    def full(self) -> bool:
+        return self.size == self.capacity
+
+    def push(self, values: np.ndarray) -> None:
+        if self.full:
+            self.total -= self.data[self.head]
+        else:
+            self.size += 1
+        self.data[self.head] = values
+        self.total += values
+        self.head = (self.head + 1) % self.capacity
+        if self.head == 0:
+            self.total = self.data.sum(axis=0)
+
+    def mean(self) -> np.ndarray:
+        if not self.size:
+            return np.full(self.data.shape[1], np.nan)
+        return self.total / self.size
+
+    def to_dict(self) -> dict:
+        return {"data": self.data.tolist(), "head": self.head, "size": self.size}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RingBuffer":
+        values = np.asarray(data["data"], dtype=np.float64)
+        buffer = cls(*values.shape)
+        buffer.data, buffer.head, buffer.size = values, int(data["head"]), int(data["size"])
+        buffer.total = values.sum(axis=0)  # unused slots are zero
+        return buffer
+
+
+class Cusum:
+    """Two-sided tabular CUSUM per series on standardised residuals."""
+
+    def __init__(self, width: int, k: float, h: float):
+        self.k, self.h = k, h
+        self.pos = np.zeros(width)
+        self.neg = np.zeros(width)
+
+    def update(self, z: np.ndarray) -> None:
+        self.pos = np.maximum(0.0, self.pos + z - self.k)
+        self.neg = np.maximum(0.0, self.neg - z - self.k)
+
+    @property
+    def alarm(self) -> np.ndarray:
+        return (self.pos > self.h) | (self.neg > self.h)
+
+
+class PageHinkley:
+    """Page-Hinkley test per series for an upward shift in the mean."""
+
+    def __init__(self, width: int, delta: float, threshold: float):
+        self.delta, self.threshold = delta, threshold
+        self.n = 0
+        self.mean = np.zeros(width)
+        self.cumulative = np.zeros(width)
+        self.minimum = np.zeros(width)
+
+    def update(self, x: np.ndarray) -> None:
+        self.n += 1
+        self.mean += (x - self.mean) / self.n
+        self.cumulative += x - self.mean - self.delta
+        self.minimum = np.minimum(self.minimum, self.cumulative)
+
+    @property
+    def statistic(self) -> np.ndarray:
+        return self.cumulative - self.minimum
+
+    @property
+    def alarm(self) -> np.ndarray:
+        return self.statistic > self.threshold
+
+
+# =====================================================================
+# MONITOR
+# =====================================================================
+
+class ModelDriftMonitor:
+    """
+    Tracks the served model's daily errors: actual vs predicted counts for
+    every series, one observation per day.
+
+    Each update is constant time per series: ring buffers hold the last
+    ``window_days`` absolute errors and residuals for the windowed MAE and
+    bias; CUSUM watches the residuals for a persistent bias and
+    Page-Hinkley watches the absolute error for an upward shift, both
+    scaled by the baseline MAE measured over the first ``warmup_days``.
+
+    A retrain signal is raised (logged and written to
+    ``signal_file_path``) when any detector fires; it stays latched until
+    a new model version is observed, which resets the monitor.
+    """
+
+    def __init__(self, config: ModelDriftConfig = None):
+        self.config = config or ModelDriftConfig()
+        self._lock = threading.Lock()
+        self.columns: List[str] = []
+        self.model_version: Optional[str] = None
+        self.last_date: Optional[pd.Timestamp] = None
+        self.signals: List[dict] = []
+        self._init_state(0)
+        self.load()
+
+    def _init_state(self, width: int) -> None:
+        cfg = self.config
+        self.observations = 0
+        self.baseline_sum = np.zeros(width)
+        self.baseline_mae: Optional[np.ndarray] = None
+        self.abs_errors = RingBuffer(cfg.window_days, width)
+        self.residuals = RingBuffer(cfg.window_days, width)
+        self.cusum = Cusum(width, cfg.cusum_k, cfg.cusum_h)
+        self.page_hinkley = PageHinkley(width, cfg.ph_delta, cfg.ph_threshold)
+
+    def reset(self, columns: List[str], model_version: Optional[str] = None) -> None:
+        self.columns = list(columns)
+        self.model_version = model_version
+        self.last_date = None
+        self.signals = []
+        self._init_state(len(self.columns))
+
+    # ----------------------------------------------------------------
+    # Persistence
+    # ----------------------------------------------------------------
+    def load(self) -> None:
+        state = load_json(self.config.state_file_path)
+        if not state or state.get("window_days") != self.config.window_days:
+            return
+
+        self.reset(state["columns"], state["model_version"])
+        self.last_date = pd.Timestamp(state["last_date"]) if state["last_date"] else None
+        self.signals = state["signals"]
+        self.observations = state["observations"]
+        self.baseline_sum = np.asarray(state["baseline_sum"])
+        self.baseline_mae = np.asarray(state["baseline_mae"]) if state["baseline_mae"] is not None else None
+        self.abs_errors = RingBuffer.from_dict(state["abs_errors"])
+        self.residuals = RingBuffer.from_dict(state["residuals"])
+        self.cusum.pos, self.cusum.neg = np.asarray(state["cusum"]["pos"]), np.asarray(state["cusum"]["neg"])
+        ph = state["page_hinkley"]
+        self.page_hinkley.n = ph["n"]
+        self.page_hinkley.mean = np.asarray(ph["mean"])
+        self.page_hinkley.cumulative = np.asarray(ph["cumulative"])
+        self.page_hinkley.minimum = np.asarray(ph["minimum"])
+
+    def save(self) -> None:
+        save_json(self.config.state_file_path, {
+            "window_days": self.config.window_days,
+            "columns": self.columns,
+            "model_version": self.model_version,
+            "last_date": self.last_date.strftime("%Y-%m-%d") if self.last_date is not None else None,
+            "observations": self.observations,
+            "signals": self.signals,
+            "baseline_sum": self.baseline_sum.tolist(),
+            "baseline_mae": self.baseline_mae.tolist() if self.baseline_mae is not None else None,
+            "abs_errors": self.abs_errors.to_dict(),
+            "residuals": self.residuals.to_dict(),
+            "cusum": {"pos": self.cusum.pos.tolist(), "neg": self.cusum.neg.tolist()},
+            "page_hinkley": {
+                "n": self.page_hinkley.n,
+                "mean": self.page_hinkley.mean.tolist(),
+                "cumulative": self.page_hinkley.cumulative.tolist(),
+                "minimum": self.page_hinkley.minimum.tolist(),
+            },
+        })
+
+    # ----------------------------------------------------------------
+    # Updates
+    # ----------------------------------------------------------------
+    def _as_array(self, values: Values) -> np.ndarray:
+        if isinstance(values, dict):
+            missing = [c for c in self.columns if c not in values]
+            if missing:
+                raise ValueError(f"Missing series: {missing}")
+            return np.array([values[c] for c in self.columns], dtype=np.float64)
+
+        values = np.asarray(values, dtype=np.float64).reshape(-1)
+        if values.shape[0] != len(self.columns):
+            raise ValueError(f"Expected {len(self.columns)} series, got {values.shape[0]}")
+        return values
+
+    def update(self, date, actual: Values, predicted: Values,
+               model_version: Optional[str] = None, columns: List[str] = None) -> bool:
+        """
+        Ingest one day. Days at or before the last ingested day are
+        ignored (so replays are harmless); returns whether it was added.
+        """
+        try:
+            with self._lock:
+                columns = columns or (list(actual) if isinstance(actual, dict) else self.columns)
+                if not self.columns or (model_version is not None and model_version != self.model_version):
+                    if self.model_version is not None:
+                        logger.info("Model drift monitor reset | version %s -> %s", self.model_version, model_version)
+                    self.reset(columns, model_version)
+
+                date = pd.Timestamp(date).normalize()
+                if self.last_date is not None and date <= self.last_date:
+                    return False
+
+                actual, predicted = self._as_array(actual), self._as_array(predicted)
+                residual = predicted - actual
+                abs_error = np.abs(residual)
+
+                self.abs_errors.push(abs_error)
+                self.residuals.push(residual)
+                self.observations += 1
+                self.last_date = date
+
+                cfg = self.config
+                if self.baseline_mae is None:
+                    self.baseline_sum += abs_error
+                    if self.observations >= cfg.warmup_days:
+                        # Floor keeps near-perfect series from dividing by ~0
+                        self.baseline_mae = np.maximum(self.baseline_sum / self.observations, 1e-3)
+                else:
+                    # MAE * sqrt(pi/2) estimates the residual std of a normal error
+                    self.cusum.update(residual / (self.baseline_mae * MAE_TO_STD))
+                    self.page_hinkley.update(abs_error / self.baseline_mae)
+                    self._check_signals()
+
+                self.save()
+                return True
+
+        except Exception as e:
+            raise CustomException(e, sys) from e
+
+    def _check_signals(self) -> None:
+        cfg = self.config
+        checks = {
+            "cusum": (self.cusum.alarm, np.maximum(self.cusum.pos, self.cusum.neg), cfg.cusum_h),
+            "page_hinkley": (self.page_hinkley.alarm, self.page_hinkley.statistic, cfg.ph_threshold),
+        }
+        if self.abs_errors.full:
+            ratio = self.abs_errors.mean() / self.baseline_mae
+            checks["window_mae"] = (ratio > 1 + cfg.max_mae_increase, ratio, 1 + cfg.max_mae_increase)
+
+        active = {(s["series"], s["detector"]) for s in self.signals}
+        raised = []
+        for detector, (alarm, value, threshold) in checks.items():
+            for i in np.flatnonzero(alarm):
+                key = (self.columns[i], detector)
+                if key in active:
+                    continue
+                raised.append({
+                    "series": self.columns[i],
+                    "detector": detector,
+                    "value": round(float(value[i]), 4),
+                    "threshold": threshold,
+                    "date": self.last_date.strftime("%Y-%m-%d"),
+                })
+
+        if raised:
+            self.signals.extend(raised)
+            logger.warning("Retrain signal | %s", ", ".join(f"{s['series']}:{s['detector']}" for s in raised))
+            save_json(self.config.signal_file_path, {
+                "raised_at": datetime.now().isoformat(timespec="seconds"),
+                "model_version": self.model_version,
+                "signals": self.signals,
+            })
+
+    # ----------------------------------------------------------------
+    # Metrics
+    # ----------------------------------------------------------------
+    @property
+    def retrain_required(self) -> bool:
+        return bool(self.signals)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            def rounded(values):
+                return [None if np.isnan(v) else round(float(v), 4) for v in values]
+
+            mae, bias = self.abs_errors.mean(), self.residuals.mean()
+            baseline = self.baseline_mae if self.baseline_mae is not None else np.full(len(self.columns), np.nan)
+            per_series = {
+                name: dict(zip(
+                    ("window_mae", "window_bias", "baseline_mae", "cusum_pos", "cusum_neg", "page_hinkley"),
+                    rounded([mae[i], bias[i], baseline[i], self.cusum.pos[i], self.cusum.neg[i],
+                             self.page_hinkley.statistic[i]]),
+                ))
+                for i, name in enumerate(self.columns)
+            }
+
+            return {
+                "model_version": self.model_version,
+                "last_date": self.last_date.strftime("%Y-%m-%d") if self.last_date is not None else None,
+                "observations": self.observations,
+                "window_days": self.config.window_days,
+                "window_filled": self.abs_errors.size,
+                "warmed_up": self.baseline_mae is not None,
+                "series": per_series,
+                "retrain_required": self.retrain_required,
+                "signals": list(self.signals),
+            }
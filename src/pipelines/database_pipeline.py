@@ -0,0 +1,49 @@
+import sys
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.database.relational_db import RelationalDB
+from src.pipelines.ingestion_pipeline import DataIngestionPipeline
+from src.entities.component_config_entity import RelationalDBConfig
+from src.entities.artifact_entity import DataIngestionArtifact, DatabaseLoadArtifact
+
+logger = get_logger(__name__)
+
+
+class DatabaseLoadPipeline:
+    """
+    Bulk loads the processed ingestion output into the relational store.
+    ``replace`` rebuilds it (history backfill); ``upsert`` merges rows on
+    complaint number and needs a deduplicating config.
+    """
+
+    def __init__(self, config: RelationalDBConfig = None):
+        self.config = config or RelationalDBConfig()
+
+    def run(self, ingestion_artifact: DataIngestionArtifact = None, mode: str = "replace") -> DatabaseLoadArtifact:
+        try:
+            logger.info("=" * 60)
+            logger.info("DATABASE LOAD PIPELINE STARTED")
+            logger.info("=" * 60)
+
+            if ingestion_artifact is None:
+                ingestion_artifact = DataIngestionPipeline().run()
+
+            artifact = RelationalDB(self.config).initiate_bulk_load(ingestion_artifact, mode=mode)
+
+            logger.info(
+                "DATABASE LOAD PIPELINE COMPLETED | mode=%s rows=%s rows/s=%s",
+                artifact.mode, artifact.rows, artifact.rows_per_second,
+            )
+            return artifact
+
+        except Exception as e:
+            logger.error("Database load pipeline failed", exc_info=True)
+            raise CustomException(e, sys) from e
+
+
+if __name__ == "__main__":
+    if "--upsert" in sys.argv:
+        DatabaseLoadPipeline(RelationalDBConfig(deduplicate=True)).run(mode="upsert")
+    else:
+        DatabaseLoadPipeline().run(mode="replace")
@@ -0,0 +1,46 @@
+import sys
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.models.deployer import ModelDeployer
+from src.entities.component_config_entity import ModelDeploymentConfig, ModelTrainingConfig
+from src.entities.artifact_entity import ModelDeploymentArtifact, ModelTrainingArtifact
+
+logger = get_logger(__name__)
+
+
+class ModelDeploymentPipeline:
+    """
+    Exports the trained model to the NumPy runtime used for serving.
+    """
+
+    def __init__(self, config: ModelDeploymentConfig = None):
+        self.config = config or ModelDeploymentConfig()
+
+    def run(self, training_artifact: ModelTrainingArtifact = None) -> ModelDeploymentArtifact:
+        try:
+            logger.info("=" * 60)
+            logger.info("MODEL DEPLOYMENT PIPELINE STARTED")
+            logger.info("=" * 60)
+
+            if training_artifact is None:
+                training_config = ModelTrainingConfig()
+                training_artifact = ModelTrainingArtifact(
+                    model_file_path=training_config.model_file_path,
+                    preprocessor_file_path=training_config.preprocessor_file_path,
+                    report_file_path=training_config.report_file_path,
+                    test_mae=None,
+                )
+
+            artifact = ModelDeployer(self.config).initiate_model_deployment(training_artifact)
+
+            logger.info("MODEL DEPLOYMENT PIPELINE COMPLETED | max_abs_error=%s", artifact.max_abs_error)
+            return artifact
+
+        except Exception as e:
+            logger.error("Model deployment pipeline failed", exc_info=True)
+            raise CustomException(e, sys) from e
+
+
+if __name__ == "__main__":
+    ModelDeploymentPipeline().run()
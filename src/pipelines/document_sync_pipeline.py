@@ -0,0 +1,46 @@
+import sys
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.database.document_db import DocumentDB
+from src.pipelines.ingestion_pipeline import DataIngestionPipeline
+from src.entities.component_config_entity import DocumentDBConfig
+from src.entities.artifact_entity import DataIngestionArtifact, DocumentSyncArtifact
+
+logger = get_logger(__name__)
+
+
+class DocumentSyncPipeline:
+    """
+    Upserts the processed ingestion output into the MongoDB complaints
+    collection. Needs a reachable server (``MONGODB_URL``), so it is run
+    on its own rather than from ``run_pipeline``.
+    """
+
+    def __init__(self, config: DocumentDBConfig = None):
+        self.config = config or DocumentDBConfig()
+
+    def run(self, ingestion_artifact: DataIngestionArtifact = None) -> DocumentSyncArtifact:
+        try:
+            logger.info("=" * 60)
+            logger.info("DOCUMENT SYNC PIPELINE STARTED")
+            logger.info("=" * 60)
+
+            if ingestion_artifact is None:
+                ingestion_artifact = DataIngestionPipeline().run()
+
+            artifact = DocumentDB(self.config).initiate_document_sync(ingestion_artifact)
+
+            logger.info(
+                "DOCUMENT SYNC PIPELINE COMPLETED | documents=%s upserted=%s errors=%s docs/s=%s",
+                artifact.documents, artifact.upserted, artifact.errors, artifact.docs_per_second,
+            )
+            return artifact
+
+        except Exception as e:
+            logger.error("Document sync pipeline failed", exc_info=True)
+            raise CustomException(e, sys) from e
+
+
+if __name__ == "__main__":
+    DocumentSyncPipeline().run()
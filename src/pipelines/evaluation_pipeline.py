@@ -0,0 +1,43 @@
+import sys
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.models.evaluator import ModelEvaluator
+from src.data_access.feature_store import FeatureStore
+from src.pipelines.feature_engineering_pipeline import FeatureEngineeringPipeline
+from src.entities.component_config_entity import ModelEvaluationConfig
+from src.entities.artifact_entity import ModelEvaluationArtifact
+
+logger = get_logger(__name__)
+
+
+class ModelEvaluationPipeline:
+    """
+    Walk-forward backtest on the cached daily features. Feature
+    engineering runs first only when the feature store is empty.
+    """
+
+    def __init__(self, config: ModelEvaluationConfig = None):
+        self.config = config or ModelEvaluationConfig()
+
+    def run(self) -> ModelEvaluationArtifact:
+        try:
+            logger.info("=" * 60)
+            logger.info("MODEL EVALUATION PIPELINE STARTED")
+            logger.info("=" * 60)
+
+            if not FeatureStore(self.config.feature_store_dir).exists(self.config.feature_set):
+                FeatureEngineeringPipeline().run()
+
+            artifact = ModelEvaluator(self.config).initiate_model_evaluation()
+
+            logger.info("MODEL EVALUATION PIPELINE COMPLETED | %s", artifact)
+            return artifact
+
+        except Exception as e:
+            logger.error("Model evaluation pipeline failed", exc_info=True)
+            raise CustomException(e, sys) from e
+
+
+if __name__ == "__main__":
+    ModelEvaluationPipeline().run()
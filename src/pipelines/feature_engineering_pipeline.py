@@ -0,0 +1,42 @@
+import sys
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.components.feature_engineering import FeatureEngineering
+from src.pipelines.ingestion_pipeline import DataIngestionPipeline
+from src.entities.component_config_entity import FeatureEngineeringConfig
+from src.entities.artifact_entity import DataIngestionArtifact, FeatureEngineeringArtifact
+
+logger = get_logger(__name__)
+
+
+class FeatureEngineeringPipeline:
+    """
+    Runs the feature engineering stage (cached on inputs + settings).
+    """
+
+    def __init__(self, config: FeatureEngineeringConfig = None):
+        self.config = config or FeatureEngineeringConfig()
+
+    def run(self, ingestion_artifact: DataIngestionArtifact = None,
+            force: bool = False) -> FeatureEngineeringArtifact:
+        try:
+            logger.info("=" * 60)
+            logger.info("FEATURE ENGINEERING PIPELINE STARTED")
+            logger.info("=" * 60)
+
+            if ingestion_artifact is None:
+                ingestion_artifact = DataIngestionPipeline().run()
+
+            artifact = FeatureEngineering(self.config).initiate_feature_engineering(ingestion_artifact, force=force)
+
+            logger.info("FEATURE ENGINEERING PIPELINE COMPLETED | skipped=%s", artifact.skipped)
+            return artifact
+
+        except Exception as e:
+            logger.error("Feature engineering pipeline failed", exc_info=True)
+            raise CustomException(e, sys) from e
+
+
+if __name__ == "__main__":
+    FeatureEngineeringPipeline().run(force="--force" in sys.argv)
@@ -0,0 +1,37 @@
+import sys
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.components.data_ingestion import DataIngestion
+from src.entities.component_config_entity import DataIngestionConfig
+from src.entities.artifact_entity import DataIngestionArtifact
+
+logger = get_logger(__name__)
+
+
+class DataIngestionPipeline:
+    """
+    Runs the data ingestion stage.
+    """
+
+    def __init__(self, config: DataIngestionConfig = None):
+        self.config = config or DataIngestionConfig()
+
+    def run(self, force: bool = False) -> DataIngestionArtifact:
+        try:
+            logger.info("=" * 60)
+            logger.info("DATA INGESTION PIPELINE STARTED")
+            logger.info("=" * 60)
+
+            artifact = DataIngestion(self.config).initiate_data_ingestion(force=force)
+
+            logger.info("DATA INGESTION PIPELINE COMPLETED | skipped=%s", artifact.skipped)
+            return artifact
+
+        except Exception as e:
+            logger.error("Data ingestion pipeline failed", exc_info=True)
+            raise CustomException(e, sys) from e
+
+
+if __name__ == "__main__":
+    DataIngestionPipeline().run()
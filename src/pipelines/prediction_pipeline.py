@@ -0,0 +1,94 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.models.predictor import ForecastPredictor
+from src.pipelines.ingestion_pipeline import DataIngestionPipeline
+from src.entities.component_config_entity import ModelPredictionConfig, parquet_path
+from src.entities.artifact_entity import DataIngestionArtifact
+from src.utils.training_helper import make_supervised_windows
+from src.data_access.feature_store import FeatureStore
+from src.constants.paths import FEATURE_STORE_DAILY_FEATURES
+
+logger = get_logger(__name__)
+
+
+class PredictionPipeline:
+    """
+    Batch forecasts over the test period: one model call for every day,
+    written next to the actual counts. Daily counts come from the feature
+    store when it holds the model's series, else from the ingestion split.
+    """
+
+    def __init__(self, config: ModelPredictionConfig = None, store: FeatureStore = None,
+                 feature_set: str = FEATURE_STORE_DAILY_FEATURES):
+        self.config = config or ModelPredictionConfig()
+        self.store = store or FeatureStore()
+        self.feature_set = feature_set
+
+    def run(self, ingestion_artifact: DataIngestionArtifact = None) -> str:
+        try:
+            logger.info("=" * 60)
+            logger.info("PREDICTION PIPELINE STARTED")
+            logger.info("=" * 60)
+
+            if ingestion_artifact is None:
+                ingestion_artifact = DataIngestionPipeline().run()
+
+            training = self.config.training
+            predictor = ForecastPredictor.load(
+                self.config.model_file_path,
+                self.config.preprocessor_file_path,
+            )
+
+            columns = [training.date_column, training.category_column]
+            test_df = pd.read_parquet(parquet_path(ingestion_artifact.test_file_path), columns=columns)
+
+            # Test period primed with the last seq_length train days
+            test_start = pd.to_datetime(test_df[training.date_column]).min().normalize()
+            seq_length = predictor.preprocessor.seq_length
+            history_start = test_start - pd.Timedelta(days=seq_length)
+
+            manifest = self.store.manifest(self.feature_set)
+            if (manifest and set(predictor.columns) <= set(manifest["columns"])
+                    and pd.Timestamp(manifest["start_date"]) <= history_start):
+                matrix = self.store.read_frame(self.feature_set, start=history_start, columns=predictor.columns)
+            else:
+                train_df = pd.read_parquet(parquet_path(ingestion_artifact.train_file_path), columns=columns)
+                matrix = predictor.count_matrix(
+                    pd.concat([train_df, test_df], ignore_index=True),
+                    training.date_column,
+                    training.category_column,
+                    start=history_start,
+                )
+
+            X, y = make_supervised_windows(matrix.to_numpy(), seq_length, predictor.preprocessor.horizon)
+            predicted = predictor.predict(X)
+
+            dates = matrix.index[seq_length + predictor.preprocessor.horizon - 1:][:len(y)]
+            result = pd.DataFrame({training.date_column: dates})
+            for i, name in enumerate(predictor.columns):
+                result[f"ACTUAL {name}"] = y[:, i]
+                result[f"PREDICTED {name}"] = np.round(predicted[:, i], 3)
+
+            os.makedirs(self.config.prediction_dir, exist_ok=True)
+            result.to_csv(self.config.prediction_file_path, index=False)
+
+            logger.info(
+                "PREDICTION PIPELINE COMPLETED | days=%s path=%s",
+                len(result),
+                self.config.prediction_file_path,
+            )
+            return self.config.prediction_file_path
+
+        except Exception as e:
+            logger.error("Prediction pipeline failed", exc_info=True)
+            raise CustomException(e, sys) from e
+
+
+if __name__ == "__main__":
+    PredictionPipeline().run()
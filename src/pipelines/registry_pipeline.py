@@ -0,0 +1,74 @@
+import sys
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.models.registry import ModelRegistry
+from src.utils.helper import load_json
+from src.entities.component_config_entity import ModelRegistryConfig, ModelTrainingConfig
+from src.entities.artifact_entity import ModelDeploymentArtifact, ModelRegistryArtifact, ModelTrainingArtifact
+
+logger = get_logger(__name__)
+
+
+class ModelRegistryPipeline:
+    """
+    Registers the trained model + preprocessor (and its NumPy-runtime
+    export, when given) as a new version and, by default, makes it active.
+    Serving processes watching the registry pick the new version up
+    without a restart.
+    """
+
+    def __init__(self, config: ModelRegistryConfig = None):
+        self.config = config or ModelRegistryConfig()
+
+    def run(self,
+            training_artifact: ModelTrainingArtifact = None,
+            deployment_artifact: ModelDeploymentArtifact = None,
+            activate: bool = True) -> ModelRegistryArtifact:
+        try:
+            logger.info("=" * 60)
+            logger.info("MODEL REGISTRY PIPELINE STARTED")
+            logger.info("=" * 60)
+
+            if training_artifact is None:
+                training_config = ModelTrainingConfig()
+                training_artifact = ModelTrainingArtifact(
+                    model_file_path=training_config.model_file_path,
+                    preprocessor_file_path=training_config.preprocessor_file_path,
+                    report_file_path=training_config.report_file_path,
+                    test_mae=None,
+                )
+
+            report = load_json(training_artifact.report_file_path, default={})
+            registry = ModelRegistry(self.config)
+
+            version, already_registered = registry.register(
+                training_artifact.model_file_path,
+                training_artifact.preprocessor_file_path,
+                metrics={
+                    "test_metrics": report.get("test_metrics"),
+                    "trained_at": report.get("trained_at"),
+                    "source_sha256": report.get("source_sha256"),
+                    "trained_through": (report.get("train_date_range") or [None, None])[1],
+                },
+                activate=activate,
+                weights_file_path=deployment_artifact.weights_file_path if deployment_artifact else None,
+            )
+
+            artifact = ModelRegistryArtifact(
+                version=version,
+                version_dir=registry.version_dir(version),
+                activated=registry.active_version() == version,
+                already_registered=already_registered,
+            )
+
+            logger.info("MODEL REGISTRY PIPELINE COMPLETED | %s", artifact)
+            return artifact
+
+        except Exception as e:
+            logger.error("Model registry pipeline failed", exc_info=True)
+            raise CustomException(e, sys) from e
+
+
+if __name__ == "__main__":
+    ModelRegistryPipeline().run(activate="--no-activate" not in sys.argv)
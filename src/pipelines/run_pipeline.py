@@ -0,0 +1,94 @@
+import sys
+import json
+import hashlib
+from dataclasses import asdict
+from datetime import datetime
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.constants.paths import PIPELINE_STATE_FILE
+from src.entities.component_config_entity import ModelTrainingConfig
+from src.utils.helper import load_json, save_json
+from src.pipelines.ingestion_pipeline import DataIngestionPipeline
+from src.pipelines.validation_pipeline import DataValidationPipeline
+from src.pipelines.database_pipeline import DatabaseLoadPipeline
+from src.pipelines.feature_engineering_pipeline import FeatureEngineeringPipeline
+from src.pipelines.training_pipeline import TrainingPipeline
+from src.pipelines.evaluation_pipeline import ModelEvaluationPipeline
+from src.pipelines.prediction_pipeline import PredictionPipeline
+from src.pipelines.deployment_pipeline import ModelDeploymentPipeline
+from src.pipelines.registry_pipeline import ModelRegistryPipeline
+
+logger = get_logger(__name__)
+
+
+def model_inputs_key(feature_cache_key: str, training_config: ModelTrainingConfig) -> str:
+    """Hash of the feature cache key and the training settings."""
+    payload = json.dumps({"features": feature_cache_key, "training": asdict(training_config)}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def run_pipeline(force: bool = False) -> None:
+    """
+    Run the project stages in order; ``force`` reruns everything.
+
+    Without ``force``, ingestion and feature engineering reuse their
+    cached outputs, the serving store is reloaded only for new data, and
+    the model stages (training, evaluation, prediction, deployment,
+    registry) are skipped when the features and training settings match
+    the last completed model run.
+    """
+    try:
+        ingestion_artifact = DataIngestionPipeline().run(force=force)
+        logger.info("Ingestion artifact | %s", ingestion_artifact)
+
+        # Raises on a blocking validation failure, stopping the run
+        validation_artifact = DataValidationPipeline().run(ingestion_artifact)
+        logger.info("Validation artifact | %s", validation_artifact)
+
+        # Serving store: rebuilt only when ingestion produced new data
+        if force or not ingestion_artifact.skipped:
+            database_artifact = DatabaseLoadPipeline().run(ingestion_artifact)
+            logger.info("Database load artifact | %s", database_artifact)
+
+        feature_artifact = FeatureEngineeringPipeline().run(ingestion_artifact, force=force)
+        logger.info("Feature engineering artifact | %s", feature_artifact)
+
+        training_config = ModelTrainingConfig()
+        inputs_key = model_inputs_key(feature_artifact.cache_key, training_config)
+        state = load_json(PIPELINE_STATE_FILE, default={})
+        if not force and state.get("model_inputs_key") == inputs_key:
+            logger.info(
+                "Model stages skipped | inputs unchanged since %s key=%s",
+                state.get("completed_at"), inputs_key[:12],
+            )
+            return
+
+        training_artifact = TrainingPipeline(training_config=training_config).run(ingestion_artifact)
+        logger.info("Training artifact | %s", training_artifact)
+
+        evaluation_artifact = ModelEvaluationPipeline().run()
+        logger.info("Evaluation artifact | %s", evaluation_artifact)
+
+        prediction_file_path = PredictionPipeline().run(ingestion_artifact)
+        logger.info("Predictions | %s", prediction_file_path)
+
+        deployment_artifact = ModelDeploymentPipeline().run(training_artifact)
+        logger.info("Deployment artifact | %s", deployment_artifact)
+
+        registry_artifact = ModelRegistryPipeline().run(training_artifact, deployment_artifact)
+        logger.info("Registry artifact | %s", registry_artifact)
+
+        save_json(PIPELINE_STATE_FILE, {
+            "model_inputs_key": inputs_key,
+            "feature_cache_key": feature_artifact.cache_key,
+            "completed_at": datetime.now().isoformat(timespec="seconds"),
+        })
+
+    except Exception as e:
+        logger.error("Pipeline run failed", exc_info=True)
+        raise CustomException(e, sys) from e
+
+
+if __name__ == "__main__":
+    run_pipeline(force="--force" in sys.argv)
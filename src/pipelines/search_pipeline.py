@@ -0,0 +1,42 @@
+import sys
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.models.search import HyperparameterSearch
+from src.pipelines.ingestion_pipeline import DataIngestionPipeline
+from src.entities.component_config_entity import ModelSearchConfig
+from src.entities.artifact_entity import DataIngestionArtifact, ModelSearchArtifact
+
+logger = get_logger(__name__)
+
+
+class ModelSearchPipeline:
+    """
+    Hyperparameter search over the model factory. Rerunning resumes from
+    the trial journal.
+    """
+
+    def __init__(self, config: ModelSearchConfig = None):
+        self.config = config or ModelSearchConfig()
+
+    def run(self, ingestion_artifact: DataIngestionArtifact = None) -> ModelSearchArtifact:
+        try:
+            logger.info("=" * 60)
+            logger.info("MODEL SEARCH PIPELINE STARTED")
+            logger.info("=" * 60)
+
+            if ingestion_artifact is None:
+                ingestion_artifact = DataIngestionPipeline().run()
+
+            artifact = HyperparameterSearch(self.config).run(ingestion_artifact)
+
+            logger.info("MODEL SEARCH PIPELINE COMPLETED | %s", artifact)
+            return artifact
+
+        except Exception as e:
+            logger.error("Model search pipeline failed", exc_info=True)
+            raise CustomException(e, sys) from e
+
+
+if __name__ == "__main__":
+    ModelSearchPipeline().run()
@@ -0,0 +1,92 @@
+import sys
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.models.trainer import IncrementalTrainer, ModelTrainer
+from src.pipelines.ingestion_pipeline import DataIngestionPipeline
+from src.pipelines.feature_engineering_pipeline import FeatureEngineeringPipeline
+from src.entities.component_config_entity import (
+    DataIngestionConfig,
+    FeatureEngineeringConfig,
+    IncrementalTrainingConfig,
+    ModelTrainingConfig,
+)
+from src.entities.artifact_entity import (
+    DataIngestionArtifact,
+    IncrementalTrainingArtifact,
+    ModelTrainingArtifact,
+)
+
+logger = get_logger(__name__)
+
+
+class TrainingPipeline:
+    """
+    Ingestion (skipped when the source is unchanged) followed by training
+    of the daily complaint-volume forecaster.
+    """
+
+    def __init__(self,
+                 ingestion_config: DataIngestionConfig = None,
+                 training_config: ModelTrainingConfig = None):
+        self.ingestion_config = ingestion_config or DataIngestionConfig()
+        self.training_config = training_config or ModelTrainingConfig()
+
+    def run(self, ingestion_artifact: DataIngestionArtifact = None) -> ModelTrainingArtifact:
+        try:
+            logger.info("=" * 60)
+            logger.info("TRAINING PIPELINE STARTED")
+            logger.info("=" * 60)
+
+            if ingestion_artifact is None:
+                ingestion_artifact = DataIngestionPipeline(self.ingestion_config).run()
+
+            artifact = ModelTrainer(self.training_config).initiate_model_training(ingestion_artifact)
+
+            logger.info("TRAINING PIPELINE COMPLETED | test_mae=%s", artifact.test_mae)
+            return artifact
+
+        except Exception as e:
+            logger.error("Training pipeline failed", exc_info=True)
+            raise CustomException(e, sys) from e
+
+
+class IncrementalTrainingPipeline:
+    """
+    Daily refresh: ingest the updated source, republish features and
+    fine-tune the active registered model on the new days.
+    """
+
+    def __init__(self,
+                 ingestion_config: DataIngestionConfig = None,
+                 feature_config: FeatureEngineeringConfig = None,
+                 incremental_config: IncrementalTrainingConfig = None):
+        self.ingestion_config = ingestion_config or DataIngestionConfig()
+        self.feature_config = feature_config or FeatureEngineeringConfig()
+        self.incremental_config = incremental_config or IncrementalTrainingConfig()
+
+    def run(self) -> IncrementalTrainingArtifact:
+        try:
+            logger.info("=" * 60)
+            logger.info("INCREMENTAL TRAINING PIPELINE STARTED")
+            logger.info("=" * 60)
+
+            ingestion_artifact = DataIngestionPipeline(self.ingestion_config).run()
+            FeatureEngineeringPipeline(self.feature_config).run(ingestion_artifact)
+
+            artifact = IncrementalTrainer(self.incremental_config).initiate_incremental_training()
+
+            logger.info("INCREMENTAL TRAINING PIPELINE COMPLETED | promoted=%s version=%s",
+                        artifact.promoted, artifact.version)
+            return artifact
+
+        except Exception as e:
+            logger.error("Incremental training pipeline failed", exc_info=True)
+            raise CustomException(e, sys) from e
+
+
+if __name__ == "__main__":
+    if "--incremental" in sys.argv:
+        IncrementalTrainingPipeline().run()
+    else:
+        TrainingPipeline().run()
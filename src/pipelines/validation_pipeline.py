@@ -0,0 +1,46 @@
+import sys
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.components.data_validation import DataValidation
+from src.pipelines.ingestion_pipeline import DataIngestionPipeline
+from src.entities.component_config_entity import DataValidationConfig
+from src.entities.artifact_entity import DataIngestionArtifact, DataValidationArtifact
+
+logger = get_logger(__name__)
+
+
+class DataValidationPipeline:
+    """
+    Runs the data validation stage. A blocking failure stops the caller
+    unless ``raise_on_failure`` is False.
+    """
+
+    def __init__(self, config: DataValidationConfig = None):
+        self.config = config or DataValidationConfig()
+
+    def run(self, ingestion_artifact: DataIngestionArtifact = None,
+            raise_on_failure: bool = True) -> DataValidationArtifact:
+        try:
+            logger.info("=" * 60)
+            logger.info("DATA VALIDATION PIPELINE STARTED")
+            logger.info("=" * 60)
+
+            if ingestion_artifact is None:
+                ingestion_artifact = DataIngestionPipeline().run()
+
+            artifact = DataValidation(self.config).initiate_data_validation(ingestion_artifact)
+
+            if raise_on_failure and not artifact.validation_status:
+                raise ValueError(f"Data validation failed: {artifact.failed_checks}")
+
+            logger.info("DATA VALIDATION PIPELINE COMPLETED | status=%s", artifact.validation_status)
+            return artifact
+
+        except Exception as e:
+            logger.error("Data validation pipeline failed", exc_info=True)
+            raise CustomException(e, sys) from e
+
+
+if __name__ == "__main__":
+    DataValidationPipeline().run()
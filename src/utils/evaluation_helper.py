@@ -0,0 +1,98 @@
+from typing import Callable, List
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+# ================================================================
+# MULTI-STEP FORECASTS
+# ================================================================
+
+def windows_ending_at(values: np.ndarray, rows: np.ndarray, seq_length: int) -> np.ndarray:
+    """
+    Input windows (len(rows), seq_length, series) whose last day is each
+    of ``rows``; a strided view, no per-row copy loop.
+    """
+    view = sliding_window_view(values, seq_length, axis=0)  # (days - seq + 1, series, seq)
+    return np.ascontiguousarray(view[np.asarray(rows) - seq_length + 1].transpose(0, 2, 1))
+
+
+def recursive_forecast(predict_fn: Callable[[np.ndarray], np.ndarray],
+                       windows: np.ndarray, steps: int) -> np.ndarray:
+    """
+    ``steps``-day forecasts for every window at once by feeding each
+    one-day prediction back as the newest input day. One batched model
+    call per step.
+
+    Returns
+    -------
+    np.ndarray
+        shape (windows, steps, series)
+    """
+    window = np.asarray(windows, dtype=np.float32).copy()
+    out = np.empty((window.shape[0], steps, window.shape[2]), dtype=np.float32)
+
+    for step in range(steps):
+        predicted = np.asarray(predict_fn(window), dtype=np.float32)
+        out[:, step] = predicted
+        window = np.concatenate([window[:, 1:], predicted[:, None, :]], axis=1)
+
+    return out
+
+
+def horizon_actuals(values: np.ndarray, origins: np.ndarray, steps: int) -> np.ndarray:
+    """Actual values for days origin+1 .. origin+steps, shape (origins, steps, series)."""
+    return np.asarray(values)[np.asarray(origins)[:, None] + np.arange(1, steps + 1)]
+
+
+# ================================================================
+# ERROR SUMMARY
+# ================================================================
+
+def _mae_mape(abs_err: np.ndarray, ape: np.ndarray, axis) -> tuple:
+    mae = abs_err.mean(axis=axis)
+    with np.errstate(invalid="ignore"):
+        mape = np.nanmean(ape, axis=axis) * 100.0
+    return mae, mape
+
+
+def _number(value) -> float:
+    value = float(value)
+    return None if np.isnan(value) else round(value, 6)
+
+
+def error_summary(actual: np.ndarray, predicted: np.ndarray, columns: List[str]) -> dict:
+    """
+    MAE and MAPE overall, per horizon step and per series for arrays
+    shaped (origins, steps, series). MAPE skips days with zero actuals.
+    """
+    actual = np.asarray(actual, dtype=np.float64)
+    predicted = np.asarray(predicted, dtype=np.float64)
+
+    abs_err = np.abs(predicted - actual)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ape = np.where(actual > 0, abs_err / np.abs(actual), np.nan)
+
+    step_mae, step_mape = _mae_mape(abs_err, ape, axis=(0, 2))
+    series_mae, series_mape = _mae_mape(abs_err, ape, axis=(0, 1))
+    cell_mae, cell_mape = _mae_mape(abs_err, ape, axis=0)  # (steps, series)
+    overall_mae, overall_mape = _mae_mape(abs_err, ape, axis=None)
+
+    return {
+        "origins": int(actual.shape[0]),
+        "mae": _number(overall_mae),
+        "mape": _number(overall_mape),
+        "per_horizon": [
+            {"step": step + 1, "mae": _number(m), "mape": _number(p)}
+            for step, (m, p) in enumerate(zip(step_mae, step_mape))
+        ],
+        "per_series": {
+            name: {
+                "mae": _number(series_mae[i]),
+                "mape": _number(series_mape[i]),
+                "per_horizon_mae": [_number(v) for v in cell_mae[:, i]],
+                "per_horizon_mape": [_number(v) for v in cell_mape[:, i]],
+            }
+            for i, name in enumerate(columns)
+        },
+    }
@@ -0,0 +1,97 @@
+from typing import Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+# ================================================================
+# CALENDAR FEATURES
+# ================================================================
+
+def calendar_features(index: pd.DatetimeIndex) -> Dict[str, np.ndarray]:
+    """
+    Calendar features of a daily index, each one whole-column array.
+
+    Day of week and day of year also get sin/cos encodings so that the
+    model sees Sunday next to Monday and 31 Dec next to 1 Jan.
+    """
+    day_of_week = index.dayofweek.to_numpy()
+    day_of_year = index.dayofyear.to_numpy()
+    year_length = np.where(index.is_leap_year, 366, 365)
+
+    return {
+        "day_of_week": day_of_week.astype(np.int16),
+        "day_of_month": index.day.to_numpy().astype(np.int16),
+        "day_of_year": day_of_year.astype(np.int16),
+        "week_of_year": index.isocalendar().week.to_numpy().astype(np.int16),
+        "month": index.month.to_numpy().astype(np.int16),
+        "is_weekend": (day_of_week >= 5).astype(np.int8),
+        "is_month_start": index.is_month_start.astype(np.int8),
+        "is_month_end": index.is_month_end.astype(np.int8),
+        "day_of_week_sin": np.sin(2 * np.pi * day_of_week / 7).astype(np.float32),
+        "day_of_week_cos": np.cos(2 * np.pi * day_of_week / 7).astype(np.float32),
+        "day_of_year_sin": np.sin(2 * np.pi * (day_of_year - 1) / year_length).astype(np.float32),
+        "day_of_year_cos": np.cos(2 * np.pi * (day_of_year - 1) / year_length).astype(np.float32),
+    }
+
+
+# ================================================================
+# LAG / ROLLING FEATURES
+# ================================================================
+
+def lag_features(values: np.ndarray, columns: Sequence[str], lags: Sequence[int]) -> Dict[str, np.ndarray]:
+    """
+    ``<series>_lag_<k>``: the count ``k`` days earlier (NaN for the first
+    ``k`` days). One slice assignment per lag covers every series.
+    """
+    values = np.asarray(values, dtype=np.float32)
+    features = {}
+    for lag in lags:
+        shifted = np.full_like(values, np.nan)
+        if lag < len(values):
+            shifted[lag:] = values[:-lag]
+        for i, name in enumerate(columns):
+            features[f"{name}_lag_{lag}"] = shifted[:, i]
+    return features
+
+
+def rolling_mean_features(values: np.ndarray, columns: Sequence[str],
+                          windows: Sequence[int]) -> Dict[str, np.ndarray]:
+    """
+    ``<series>_rollmean_<w>``: mean over the ``w`` days ending on the row's
+    day (NaN until a full window is available). Computed from one
+    cumulative sum, so the cost does not depend on ``w``.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    cumsum = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(values, axis=0)])
+
+    features = {}
+    for window in windows:
+        means = np.full(values.shape, np.nan, dtype=np.float32)
+        if window <= len(values):
+            means[window - 1:] = (cumsum[window:] - cumsum[:-window]) / window
+        for i, name in enumerate(columns):
+            features[f"{name}_rollmean_{window}"] = means[:, i]
+    return features
+
+
+# ================================================================
+# FEATURE FRAME
+# ================================================================
+
+def build_feature_frame(counts: pd.DataFrame, lags: Sequence[int],
+                        rolling_windows: Sequence[int]) -> pd.DataFrame:
+    """
+    Feature frame for a daily count matrix (rows = days, columns = series):
+    calendar features, the counts themselves, their lags and rolling means.
+    """
+    values = counts.to_numpy(dtype=np.float32)
+    columns = [str(c) for c in counts.columns]
+
+    features = {}
+    features.update(calendar_features(counts.index))
+    features.update({name: values[:, i] for i, name in enumerate(columns)})
+    features.update(lag_features(values, columns, lags))
+    features.update(rolling_mean_features(values, columns, rolling_windows))
+
+    return pd.DataFrame(features, index=counts.index)
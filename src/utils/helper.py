@@ -0,0 +1,169 @@
+import os
+import json
+import hashlib
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+import numpy as np
+import yaml
+
+
+# ================================================================
+# DOWNSAMPLING
+# ================================================================
+
+def lttb_downsample(x, y, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points and, for every interior bucket, the
+    point forming the largest triangle with the previously selected point
+    and the mean of the next bucket. Bucket bounds and next-bucket means
+    are computed for all buckets at once with cumulative sums; only the
+    arg-max per bucket depends on the previous selection.
+
+    Parameters
+    ----------
+    x : array-like
+        Monotonic x values (numeric or datetime64).
+    y : array-like
+        Values aligned with ``x``.
+    n_out : int
+        Number of points to keep (typically the chart width in pixels).
+
+    Returns
+    -------
+    np.ndarray
+        Sorted integer indices of the selected points.
+    """
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype("datetime64[ns]").astype(np.int64)
+    x = x.astype(np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    n = x.size
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # ----------------------------------------------------------------
+    # Interior points 1..n-2 split into n_out-2 buckets
+    # ----------------------------------------------------------------
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    starts, ends = edges[:-1], edges[1:]
+
+    # ----------------------------------------------------------------
+    # Mean of the following bucket (last bucket looks at the final point)
+    # ----------------------------------------------------------------
+    cum_x = np.concatenate(([0.0], np.cumsum(x)))
+    cum_y = np.concatenate(([0.0], np.cumsum(y)))
+    next_starts = np.append(starts[1:], n - 1)
+    next_ends = np.append(ends[1:], n)
+    next_sizes = next_ends - next_starts
+    avg_x = (cum_x[next_ends] - cum_x[next_starts]) / next_sizes
+    avg_y = (cum_y[next_ends] - cum_y[next_starts]) / next_sizes
+
+    # ----------------------------------------------------------------
+    # Select the largest triangle per bucket
+    # ----------------------------------------------------------------
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    anchor = 0
+    for bucket, (start, end) in enumerate(zip(starts, ends)):
+        ax, ay = x[anchor], y[anchor]
+        area = np.abs(
+            (ax - avg_x[bucket]) * (y[start:end] - ay)
+            - (ax - x[start:end]) * (avg_y[bucket] - ay)
+        )
+        anchor = start + int(np.argmax(area))
+        selected[bucket + 1] = anchor
+
+    return selected
+
+
+# ================================================================
+# FILE UTILITIES
+# ================================================================
+
+def file_sha256(path: str, block_size: int = 1 << 20) -> str:
+    """
+    SHA-256 of a file, streamed in ``block_size`` blocks.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def save_json(path: str, data: Any) -> None:
+    """
+    Write JSON atomically (temporary file + rename), creating parent dirs.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    # Unique temporary name, so concurrent writers never share one file
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=4, default=str)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """
+    Exclusive lock on ``path`` (created if missing) shared by every
+    process on the machine; blocks until it is free.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after ~10 s; keep waiting
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def load_json(path: str, default: Any = None) -> Any:
+    """
+    Read a JSON file, returning ``default`` when it does not exist.
+    """
+    if not os.path.exists(path):
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+
+def read_yaml(path: str) -> dict:
+    """
+    Read a YAML file; an empty file yields an empty dict.
+    """
+    with open(path) as f:
+        return yaml.safe_load(f) or {}
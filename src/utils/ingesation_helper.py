@@ -0,0 +1,250 @@
+import os
+import sys
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+import openpyxl
+import pyarrow.parquet as pq
+
+from src.logging.logger import get_logger
+from src.exceptions.exception import CustomException
+from src.constants.paths import (
+    ARTIFACTS_DIR,
+    DATA_INGESTION_DIR,
+    DATA_INGESTION_SUMMARY_FILE,
+)
+
+logger = get_logger(__name__)
+
+SUMMARY_SNAPSHOT_PATH = os.path.join(ARTIFACTS_DIR, DATA_INGESTION_DIR, DATA_INGESTION_SUMMARY_FILE)
+
+
+# ================================================================
+# SOURCE VERSION
+# ================================================================
+
+def source_version(path: str) -> Dict[str, Any]:
+    """
+    Cheap version stamp of a source file (size and modification time).
+    """
+    stat = os.stat(path)
+    return {
+        "path": os.path.abspath(path),
+        "size": int(stat.st_size),
+        "mtime_ns": int(stat.st_mtime_ns),
+    }
+
+
+# ================================================================
+# SUMMARY SNAPSHOT
+# ================================================================
+
+def compute_summary_snapshot(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Compute the overview KPIs from the complaint rows.
+
+    Open complaints are also stored per day, so the 30/90-day open counts
+    can be re-evaluated against the current date without the raw data.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Complaint rows with DATE and CLOSED/OPEN columns.
+
+    Returns
+    -------
+    dict
+        JSON-serialisable snapshot.
+    """
+    dates = pd.to_datetime(df["DATE"], errors="coerce")
+    status = df["CLOSED/OPEN"]
+    status_counts = status.value_counts()
+
+    is_open = status.eq("Open").fillna(False).astype(bool)
+    open_by_date = dates[is_open].dt.normalize().value_counts().sort_index()
+
+    last_date = dates.max()
+    last_day_count = int((dates == last_date).sum()) if pd.notna(last_date) else 0
+
+    return {
+        "total_rows": int(len(df)),
+        "open_complaints": int(status_counts.get("Open", 0)),
+        "closed_complaints": int(status_counts.get("Closed", 0)),
+        "last_date": last_date.isoformat() if pd.notna(last_date) else None,
+        "last_day_complaints": last_day_count,
+        "open_by_date": {d.strftime("%Y-%m-%d"): int(c) for d, c in open_by_date.items()},
+    }
+
+
+def snapshot_kpis(snapshot: Dict[str, Any], now: Optional[pd.Timestamp] = None) -> Dict[str, int]:
+    """
+    KPI row values from a snapshot, with rolling windows relative to ``now``.
+    """
+    now = now or pd.Timestamp.now()
+
+    open_by_date = pd.Series(snapshot.get("open_by_date", {}), dtype="int64")
+    open_by_date.index = pd.to_datetime(open_by_date.index)
+
+    return {
+        "total_complaints": snapshot["total_rows"],
+        "open_complaints": snapshot["open_complaints"],
+        "closed_complaints": snapshot["closed_complaints"],
+        "open_90_days": int(open_by_date[open_by_date.index >= now - pd.Timedelta(days=90)].sum()),
+        "open_30_days": int(open_by_date[open_by_date.index >= now - pd.Timedelta(days=30)].sum()),
+        "last_day_complaints": snapshot["last_day_complaints"],
+    }
+
+
+def write_summary_snapshot(
+    dataset_path: str,
+    df: Optional[pd.DataFrame] = None,
+    snapshot_path: str = SUMMARY_SNAPSHOT_PATH,
+) -> Dict[str, Any]:
+    """
+    Compute and persist the summary snapshot for ``dataset_path``.
+
+    Pass ``df`` when the rows are already in memory (e.g. during ingestion)
+    to avoid reading the source again.
+    """
+    try:
+        if df is None:
+            df = pd.read_excel(dataset_path)
+
+        snapshot = compute_summary_snapshot(df)
+        snapshot["source"] = source_version(dataset_path)
+        snapshot["computed_at"] = datetime.now().isoformat(timespec="seconds")
+
+        os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+        tmp_path = f"{snapshot_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, snapshot_path)
+
+        logger.info(
+            "Summary snapshot written | path=%s rows=%s",
+            snapshot_path,
+            snapshot["total_rows"],
+        )
+        return snapshot
+
+    except Exception as e:
+        logger.error(f"Error writing summary snapshot: {str(e)}", exc_info=True)
+        raise CustomException(e, sys) from e
+
+
+def load_summary_snapshot(
+    dataset_path: str,
+    snapshot_path: str = SUMMARY_SNAPSHOT_PATH,
+    rebuild: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """
+    Read the persisted snapshot; rebuild it when missing or when the source
+    file changed since it was written (unless ``rebuild`` is False).
+    """
+    snapshot = None
+    if os.path.exists(snapshot_path):
+        with open(snapshot_path) as f:
+            snapshot = json.load(f)
+
+    is_current = (
+        snapshot is not None
+        and os.path.exists(dataset_path)
+        and snapshot.get("source", {}) == source_version(dataset_path)
+    )
+
+    if is_current or not rebuild:
+        return snapshot
+
+    if not os.path.exists(dataset_path):
+        logger.warning("Dataset file not found | path=%s", dataset_path)
+        return snapshot
+
+    logger.info("Summary snapshot stale or missing, rebuilding | path=%s", snapshot_path)
+    return write_summary_snapshot(dataset_path, snapshot_path=snapshot_path)
+
+
+# ================================================================
+# CHUNKED SOURCE READING
+# ================================================================
+
+def iter_source_chunks(path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+    Yield the source dataset in chunks of at most ``chunksize`` rows.
+
+    CSV uses the pandas chunk reader, Parquet reads record batches and
+    .xlsx streams rows from a read-only openpyxl workbook, so the whole
+    sheet is never materialised at once.
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".csv":
+        yield from pd.read_csv(path, chunksize=chunksize, dtype=str, keep_default_na=True)
+
+    elif extension == ".parquet":
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+
+    elif extension == ".xls":
+        # Legacy format: no streaming reader, slice the loaded sheet
+        df = pd.read_excel(path, dtype=object)
+        for start in range(0, len(df), chunksize):
+            yield df.iloc[start:start + chunksize]
+
+    elif extension == ".xlsx":
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = [
+                str(name).strip() if name is not None else f"Unnamed: {i}"
+                for i, name in enumerate(next(rows, ()))
+            ]
+
+            buffer = []
+            for row in rows:
+                if all(value is None for value in row):
+                    continue
+                buffer.append(row)
+                if len(buffer) == chunksize:
+                    yield pd.DataFrame(buffer, columns=header, dtype=object)
+                    buffer = []
+            if buffer:
+                yield pd.DataFrame(buffer, columns=header, dtype=object)
+        finally:
+            workbook.close()
+
+    else:
+        raise ValueError(f"Unsupported file format: {extension}")
+
+
+def normalise_chunk(chunk: pd.DataFrame, date_column: str = "DATE") -> pd.DataFrame:
+    """
+    Give every chunk the same column types: the date column as datetime64,
+    everything else as nullable strings (identifiers such as CONSUMER NUMBER
+    keep their exact text and Parquet schemas stay stable across chunks).
+    """
+    chunk = chunk.rename(columns=lambda c: str(c).strip())
+
+    for col in chunk.columns:
+        if col == date_column:
+            chunk[col] = pd.to_datetime(chunk[col], errors="coerce")
+        else:
+            chunk[col] = chunk[col].astype("string").str.strip()
+
+    return chunk
+
+
+def time_split_cutoff(dates: np.ndarray, test_ratio: float) -> pd.Timestamp:
+    """
+    First day of the test period: the day holding the row at the
+    ``1 - test_ratio`` quantile of the sorted dates. Whole days stay on one
+    side of the split.
+    """
+    dates = np.sort(dates[~np.isnat(dates)])
+    if dates.size == 0:
+        raise ValueError("No valid dates to split on")
+
+    position = min(int(dates.size * (1 - test_ratio)), dates.size - 1)
+    return pd.Timestamp(dates[position]).normalize()
@@ -0,0 +1,185 @@
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+TOTAL_SERIES = "TOTAL"
+OTHER_CATEGORY = "Other"
+
+# Native thread pools (BLAS/OpenMP, TensorFlow) read these when loaded
+THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "TF_NUM_INTRAOP_THREADS",
+    "TF_NUM_INTEROP_THREADS",
+)
+
+
+# ================================================================
+# DAILY COUNT MATRIX
+# ================================================================
+
+def select_categories(values: pd.Series, max_categories: Optional[int] = None) -> List[str]:
+    """
+    Categories to model as separate series, most frequent first. Anything
+    beyond ``max_categories`` is folded into ``OTHER_CATEGORY``.
+    """
+    counts = clean_categories(values).value_counts()
+    if max_categories is None or len(counts) <= max_categories:
+        return counts.index.tolist()
+    return counts.index[:max_categories].tolist() + [OTHER_CATEGORY]
+
+
+def clean_categories(values: pd.Series) -> pd.Series:
+    return values.astype("string").str.strip().fillna("(blank)")
+
+
+def build_daily_count_matrix(
+    df: pd.DataFrame,
+    categories: List[str],
+    date_column: str = "DATE",
+    category_column: str = "COMPLAINT TYPE",
+    start: Optional[pd.Timestamp] = None,
+    end: Optional[pd.Timestamp] = None,
+) -> pd.DataFrame:
+    """
+    Daily complaint counts, one row per calendar day (missing days are 0)
+    and one column per series: ``TOTAL`` followed by ``categories``.
+
+    Counting is a single ``np.add.at`` over (day, category) codes rather
+    than a group-by per category.
+    """
+    dates = pd.to_datetime(df[date_column], errors="coerce").dt.normalize()
+    valid = dates.notna().to_numpy()
+    dates = dates[valid]
+
+    start = pd.Timestamp(start) if start is not None else dates.min()
+    end = pd.Timestamp(end) if end is not None else dates.max()
+    index = pd.date_range(start, end, freq="D", name=date_column)
+
+    labels = clean_categories(df[category_column][valid])
+    if OTHER_CATEGORY in categories:
+        labels = labels.where(labels.isin(categories), OTHER_CATEGORY)
+
+    day_codes = ((dates.to_numpy() - start.to_datetime64()) // np.timedelta64(1, "D")).astype(np.int64)
+    cat_codes = pd.Categorical(labels, categories=categories).codes.astype(np.int64)
+
+    keep = (day_codes >= 0) & (day_codes < len(index)) & (cat_codes >= 0)
+    counts = np.zeros((len(index), len(categories)), dtype=np.float32)
+    np.add.at(counts, (day_codes[keep], cat_codes[keep]), 1.0)
+
+    total = np.zeros(len(index), dtype=np.float32)
+    in_range = (day_codes >= 0) & (day_codes < len(index))
+    np.add.at(total, day_codes[in_range], 1.0)
+
+    return pd.DataFrame(
+        np.column_stack([total, counts]),
+        index=index,
+        columns=[TOTAL_SERIES] + list(categories),
+    )
+
+
+# ================================================================
+# SUPERVISED WINDOWS
+# ================================================================
+
+def make_supervised_windows(
+    values: np.ndarray,
+    seq_length: int,
+    horizon: int = 1,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Turn a (days, series) matrix into LSTM inputs and next-day targets.
+
+    Uses ``sliding_window_view`` so no Python loop runs over the days.
+
+    Returns
+    -------
+    X : np.ndarray
+        float32, shape (samples, seq_length, series)
+    y : np.ndarray
+        float32, shape (samples, series) — the value ``horizon`` days after
+        each window
+    """
+    values = np.asarray(values, dtype=np.float32)
+    n_samples = values.shape[0] - seq_length - horizon + 1
+    if n_samples <= 0:
+        empty = np.empty((0, seq_length, values.shape[1]), dtype=np.float32)
+        return empty, np.empty((0, values.shape[1]), dtype=np.float32)
+
+    # (days - seq_length + 1, series, seq_length) -> (samples, seq_length, series)
+    windows = sliding_window_view(values, seq_length, axis=0)[:n_samples]
+    X = np.ascontiguousarray(windows.transpose(0, 2, 1))
+    y = np.ascontiguousarray(values[seq_length + horizon - 1:seq_length + horizon - 1 + n_samples])
+    return X, y
+
+
+# ================================================================
+# METRICS
+# ================================================================
+
+def forecast_metrics(actual: np.ndarray, predicted: np.ndarray, columns: List[str]) -> dict:
+    """
+    MAE/RMSE overall and per series for (samples, series) count arrays.
+    """
+    actual = np.asarray(actual, dtype=np.float64)
+    predicted = np.asarray(predicted, dtype=np.float64)
+    error = predicted - actual
+
+    if error.size == 0:
+        return {"samples": 0, "mae": None, "rmse": None, "per_series": {}}
+
+    mae = np.abs(error).mean(axis=0)
+    rmse = np.sqrt((error ** 2).mean(axis=0))
+
+    return {
+        "samples": int(actual.shape[0]),
+        "mae": float(np.abs(error).mean()),
+        "rmse": float(np.sqrt((error ** 2).mean())),
+        "per_series": {
+            name: {"mae": float(m), "rmse": float(r)}
+            for name, m, r in zip(columns, mae, rmse)
+        },
+    }
+
+
+# ================================================================
+# WORKER POOLS
+# ================================================================
+
+@contextmanager
+def worker_pool(max_workers: int, threads: int, initializer: Callable = None,
+                initargs: tuple = ()) -> Iterator[ProcessPoolExecutor]:
+    """
+    Spawn-based process pool whose workers are limited to ``threads``
+    native threads each.
+
+    The limits have to be in the environment when a worker starts, since
+    numpy's BLAS and TensorFlow size their pools when first imported (the
+    worker imports them while unpickling its initializer). They are set
+    in this process for the life of the pool, which spawns workers
+    lazily, and restored afterwards.
+    """
+    previous = {var: os.environ.get(var) for var in THREAD_ENV_VARS}
+    for var in THREAD_ENV_VARS:
+        os.environ[var] = str(threads if var != "TF_NUM_INTEROP_THREADS" else 1)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=initializer,
+            initargs=initargs,
+        ) as pool:
+            yield pool
+    finally:
+        for var, value in previous.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
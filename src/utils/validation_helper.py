@@ -0,0 +1,172 @@
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+# ================================================================
+# SINGLE-PASS COLUMN PROFILE
+# ================================================================
+
+def _value_counts(column: pa.ChunkedArray) -> pd.Series:
+    """Distinct non-null values and their counts (one scan of the column)."""
+    counts = pc.value_counts(column)
+    values, frequencies = counts.field("values"), counts.field("counts")
+    valid = pc.is_valid(values)
+    return pd.Series(
+        frequencies.filter(valid).to_numpy(zero_copy_only=False),
+        index=values.filter(valid).to_pandas(),
+        dtype=np.int64,
+    )
+
+
+def profile_column(column: pa.ChunkedArray, top_n: int = 10) -> dict:
+    """
+    Everything the validation checks need from one column, derived from
+    a single ``value_counts`` pass: string checks then only touch the
+    distinct values, weighted by their counts.
+    """
+    rows = len(column)
+    profile = {
+        "type": str(column.type),
+        "rows": rows,
+        "nulls": int(column.null_count),
+    }
+
+    if pa.types.is_timestamp(column.type) or pa.types.is_date(column.type):
+        daily = _value_counts(column.cast(pa.date32())).sort_index()
+        daily.index = pd.DatetimeIndex(daily.index)
+        profile.update({
+            "distinct": int(len(daily)),
+            "min": str(daily.index.min().date()) if len(daily) else None,
+            "max": str(daily.index.max().date()) if len(daily) else None,
+            "daily_counts": daily,
+        })
+        return profile
+
+    counts = _value_counts(column)
+    profile.update({
+        "distinct": int(len(counts)),
+        "duplicate_rows": int((counts[counts > 1] - 1).sum()),
+        "top_values": {str(k): int(v) for k, v in counts.nlargest(top_n).items()},
+        "value_counts": counts,
+    })
+
+    if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+        text = counts.index.to_series().astype(str)
+        lengths = text.str.len()
+        profile.update({
+            "blank": int(counts[text.str.strip().eq("").to_numpy()].sum()),
+            "numeric_share": float(counts[text.str.fullmatch(r"\d+").to_numpy()].sum() / max(rows, 1)),
+            "min_length": int(lengths.min()) if len(lengths) else None,
+            "max_length": int(lengths.max()) if len(lengths) else None,
+        })
+
+    return profile
+
+
+def profile_table(table: pa.Table, columns: List[str] = None) -> Dict[str, dict]:
+    """Profile of every (or the selected) column of an Arrow table."""
+    return {name: profile_column(table.column(name)) for name in (columns or table.column_names)}
+
+
+def public_profile(profile: dict) -> dict:
+    """Profile without the bulky Series entries, for JSON reports."""
+    return {k: v for k, v in profile.items() if not isinstance(v, pd.Series)}
+
+
+# ================================================================
+# NUMERIC SUMMARIES
+# ================================================================
+
+def complete_daily_counts(daily: pd.Series) -> pd.Series:
+    """Daily counts over the full calendar range, zero on days without rows."""
+    if daily.empty:
+        return daily
+    return daily.reindex(pd.date_range(daily.index.min(), daily.index.max(), freq="D"), fill_value=0)
+
+
+def skewness(values: np.ndarray) -> float:
+    values = np.asarray(values, dtype=np.float64)
+    std = values.std()
+    if values.size < 3 or std == 0:
+        return 0.0
+    return float(((values - values.mean()) ** 3).mean() / std ** 3)
+
+
+def iqr_bounds(values: np.ndarray, multiplier: float) -> tuple:
+    q1, q3 = np.percentile(np.asarray(values, dtype=np.float64), [25, 75])
+    iqr = q3 - q1
+    return float(q1 - multiplier * iqr), float(q3 + multiplier * iqr)
+
+
+def longest_gap(dates: pd.DatetimeIndex) -> int:
+    """Longest run of consecutive calendar days without any row."""
+    if len(dates) < 2:
+        return 0
+    steps = np.diff(dates.values).astype("timedelta64[D]").astype(np.int64)
+    return int(max(steps.max() - 1, 0))
+
+
+# ================================================================
+# GROUPED OUTLIERS
+# ================================================================
+
+def grouped_daily_outliers(df: pd.DataFrame, group_columns: List[str], date_column: str = "DATE",
+                           multiplier: float = 1.5, min_count: int = 1) -> pd.DataFrame:
+    """
+    Daily spikes per group value, for several group columns at once.
+
+    The frame is melted to one ``(date, dimension, group)`` row per
+    complaint and counted with a single ``groupby``; the counts are then
+    laid out as a groups x calendar-days matrix (zero on days without
+    complaints) so Q1/Q3 and the upper fence ``Q3 + multiplier * IQR``
+    come from one ``quantile`` call over all groups, with no loop per group.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per flagged group-day with its count, the group's
+        quartiles and fence, and how far the count exceeds the fence.
+        Days below ``min_count`` are never flagged, so sparse groups with
+        a zero IQR do not flag every non-zero day.
+    """
+    columns = ["dimension", "group", "date", "count", "q1", "q3", "upper_fence", "excess"]
+    columns_present = [c for c in group_columns if c in df.columns]
+    dates = pd.to_datetime(df[date_column], errors="coerce").dt.normalize()
+    if not columns_present or dates.isna().all():
+        return pd.DataFrame(columns=columns)
+
+    long = (
+        df[columns_present]
+        .assign(date=dates)
+        .melt(id_vars="date", var_name="dimension", value_name="group")
+        .dropna()
+    )
+    long["group"] = long["group"].astype(str).str.strip()
+    long = long[long["group"] != ""]
+
+    counts = long.groupby(["dimension", "group", "date"], sort=False).size()
+    calendar = pd.date_range(dates.min(), dates.max(), freq="D")
+    matrix = counts.unstack("date", fill_value=0).reindex(columns=calendar, fill_value=0)
+
+    values = matrix.to_numpy(dtype=np.float64)
+    q1, q3 = np.percentile(values, [25, 75], axis=1, keepdims=True)
+    upper = q3 + multiplier * (q3 - q1)
+    flagged = (values > upper) & (values >= min_count)
+
+    rows, days = np.nonzero(flagged)
+    index = matrix.index[rows]
+    result = pd.DataFrame({
+        "dimension": index.get_level_values("dimension"),
+        "group": index.get_level_values("group"),
+        "date": calendar[days],
+        "count": values[rows, days].astype(np.int64),
+        "q1": q1[rows, 0],
+        "q3": q3[rows, 0],
+        "upper_fence": upper[rows, 0],
+    })
+    result["excess"] = result["count"] - result["upper_fence"]
+    return result.sort_values(["date", "excess"], ascending=[False, False], ignore_index=True)
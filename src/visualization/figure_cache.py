@@ -0,0 +1,213 @@
+import os
+import pickle
+import hashlib
+import inspect
+import weakref
+import threading
+import functools
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+
+from src.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# =====================================================================
+# FIGURE CACHE CONSTANTS
+# =====================================================================
+FIGURE_CACHE_MAX_ENTRIES = 128
+FIGURE_CACHE_MAX_BYTES   = 256 * 1024 * 1024
+
+_MISSING = object()
+
+
+# =====================================================================
+# LRU OF SERIALISED FIGURES
+# =====================================================================
+
+class FigureCache:
+    """
+    Process-wide, thread-safe LRU of serialised Plotly figures.
+
+    Entries are stored as Plotly JSON so every hit returns a fresh figure
+    that the caller may mutate. The cache is bounded both by entry count
+    and by the total size of the stored JSON.
+    """
+
+    def __init__(self,
+                 max_entries: int = FIGURE_CACHE_MAX_ENTRIES,
+                 max_bytes: int = FIGURE_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any:
+        """Return the stored payload, or ``_MISSING`` when absent."""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, key: str, payload: Optional[str]) -> None:
+        size = len(payload) if payload else 0
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                old = self._entries.pop(key)
+                self._bytes -= len(old) if old else 0
+
+            self._entries[key] = payload
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted) if evicted else 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+figure_cache = FigureCache()
+
+
+# =====================================================================
+# ARGUMENT FINGERPRINTS
+# =====================================================================
+
+# Content fingerprints of pandas objects, remembered per object so a frame
+# shared by several builders is hashed once. Frames passed to builders are
+# treated as read-only; shape and columns are re-checked on every lookup.
+_frame_fingerprints: Dict[int, tuple] = {}
+_frame_lock = threading.Lock()
+
+
+def _digest(*parts: bytes) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part)
+    return h.hexdigest()
+
+
+def dataset_version(path: str) -> str:
+    """Version of a dataset file: absolute path, mtime and size."""
+    stat = os.stat(path)
+    return f"file:{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def frame_fingerprint(obj) -> str:
+    """Content fingerprint of a DataFrame or Series."""
+    labels = obj.columns if isinstance(obj, pd.DataFrame) else [obj.name]
+    layout = (obj.shape, tuple(map(str, labels)))
+
+    with _frame_lock:
+        cached = _frame_fingerprints.get(id(obj))
+        if cached is not None:
+            ref, cached_layout, fingerprint = cached
+            if ref() is obj and cached_layout == layout:
+                return fingerprint
+
+    row_hashes = pd.util.hash_pandas_object(obj, index=True).to_numpy()
+    dtypes = obj.dtypes.astype(str).tolist() if isinstance(obj, pd.DataFrame) else [str(obj.dtype)]
+    fingerprint = "frame:" + _digest(
+        row_hashes.tobytes(),
+        repr(layout).encode(),
+        repr(dtypes).encode(),
+    )
+
+    key = id(obj)
+    ref = weakref.ref(obj, lambda _, key=key: _frame_fingerprints.pop(key, None))
+    with _frame_lock:
+        _frame_fingerprints[key] = (ref, layout, fingerprint)
+
+    return fingerprint
+
+
+def argument_fingerprint(value: Any) -> str:
+    """Stable fingerprint of a builder argument."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return frame_fingerprint(value)
+
+    if isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value)
+        return "array:" + _digest(array.tobytes(), str(array.dtype).encode(), str(array.shape).encode())
+
+    if isinstance(value, str) and os.path.isfile(value):
+        return dataset_version(value)
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return repr(value)
+
+    return "pickle:" + _digest(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+# =====================================================================
+# DECORATOR
+# =====================================================================
+
+def cached_figure(func: Callable = None, *, cache: FigureCache = None) -> Callable:
+    """
+    Memoise a figure builder on its dataset version and arguments.
+
+    Path arguments are keyed by file version (mtime and size), DataFrames by
+    content. Builders that return None (nothing to plot) are cached too.
+
+    Usage:
+        @cached_figure
+        def build(dataset_path: str, top_n: int = 10): ...
+    """
+    if func is None:
+        return functools.partial(cached_figure, cache=cache)
+
+    signature = inspect.signature(func)
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        store = cache or figure_cache
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = name + ":" + _digest(
+            repr([(arg, argument_fingerprint(value)) for arg, value in bound.arguments.items()]).encode()
+        )
+
+        payload = store.get(key)
+        if payload is not _MISSING:
+            logger.debug("Figure cache hit | builder=%s", name)
+            return None if payload is None else pio.from_json(payload)
+
+        fig = func(*args, **kwargs)
+        store.put(key, None if fig is None else fig.to_json())
+        return fig
+
+    wrapper.cache = cache or figure_cache
+    return wrapper
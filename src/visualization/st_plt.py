@@ -1,18 +1,138 @@
+import os
+from functools import lru_cache
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import plotly.express as px
 import plotly.graph_objects as go
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from src.utils.helper import lttb_downsample
+from src.visualization.figure_cache import cached_figure, dataset_version
 
 
-def create_complaints_visualization(data_path):
+# Series longer than this are drawn with WebGL (Scattergl) instead of SVG
+WEBGL_POINT_THRESHOLD = 1000
+
+# Default plot width in pixels; the daily trend keeps one point per pixel
+DEFAULT_CHART_WIDTH = 1200
+
+# Columns derived from DATE by prepare_complaints_frame
+DERIVED_DATE_COLUMNS = ['YEAR', 'MONTH', 'MONTH_NAME']
+
+
+def read_dataset(data_path) -> pd.DataFrame:
+    """
+    Read a CSV/Excel dataset. A DataFrame is passed through unchanged so
+    builders can share a frame that was loaded once.
+    """
+    if isinstance(data_path, pd.DataFrame):
+        return data_path
+
+    file_extension = os.path.splitext(data_path)[1].lower()
+
+    if file_extension == '.csv':
+        return pd.read_csv(data_path)
+    elif file_extension in ['.xlsx', '.xls']:
+        return pd.read_excel(data_path)
+    else:
+        raise ValueError(f"Unsupported file format: {file_extension}")
+
+
+def prepare_complaints_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Parse DATE and add YEAR, MONTH and MONTH_NAME. Frames that already carry
+    the derived columns are returned as-is, so the work happens once.
+    """
+    if all(col in df.columns for col in DERIVED_DATE_COLUMNS):
+        return df
+
+    df = df.copy()
+    df['DATE'] = pd.to_datetime(df['DATE'])
+    df['YEAR'] = df['DATE'].dt.year
+    df['MONTH'] = df['DATE'].dt.month
+    df['MONTH_NAME'] = df['DATE'].dt.month_name()
+    return df
+
+
+@lru_cache(maxsize=2)
+def _load_complaints_file(data_path: str, version: str) -> pd.DataFrame:
+    return prepare_complaints_frame(read_dataset(data_path))
+
+
+def load_complaints_frame(data_path) -> pd.DataFrame:
+    """
+    Load the complaints dataset once and preprocess its date columns.
+    The result can be passed to every figure builder in place of a path.
+
+    Files are kept per dataset version, so reruns against an unchanged file
+    reuse the parsed frame; treat the returned frame as read-only.
+    """
+    if isinstance(data_path, pd.DataFrame):
+        return prepare_complaints_frame(data_path)
+    return _load_complaints_file(data_path, dataset_version(data_path))
+
+
+def daily_trend_trace(dates, counts, max_points: int = DEFAULT_CHART_WIDTH,
+                      name: str = 'Daily Complaints'):
+    """
+    Build the daily complaints trace, downsampled to ``max_points`` with LTTB.
+
+    Series longer than ``WEBGL_POINT_THRESHOLD`` switch to ``go.Scattergl``
+    so the browser renders them on the GPU.
+    """
+    dates = pd.to_datetime(pd.Series(dates)).to_numpy()
+    counts = pd.Series(counts).to_numpy()
+
+    total_points = len(dates)
+    keep = lttb_downsample(dates, counts, max_points)
+    dates, counts = dates[keep], counts[keep]
+
+    trace_cls = go.Scattergl if total_points > WEBGL_POINT_THRESHOLD else go.Scatter
+
+    return trace_cls(
+        x=dates,
+        y=counts,
+        mode='lines+markers' if len(dates) <= WEBGL_POINT_THRESHOLD else 'lines',
+        name=name,
+        line=dict(color='green', width=2),
+        marker=dict(size=4),
+        hovertemplate='<b>Date:</b> %{x|%Y-%m-%d}<br><b>Complaints:</b> %{y}<extra></extra>'
+    )
+
+
+@cached_figure
+def create_daily_trend_chart(dates, counts, title: str = "Daily Complaints Trend",
+                             width: int = DEFAULT_CHART_WIDTH, height: int = 450):
+    """
+    Standalone daily complaints trend chart sized to ``width`` pixels.
+
+    Used for the zoomed view, where ``dates``/``counts`` come from the
+    ``/daily_complaint_counts`` range-query endpoint.
+    """
+    fig = go.Figure(daily_trend_trace(dates, counts, max_points=width))
+    fig.update_layout(
+        title_text=title,
+        xaxis_title="Date",
+        yaxis_title="Number of Complaints",
+        height=height,
+        hovermode='closest',
+        template="plotly_white"
+    )
+    return fig
+
+
+@cached_figure
+def create_complaints_visualization(data_path, width: int = DEFAULT_CHART_WIDTH):
     """
     Create interactive complaints visualization using Plotly.
     
     Parameters:
     -----------
-    data_path : str
-        Path to the CSV file containing complaints data
+    data_path : str or pd.DataFrame
+        Path to the CSV file containing complaints data, or a frame from
+        load_complaints_frame
+    width : int
+        Chart width in pixels; the daily trend is downsampled to this many points
         
     Returns:
     --------
@@ -20,12 +140,8 @@ def create_complaints_visualization(data_path):
         Interactive Plotly figure with 3 subplots
     """
     
-    # Load data
-    df = pd.read_excel(data_path)
-    
-    # Prepare data
-    df['DATE'] = pd.to_datetime(df['DATE'])
-    df['YEAR'] = df['DATE'].dt.year
+    # Load and prepare data
+    df = load_complaints_frame(data_path)
     
     # Calculate summaries
     dept_summary = df.groupby('DEPT').size().reset_index(name='TOTAL_COMPLAINTS')
@@ -64,14 +180,10 @@ def create_complaints_visualization(data_path):
     
     # 2. Daily Complaints Trend (Line Chart)
     fig.add_trace(
-        go.Scatter(
-            x=daily_counts['DATE'],
-            y=daily_counts['TOTAL_COMPLAINTS'],
-            mode='lines+markers',
-            name='Daily Complaints',
-            line=dict(color='green', width=2),
-            marker=dict(size=4),
-            hovertemplate='<b>Date:</b> %{x|%Y-%m-%d}<br><b>Complaints:</b> %{y}<extra></extra>'
+        daily_trend_trace(
+            daily_counts['DATE'],
+            daily_counts['TOTAL_COMPLAINTS'],
+            max_points=width
         ),
         row=2, col=1
     )
@@ -121,37 +233,23 @@ def create_complaints_visualization(data_path):
 # fig.write_html('complaints_dashboard.html')  # Save as HTML
 
 
+@cached_figure
 def process_complaints_data(data_path):
     """
     Process complaints data and generate interactive pie chart visualizations.
     
     Parameters:
     -----------
-    data_path : str
-        Path to the CSV or Excel file containing complaints data
+    data_path : str or pd.DataFrame
+        Path to the CSV or Excel file containing complaints data, or a frame
+        from load_complaints_frame
         
     Returns:
     --------
     fig : plotly figure object with interactive pie charts
     """
-    import pandas as pd
-    import plotly.graph_objects as go
-    from plotly.subplots import make_subplots
-    import os
-    
-    # Load data based on file extension
-    file_extension = os.path.splitext(data_path)[1].lower()
-    
-    if file_extension == '.csv':
-        df = pd.read_csv(data_path)
-    elif file_extension in ['.xlsx', '.xls']:
-        df = pd.read_excel(data_path)
-    else:
-        raise ValueError(f"Unsupported file format: {file_extension}")
-    
-    # Prepare Data
-    df['DATE'] = pd.to_datetime(df['DATE'])
-    df['YEAR'] = df['DATE'].dt.year
+    # Load and prepare data
+    df = load_complaints_frame(data_path)
     
     # Generate Summaries
     dept_summary = df.groupby('DEPT').size().reset_index(name='TOTAL_COMPLAINTS')
@@ -212,6 +310,7 @@ from plotly.graph_objs import Figure
 
 # src/visualization/dashboard.py
 
+@cached_figure
 def create_missing_values_chart(    
     dataset_path: str,
     title: str = "Missing Values per Column",
@@ -224,8 +323,8 @@ def create_missing_values_chart(
 
     Parameters
     ----------
-    dataset_path : str
-        Path to the dataset file (Excel).
+    dataset_path : str or pd.DataFrame
+        Path to the dataset file (Excel), or a preloaded frame.
     title : str, optional
         Chart title.
     height : int, optional
@@ -239,8 +338,9 @@ def create_missing_values_chart(
         Interactive Plotly figure if missing values exist, otherwise None.
     """
 
-    # Read dataset
-    df = pd.read_excel(dataset_path)
+    # Read dataset (columns derived from DATE are not part of the source)
+    df = read_dataset(dataset_path)
+    df = df.drop(columns=DERIVED_DATE_COLUMNS, errors='ignore')
 
     # Calculate missing values per column
     null_data = df.isnull().sum().reset_index()
@@ -292,16 +392,14 @@ def create_missing_values_chart(
 import pandas as pd
 import plotly.express as px
 
+@cached_figure
 def complaints_status_stacked_bar(dataset_path: str):
     """
     Reads complaint data from Excel and returns a Plotly stacked bar chart.
     Shows Closed vs Open complaints per month, faceted by year.
     """
     # Load and preprocess
-    df = pd.read_excel(dataset_path)
-    df['DATE'] = pd.to_datetime(df['DATE'])
-    df['YEAR'] = df['DATE'].dt.year
-    df['MONTH_NAME'] = df['DATE'].dt.strftime('%B')
+    df = load_complaints_frame(dataset_path)
 
     # Group by YEAR, MONTH_NAME, CLOSED/OPEN
     summary = (
@@ -336,16 +434,14 @@ def complaints_status_stacked_bar(dataset_path: str):
 import pandas as pd
 import plotly.express as px
 
+@cached_figure
 def complaints_trend_line(dataset_path: str):
     """
     Reads complaint data from Excel and returns a Plotly line chart.
     Shows monthly complaint counts with year-wise color differentiation.
     """
     # Load and preprocess
-    df = pd.read_excel(dataset_path)
-    df['DATE'] = pd.to_datetime(df['DATE'])
-    df['YEAR'] = df['DATE'].dt.year
-    df['MONTH'] = df['DATE'].dt.month
+    df = load_complaints_frame(dataset_path)
 
     # Group by YEAR, MONTH
     summary = (
@@ -379,13 +475,14 @@ def complaints_trend_line(dataset_path: str):
 import pandas as pd
 import plotly.express as px
 
+@cached_figure
 def unique_value_bar_chart(dataset_path: str):
     """
     Reads complaint dataset and returns an interactive Plotly bar chart
     showing the number of unique values per selected column.
     """
     # Load dataset
-    df = pd.read_excel(dataset_path)
+    df = read_dataset(dataset_path)
 
     # Columns to analyze
     cols = [
@@ -440,25 +537,21 @@ import plotly.express as px
 import pandas as pd
 import plotly.express as px
 
+@cached_figure
 def plot_complaint_pie_chart(data_path, column_name='COMPLAINT TYPE',
                              title="Complaint Distribution", width=1400, height=1100):
     """
     Reads complaint data from a file and returns an interactive donut-style pie chart.
 
     Parameters:
-        data_path (str): Path to the CSV/Excel file containing complaint data
+        data_path (str or pd.DataFrame): Path to the CSV/Excel file containing complaint data
         column_name (str): Column name to analyze (default: 'COMPLAINT TYPE')
         title (str): Chart title
         width (int): Chart width in pixels
         height (int): Chart height in pixels
     """
-    # Load data (auto-detect CSV or Excel)
-    if data_path.endswith(".csv"):
-        df = pd.read_csv(data_path)
-    elif data_path.endswith((".xls", ".xlsx")):
-        df = pd.read_excel(data_path)
-    else:
-        raise ValueError("Unsupported file format. Use .csv, .xls, or .xlsx")
+    # Load data (auto-detect CSV or Excel, or reuse a loaded frame)
+    df = read_dataset(data_path)
 
     # Get complaint counts
     complaint_counts = df[column_name].value_counts()
@@ -514,6 +607,7 @@ def plot_complaint_pie_chart(data_path, column_name='COMPLAINT TYPE',
 
 import plotly.express as px
 
+@cached_figure
 def visualize_reporter_distribution(
     report_df: pd.DataFrame,
     category: str,
@@ -559,6 +653,7 @@ def visualize_reporter_distribution(
 
 import plotly.express as px
 
+@cached_figure
 def visualize_report(
     report_df: pd.DataFrame,
     category: str,
@@ -613,8 +708,44 @@ def visualize_report(
 
 
 
+# =====================================================================
+# FIGURE ORCHESTRATOR
+# =====================================================================
 
+# Builders shown on the Visualizations tab, keyed by placeholder name
+VISUALIZATION_BUILDERS = {
+    "complaints_pies": process_complaints_data,
+    "complaints_dashboard": create_complaints_visualization,
+    "missing_values": create_missing_values_chart,
+    "trend_line": complaints_trend_line,
+    "status_stacked_bar": complaints_status_stacked_bar,
+    "unique_values": unique_value_bar_chart,
+}
 
 
+def iter_visualization_figures(data_path, builders: dict = None, max_workers: int = 4):
+    """
+    Load and preprocess the dataset once, then build the independent figures
+    concurrently and yield them as they complete.
 
+    Builders only read the shared frame, so a thread pool is enough; the
+    pandas group-bys release the GIL and nothing needs pickling.
 
+    Yields
+    ------
+    tuple
+        ``(name, figure, error)`` where exactly one of figure/error is set
+        (figure may also be None when a builder has nothing to plot).
+    """
+    df = load_complaints_frame(data_path)
+    builders = builders or VISUALIZATION_BUILDERS
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(builder, df): name for name, builder in builders.items()}
+
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                yield name, future.result(), None
+            except Exception as e:
+                yield name, None, e
@@ -0,0 +1,167 @@
+import os
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.cloud.aws_storage import S3Storage
+from src.entities.component_config_entity import CloudStorageConfig
+from src.utils.helper import file_sha256
+
+BUCKET = "test-artifacts"
+MB = 2 ** 20
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    for name, value in (("AWS_ACCESS_KEY_ID", "testing"), ("AWS_SECRET_ACCESS_KEY", "testing"),
+                        ("AWS_DEFAULT_REGION", "us-east-1")):
+        monkeypatch.setenv(name, value)
+
+    with mock_aws():
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=BUCKET)
+        config = CloudStorageConfig(
+            bucket=BUCKET,
+            endpoint_url=None,
+            region_name="us-east-1",
+            cache_dir=str(tmp_path / "cache"),
+            multipart_threshold=5 * MB,
+            chunk_size=5 * MB,
+        )
+        yield S3Storage(config)
+
+
+@pytest.fixture
+def registry(tmp_path):
+    root = tmp_path / "registry"
+    (root / "versions" / "v1").mkdir(parents=True)
+    (root / "registry.json").write_text('{"active": "v1"}')
+    (root / "versions" / "v1" / "manifest.json").write_text("{}")
+    (root / "versions" / "v1" / "model.keras").write_bytes(os.urandom(12 * MB))
+    return root
+
+
+def cache_files(storage):
+    return [name for _, _, files in os.walk(storage.config.cache_dir) for name in files]
+
+
+# =====================================================================
+# UPLOADS
+# =====================================================================
+
+def test_upload_records_checksum_and_uses_multipart(storage, registry):
+    path = str(registry / "versions" / "v1" / "model.keras")
+
+    result = storage.upload(path, "models/model.keras")
+
+    assert result["transferred"]
+    head = storage.client.head_object(Bucket=BUCKET, Key=storage.key("models/model.keras"))
+    assert head["Metadata"][storage.config.checksum_key] == file_sha256(path)
+    assert head["ETag"].strip('"').endswith("-3")  # three 5 MB parts
+
+
+def test_unchanged_upload_is_skipped(storage, registry):
+    assert storage.upload_dir(str(registry), "registry")["transferred"] == 3
+
+    summary = storage.upload_dir(str(registry), "registry")
+    assert summary["transferred"] == 0
+    assert summary["skipped"] == 3
+
+    (registry / "registry.json").write_text('{"active": "v2"}')
+    assert storage.upload_dir(str(registry), "registry")["transferred"] == 1
+
+
+# =====================================================================
+# DOWNLOADS / CACHE
+# =====================================================================
+
+def test_round_trip(storage, registry, tmp_path):
+    storage.upload_dir(str(registry), "registry")
+
+    summary = storage.download_dir("registry", str(tmp_path / "restored"))
+
+    assert summary["transferred"] == 3
+    for name in ("registry.json", "versions/v1/manifest.json", "versions/v1/model.keras"):
+        assert file_sha256(str(tmp_path / "restored" / name)) == file_sha256(str(registry / name))
+
+
+def test_index_is_downloaded_last(storage, registry, tmp_path, monkeypatch):
+    storage.upload_dir(str(registry), "registry")
+    order = []
+    download = storage.download
+    monkeypatch.setattr(storage, "download", lambda name, path: order.append(name) or download(name, path))
+
+    storage.download_dir("registry", str(tmp_path / "restored"), last=("registry.json",))
+
+    assert order[-1] == "registry/registry.json"
+    assert len(order) == 3
+
+
+def test_hidden_files_are_not_uploaded(storage, registry):
+    (registry / ".registry.json.lock").write_bytes(b"")
+    (registry / "versions" / ".staging-1").mkdir()
+    (registry / "versions" / ".staging-1" / "model.keras").write_bytes(b"partial")
+
+    assert storage.upload_dir(str(registry), "registry")["files"] == 3
+
+
+def test_existing_identical_file_is_not_downloaded(storage, registry, tmp_path):
+    storage.upload_dir(str(registry), "registry")
+    storage.download_dir("registry", str(tmp_path / "restored"))
+
+    summary = storage.download_dir("registry", str(tmp_path / "restored"))
+    assert summary["transferred"] == 0
+    assert summary["skipped"] == 3
+
+
+def test_warm_restart_is_served_from_cache(storage, registry, tmp_path, monkeypatch):
+    storage.upload_dir(str(registry), "registry")
+    storage.download_dir("registry", str(tmp_path / "first"))
+
+    def no_download(*args, **kwargs):
+        raise AssertionError("object downloaded despite a cache hit")
+
+    # Fresh process state: new storage object, same cache directory
+    restarted = S3Storage(storage.config)
+    monkeypatch.setattr(restarted.client, "download_file", no_download)
+    summary = restarted.download_dir("registry", str(tmp_path / "second"))
+
+    assert summary["cached"] == 3
+    assert summary["transferred"] == 0
+    assert (tmp_path / "second" / "registry.json").read_text() == '{"active": "v1"}'
+
+
+def test_fetch_is_content_addressed(storage, registry):
+    path = str(registry / "registry.json")
+    storage.upload(path, "a/registry.json")
+    storage.upload(path, "b/registry.json")
+
+    first, second = storage.fetch("a/registry.json"), storage.fetch("b/registry.json")
+
+    assert first == second
+    assert os.path.basename(first) == file_sha256(path)
+    assert len(cache_files(storage)) == 1
+
+
+def test_cache_is_pruned_to_its_limit(storage, registry, tmp_path):
+    storage.upload_dir(str(registry), "registry")
+    storage.config.cache_max_bytes = 1
+
+    storage.download("registry/versions/v1/model.keras", str(tmp_path / "model.keras"))
+    storage.download("registry/registry.json", str(tmp_path / "registry.json"))
+
+    # Only the file just fetched survives
+    assert cache_files(storage) == [file_sha256(str(registry / "registry.json"))]
+
+
+def test_checksum_mismatch_is_rejected(storage):
+    storage.client.put_object(Bucket=BUCKET, Key=storage.key("bad.bin"), Body=b"abc",
+                              Metadata={storage.config.checksum_key: "0" * 64})
+
+    with pytest.raises(Exception, match="Checksum mismatch"):
+        storage.fetch("bad.bin")
+    assert cache_files(storage) == []
+
+
+def test_missing_object_has_no_checksum(storage):
+    assert storage.checksum("missing.bin") is None
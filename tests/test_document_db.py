@@ -0,0 +1,161 @@
+import inspect
+import os
+
+import mongomock
+import mongomock.collection
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from pymongo import MongoClient
+
+from src.database.document_db import DocumentDB
+from src.entities.artifact_entity import DataIngestionArtifact
+from src.entities.component_config_entity import DocumentDBConfig
+
+
+def _accept_default_sort(method):
+    # pymongo >= 4.11 passes ``sort=None`` for every bulk replace/update;
+    # mongomock 4.3 (the latest release) predates the keyword
+    def wrapper(self, *args, sort=None, **kwargs):
+        if sort is not None:
+            raise NotImplementedError("mongomock does not support sorted bulk writes")
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """A real server when ``MONGODB_TEST_URL`` is set, otherwise mongomock."""
+    url = os.getenv("MONGODB_TEST_URL")
+    if url:
+        client = MongoClient(url, serverSelectionTimeoutMS=5_000)
+        yield client
+        client.close()
+        return
+
+    for name in ("add_replace", "add_update"):
+        method = getattr(mongomock.collection.BulkOperationBuilder, name)
+        if "sort" not in inspect.signature(method).parameters:
+            monkeypatch.setattr(mongomock.collection.BulkOperationBuilder, name, _accept_default_sort(method))
+    yield mongomock.MongoClient()
+
+
+@pytest.fixture
+def db(client, tmp_path):
+    config = DocumentDBConfig(database_name="test_complaints", database_dir=str(tmp_path), batch_size=3)
+    db = DocumentDB(config, client=client)
+    db.collection.drop()
+    yield db
+    db.collection.drop()
+
+
+def complaints(numbers, dates=None):
+    n = len(numbers)
+    dates = dates or [f"2024-01-{i % 28 + 1:02d}" for i in range(n)]
+    return pa.table({
+        "DATE": pd.to_datetime(dates),
+        "COMPLAINT NUMBER": numbers,
+        "COMPLAINT TYPE": ["Billing" if i % 2 else "Meter" for i in range(n)],
+        "CIRCLE": ["C1"] * n,
+        "DIVISION": ["D1"] * n,
+        "DEPT": ["O&M"] * n,
+        "CLOSED/OPEN": ["Open" if i % 3 == 0 else "Closed" for i in range(n)],
+        "COMPLAINANT NAME": [f"name {i}" for i in range(n)],
+    })
+
+
+# =====================================================================
+# WRITES
+# =====================================================================
+
+def test_bulk_upsert_is_idempotent(db):
+    table = complaints([str(i) for i in range(10)])
+
+    first = db.write_batches(table.to_batches())
+    assert first["documents"] == 10
+    assert first["upserted"] == 10
+    assert first["errors"] == 0
+    assert first["requests"] == 4  # batches of 3 operations
+
+    replay = db.write_batches(table.to_batches())
+    assert replay["upserted"] == 0
+    assert replay["matched"] == 10
+    assert db.collection.count_documents({}) == 10
+
+
+def test_repeated_keys_keep_the_last_row(db):
+    db.write_batches(complaints(["1", "2", "2"], ["2024-01-01", "2024-01-02", "2024-01-03"]).to_batches())
+
+    assert db.collection.count_documents({}) == 2
+    assert db.collection.find_one({"complaint_number": "2"})["date"] == pd.Timestamp("2024-01-03")
+
+
+def test_blank_keys_are_not_merged(db):
+    db.write_batches(complaints(["1", "", " ", None, "1"]).to_batches())
+
+    assert db.collection.count_documents({}) == 4
+    assert db.collection.count_documents({"complaint_number": {"$exists": False}}) == 3
+    assert db.collection.count_documents({"complaint_number": ""}) == 0
+
+
+def test_replay_does_not_duplicate_keyless_rows(db):
+    batches = complaints(["1", "", None, None], dates=["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-03"])
+    db.write_batches(batches.to_batches())
+    stats = db.write_batches(batches.to_batches(max_chunksize=1))
+
+    # The two identical keyless rows are kept apart, and nothing is added on replay
+    assert db.collection.count_documents({}) == 4
+    assert db.collection.count_documents({"complaint_number": {"$exists": False}}) == 3
+    assert stats["upserted"] == 0
+
+
+def test_indexes_match_the_dashboard_filters(db):
+    db.ensure_indexes()
+    indexes = db.collection.index_information()
+
+    assert indexes["complaint_number_1"]["unique"]
+    for name in ("closed_open_1_date_-1", "complaint_type_1_date_-1",
+                 "circle_1_division_1_date_-1", "dept_1_closed_open_1_date_-1"):
+        assert name in indexes
+
+
+def test_document_sync_writes_report(db, tmp_path):
+    processed = tmp_path / "processed_data.csv"
+    pq.write_table(complaints([str(i) for i in range(5)]), str(tmp_path / "processed_data.parquet"))
+    artifact = DataIngestionArtifact(
+        raw_file_path="", processed_file_path=str(processed), train_file_path="", test_file_path="",
+        metadata_file_path="", schema_file_path="", source_sha256="abc",
+    )
+
+    result = db.initiate_document_sync(artifact)
+
+    assert result.documents == 5
+    assert result.upserted == 5
+    assert os.path.exists(result.report_file_path)
+
+
+# =====================================================================
+# READS
+# =====================================================================
+
+def test_find_projects_and_filters(db):
+    db.write_batches(complaints([str(i) for i in range(12)]).to_batches())
+
+    df = db.find({"CLOSED/OPEN": "Open"}, fields=["DATE", "COMPLAINT NUMBER"], limit=10)
+    assert list(df.columns) == ["DATE", "COMPLAINT NUMBER"]
+    assert set(df["COMPLAINT NUMBER"]) == {"0", "3", "6", "9"}
+    assert df["DATE"].is_monotonic_decreasing
+
+    df = db.find({"COMPLAINT TYPE": ["Billing"]}, start="2024-01-02", end="2024-01-04")
+    assert list(df.columns) == list(db.config.default_fields)
+    assert set(df["COMPLAINT NUMBER"]) == {"1", "3"}
+    assert "COMPLAINANT NAME" not in df.columns
+
+
+def test_count_uses_the_same_filters(db):
+    db.write_batches(complaints([str(i) for i in range(12)]).to_batches())
+
+    assert db.count() == 12
+    assert db.count({"CLOSED/OPEN": "Open"}) == 4
+    assert db.count(start="2024-01-05", end="2024-01-06") == 2
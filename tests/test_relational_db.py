@@ -0,0 +1,90 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.database.relational_db import RelationalDB
+from src.entities.component_config_entity import RelationalDBConfig
+
+
+def store(tmp_path, deduplicate=False):
+    return RelationalDB(RelationalDBConfig(database_dir=str(tmp_path), deduplicate=deduplicate, chunksize=2))
+
+
+def complaints(numbers, status=None):
+    n = len(numbers)
+    return pa.table({
+        "DATE": pd.to_datetime([f"2024-01-{i % 28 + 1:02d}" for i in range(n)]),
+        "COMPLAINT NUMBER": numbers,
+        "COMPLAINT TYPE": ["Billing" if i % 2 else "Meter" for i in range(n)],
+        "CLOSED/OPEN": status or ["Open"] * n,
+    })
+
+
+def stored(db):
+    return [list(row) for row in db.query("SELECT complaint_number, closed_open FROM complaints ORDER BY id")]
+
+
+# =====================================================================
+# REPLACE
+# =====================================================================
+
+def test_replace_keeps_every_row_without_deduplication(tmp_path):
+    db = store(tmp_path)
+
+    stats = db.bulk_load(complaints(["1", "1", "", " ", None, "2"]).to_batches(max_chunksize=2))
+
+    assert stats["table_rows"] == db.row_count() == 6
+    assert stats["duplicates_dropped"] == 0
+
+
+def test_deduplication_keeps_last_row_and_blank_keys_apart(tmp_path):
+    db = store(tmp_path, deduplicate=True)
+
+    db.bulk_load(complaints(["1", "", "1", " ", None], status=["Open", "Open", "Closed", "Open", "Open"])
+                 .to_batches(max_chunksize=2))
+
+    assert stored(db) == [[None, "Open"], ["1", "Closed"], [None, "Open"], [None, "Open"]]
+
+
+def test_indexes_exist_after_staging_swap(tmp_path):
+    db = store(tmp_path, deduplicate=True)
+    db.bulk_load(complaints(["1", "2"]).to_batches())
+
+    indexes = {name: sql for name, sql in db.query("SELECT name, sql FROM sqlite_master WHERE type = 'index'")}
+    tables = [name for (name,) in db.query("SELECT name FROM sqlite_master WHERE type = 'table'")]
+
+    assert "WHERE" in indexes["uq_complaints_complaint_number"]
+    assert {"idx_complaints_date", "idx_complaints_complaint_type", "idx_complaints_closed_open"} <= set(indexes)
+    assert "complaints__staging" not in tables
+
+
+# =====================================================================
+# UPSERT
+# =====================================================================
+
+def test_upsert_replay_leaves_table_unchanged(tmp_path):
+    db = store(tmp_path, deduplicate=True)
+    rows = complaints(["1", "2", "3"])
+    db.bulk_load(rows.to_batches(), mode="replace")
+
+    stats = db.bulk_load(rows.to_batches(), mode="upsert")
+
+    assert stats["mode"] == "upsert"
+    assert stats["table_rows"] == 3
+    assert stats["inserted"] == 0 and stats["updated"] == 3
+
+
+def test_upsert_updates_and_inserts_by_key(tmp_path):
+    db = store(tmp_path, deduplicate=True)
+    db.bulk_load(complaints(["1", "2"]).to_batches(), mode="replace")
+
+    db.bulk_load(complaints(["2", "3"], status=["Closed", "Open"]).to_batches(), mode="upsert")
+
+    assert sorted(stored(db)) == [["1", "Open"], ["2", "Closed"], ["3", "Open"]]
+
+
+def test_upsert_needs_deduplication(tmp_path):
+    db = store(tmp_path)
+
+    with pytest.raises(ValueError, match="deduplicate"):
+        db.bulk_load(complaints(["1"]).to_batches(), mode="upsert")